@@ -458,6 +458,164 @@ const initNotifications = () => {
     }
 };
 
+// ==========================================================================
+// NOTIFICATION FEED POLLING
+// ==========================================================================
+
+const initNotificationFeed = () => {
+    const feedUrl = document.body.dataset.notificationFeed;
+    if (!feedUrl) return;
+
+    const POLL_INTERVAL = 30000;
+    const storageKey = 'notificationFeedVersion';
+    let version = 0;
+    let firstPoll = true;
+
+    const updateBadges = (counts) => {
+        $$('[data-badge]').forEach(badge => {
+            const count = counts[badge.dataset.badge] || 0;
+            badge.textContent = count > 99 ? '99+' : count;
+            badge.hidden = count === 0;
+        });
+    };
+
+    const poll = () => {
+        if (document.hidden) return;
+
+        // The first request always fetches counts; later ones only ask for changes
+        fetch(`${feedUrl}?since=${version}`, { credentials: 'same-origin' })
+            .then(response => (response.status === 200 ? response.json() : null))
+            .then(data => {
+                if (!data) return;
+
+                const lastSeen = parseInt(localStorage.getItem(storageKey) || '0', 10);
+                updateBadges(data.counts);
+                data.items
+                    .filter(item => !firstPoll || item.id > lastSeen)
+                    .slice(0, 3)
+                    .forEach(item => showToast(item.title, 'info', 5000));
+
+                version = data.version;
+                localStorage.setItem(storageKey, version);
+            })
+            .catch(() => {})
+            .finally(() => { firstPoll = false; });
+    };
+
+    poll();
+    setInterval(poll, POLL_INTERVAL);
+    document.addEventListener('visibilitychange', () => {
+        if (!document.hidden) poll();
+    });
+};
+
+// ==========================================================================
+// AUTOCOMPLETE SELECTS
+// ==========================================================================
+
+const initAutocomplete = () => {
+    $$('select[data-autocomplete-url]').forEach(select => {
+        const url = select.dataset.autocompleteUrl;
+        const wrapper = document.createElement('div');
+        const input = document.createElement('input');
+        const results = document.createElement('ul');
+        const required = select.required;
+        let activeIndex = -1;
+
+        wrapper.className = 'autocomplete';
+        input.type = 'text';
+        input.className = 'form-input';
+        input.autocomplete = 'off';
+        input.placeholder = 'Type to search...';
+        results.className = 'autocomplete-results';
+        results.hidden = true;
+
+        const selectedOption = select.options[select.selectedIndex];
+        input.value = selectedOption && selectedOption.value ? selectedOption.text : '';
+
+        // Validation moves to the visible input; a hidden required select can't be focused
+        input.required = required;
+        select.required = false;
+        select.hidden = true;
+        select.parentNode.insertBefore(wrapper, select);
+        wrapper.append(input, results, select);
+
+        const choose = (id, text) => {
+            let option = Array.from(select.options).find(opt => opt.value === String(id));
+            if (!option) {
+                option = new Option(text, id);
+                select.add(option);
+            }
+            select.value = String(id);
+            select.dispatchEvent(new Event('change', { bubbles: true }));
+            input.value = id ? text : '';
+            results.hidden = true;
+        };
+
+        const highlight = (index) => {
+            const items = results.querySelectorAll('.autocomplete-option');
+            items.forEach((item, i) => item.classList.toggle('active', i === index));
+            activeIndex = index;
+        };
+
+        const render = (items) => {
+            results.innerHTML = '';
+            activeIndex = -1;
+            if (!required) {
+                items = [{ id: '', text: '---------' }, ...items];
+            }
+            if (!items.length) {
+                const empty = document.createElement('li');
+                empty.className = 'autocomplete-empty';
+                empty.textContent = 'No matches';
+                results.append(empty);
+            }
+            items.forEach(item => {
+                const li = document.createElement('li');
+                li.className = 'autocomplete-option';
+                li.textContent = item.text;
+                li.addEventListener('mousedown', (e) => {
+                    e.preventDefault();
+                    choose(item.id, item.text);
+                });
+                results.append(li);
+            });
+            results.hidden = false;
+        };
+
+        const search = debounce(() => {
+            fetch(`${url}?q=${encodeURIComponent(input.value.trim())}`, { credentials: 'same-origin' })
+                .then(response => response.json())
+                .then(data => render(data.results))
+                .catch(() => {});
+        }, 200);
+
+        input.addEventListener('input', search);
+        input.addEventListener('focus', search);
+        input.addEventListener('blur', () => {
+            results.hidden = true;
+            // Restore the label of the current value if the text was left half-typed
+            const current = select.options[select.selectedIndex];
+            input.value = current && current.value ? current.text : '';
+        });
+        input.addEventListener('keydown', (e) => {
+            const items = results.querySelectorAll('.autocomplete-option');
+            if (e.key === 'ArrowDown' && items.length) {
+                e.preventDefault();
+                highlight(Math.min(activeIndex + 1, items.length - 1));
+            } else if (e.key === 'ArrowUp' && items.length) {
+                e.preventDefault();
+                highlight(Math.max(activeIndex - 1, 0));
+            } else if (e.key === 'Enter' && activeIndex >= 0) {
+                e.preventDefault();
+                items[activeIndex].dispatchEvent(new Event('mousedown'));
+            } else if (e.key === 'Escape') {
+                results.hidden = true;
+            }
+        });
+    });
+};
+
 // ==========================================================================
 // TOAST NOTIFICATIONS
 // ==========================================================================
@@ -669,6 +827,8 @@ document.addEventListener('DOMContentLoaded', () => {
     initForms();
     initFileUpload();
     initNotifications();
+    initNotificationFeed();
+    initAutocomplete();
     initDeleteActions();
     initCharts();
     initDatePickers();
@@ -1,9 +1,8 @@
 from django.db import models
-from django.utils.text import slugify
-from apps.core.models import TimeStampedModel
+from apps.core.models import TimeStampedModel, UniqueSlugModel
 
 
-class Accreditation(TimeStampedModel):
+class Accreditation(UniqueSlugModel, TimeStampedModel):
     """Certifications, affiliations, and accreditations of the academy."""
 
     class AccreditationType(models.TextChoices):
@@ -45,6 +44,8 @@ class Accreditation(TimeStampedModel):
     show_on_homepage = models.BooleanField(default=False)
     display_order = models.PositiveIntegerField(default=0)
 
+    slug_from = ('name',)
+
     class Meta:
         ordering = ['display_order', '-created_at']
         verbose_name = "Accreditation"
@@ -52,13 +53,3 @@ class Accreditation(TimeStampedModel):
 
     def __str__(self):
         return f"{self.name} - {self.issuing_body}"
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.name)
-            self.slug = base_slug
-            counter = 1
-            while Accreditation.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{base_slug}-{counter}"
-                counter += 1
-        super().save(*args, **kwargs)
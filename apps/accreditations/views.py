@@ -1,4 +1,6 @@
 from django.views.generic import ListView
+
+from apps.core import catalog
 from .models import Accreditation
 
 
@@ -10,4 +12,4 @@ class AccreditationListView(ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        return Accreditation.objects.filter(is_active=True).order_by('display_order')
+        return catalog.filter(Accreditation, is_active=True)
@@ -0,0 +1,24 @@
+"""
+Full-text search over achievements for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('achievements', '0001_initial'),
+    ]
+
+    operations = [
+        create_search_index('achievements_achievement', {
+            'title': 'A',
+            'description': 'C',
+        }, 'achievements_ach'),
+    ]
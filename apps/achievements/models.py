@@ -1,9 +1,8 @@
 from django.db import models
-from django.utils.text import slugify
-from apps.core.models import TimeStampedModel
+from apps.core.models import TimeStampedModel, UniqueSlugModel
 
 
-class Achievement(TimeStampedModel):
+class Achievement(UniqueSlugModel, TimeStampedModel):
     """Trophies, awards, and achievements of the academy."""
 
     class Category(models.TextChoices):
@@ -31,6 +30,10 @@ class Achievement(TimeStampedModel):
     show_on_homepage = models.BooleanField(default=False)
     display_order = models.PositiveIntegerField(default=0)
 
+    slug_from = ('title', 'year')
+
+    search_fields = {'title': 'A', 'description': 'C'}
+
     class Meta:
         ordering = ['display_order', '-year', '-created_at']
         verbose_name = "Achievement"
@@ -38,13 +41,3 @@ class Achievement(TimeStampedModel):
 
     def __str__(self):
         return f"{self.title} ({self.year})"
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(f"{self.title}-{self.year}")
-            self.slug = base_slug
-            counter = 1
-            while Achievement.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{base_slug}-{counter}"
-                counter += 1
-        super().save(*args, **kwargs)
@@ -1,4 +1,6 @@
 from django.views.generic import ListView
+
+from apps.core import catalog
 from .models import Achievement
 
 
@@ -10,4 +12,4 @@ class AchievementListView(ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        return Achievement.objects.filter(is_active=True).order_by('display_order', '-year')
+        return catalog.filter(Achievement, is_active=True)
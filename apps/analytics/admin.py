@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import DailyCount
+
+
+@admin.register(DailyCount)
+class DailyCountAdmin(admin.ModelAdmin):
+    list_display = ['date', 'metric', 'dimension_id', 'count']
+    list_filter = ['metric']
+    date_hierarchy = 'date'
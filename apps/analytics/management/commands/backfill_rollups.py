@@ -0,0 +1,42 @@
+"""
+Management command to rebuild the analytics rollup counters.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.analytics import rollups
+from apps.analytics.models import DailyCount
+
+
+class Command(BaseCommand):
+    help = 'Rebuild daily inquiry, message and registration counters from the source tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--metric',
+            choices=DailyCount.Metric.values,
+            help='Only rebuild this metric (default: all)',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Only rebuild the last N days (default: everything not archived)',
+        )
+
+    def handle(self, *args, **options):
+        metrics = [options['metric']] if options['metric'] else DailyCount.Metric.values
+        since = None
+        if options['days']:
+            since = timezone.localdate() - timedelta(days=options['days'])
+
+        for metric in metrics:
+            first_day = rollups.rebuildable_since(metric)
+            if first_day and (since is None or since < first_day):
+                self.stdout.write(
+                    f'{metric}: rows up to {first_day - timedelta(days=1)} are archived; '
+                    f'keeping their counters and rebuilding from {first_day}'
+                )
+            written = rollups.backfill(metric, since=since)
+            self.stdout.write(self.style.SUCCESS(f'{metric}: {written} counter rows rebuilt'))
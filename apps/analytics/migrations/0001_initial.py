@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('metric', models.CharField(choices=[('inquiry', 'Inquiries'), ('message', 'Contact Messages'), ('registration', 'Event Registrations')], max_length=20)),
+                ('dimension_id', models.PositiveBigIntegerField(default=0, help_text='Program ID for inquiries, event ID for registrations, 0 when not applicable')),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Daily Count',
+                'verbose_name_plural': 'Daily Counts',
+                'ordering': ['date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailycount',
+            constraint=models.UniqueConstraint(fields=('metric', 'date', 'dimension_id'), name='analytics_dailycount_unique'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""
+Analytics app models - Daily rollup counters.
+"""
+
+from django.db import models
+
+
+class DailyCount(models.Model):
+    """
+    Number of submissions received per day for one metric.
+
+    Rows are maintained incrementally as submissions arrive (see
+    ``apps.analytics.signals``) and are never decremented, so deleted and
+    archived submissions stay counted. They can be rebuilt from the source
+    tables with the ``backfill_rollups`` management command.
+    """
+
+    class Metric(models.TextChoices):
+        INQUIRY = 'inquiry', 'Inquiries'
+        MESSAGE = 'message', 'Contact Messages'
+        REGISTRATION = 'registration', 'Event Registrations'
+
+    date = models.DateField()
+    metric = models.CharField(max_length=20, choices=Metric.choices)
+    dimension_id = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Program ID for inquiries, event ID for registrations, 0 when not applicable"
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['metric', 'date', 'dimension_id'],
+                name='analytics_dailycount_unique',
+            ),
+        ]
+        verbose_name = "Daily Count"
+        verbose_name_plural = "Daily Counts"
+
+    def __str__(self):
+        return f"{self.get_metric_display()} {self.date}: {self.count}"
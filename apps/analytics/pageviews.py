@@ -0,0 +1,155 @@
+"""
+Buffered page-view counters for public detail pages.
+
+``record_view`` only touches memory: each worker adds hits to a local
+buffer and writes it out every ``PAGE_VIEW_FLUSH_SECONDS`` as one
+``UPDATE ... SET views = views + n`` per model and increment, so a busy page
+costs a handful of writes a minute instead of one per request, and
+concurrent hits are never lost to a read-modify-write. The writes come from
+a background thread (``start()``, called from ``gunicorn.conf.py``), so hits
+reach the database even when no further request arrives, and again when
+the worker exits.
+
+A visitor (address + user agent) is counted once per item per
+``PAGE_VIEW_DEDUPE_SECONDS``, using ``cache.add`` so the check is shared
+between workers when the cache is. The address is ``REMOTE_ADDR`` unless
+``PAGE_VIEW_TRUSTED_PROXIES`` says how many proxies in front of the app
+append to ``X-Forwarded-For``; a client can write anything into that
+header, so it is not read otherwise. Known crawlers are not counted.
+
+The ``views`` columns are written with ``QuerySet.update()``, which leaves
+``updated_at`` alone and sends no signals, so counting views never makes
+sitemaps, feeds or search think the content changed.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, close_old_connections
+from django.db.models import F
+
+from apps.core.site_search import SEARCH_SOURCES
+
+
+logger = logging.getLogger(__name__)
+
+# Content types whose detail pages are counted; keys of ``SEARCH_SOURCES``.
+PAGE_VIEW_SOURCES = ('blog', 'news', 'events', 'programs', 'coaches', 'gallery')
+
+BOT_RE = re.compile(r'bot|crawl|spider|slurp|preview|monitor|curl|wget|python-requests', re.IGNORECASE)
+
+_buffer = Counter()  # (model, pk) -> hits
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+_started_pid = None
+
+
+def client_address(request):
+    """
+    The visitor's IP address.
+
+    Behind ``PAGE_VIEW_TRUSTED_PROXIES`` proxies, the entry the outermost of
+    them added to ``X-Forwarded-For``; anything left of it came from the
+    client and can't be trusted.
+    """
+    proxies = settings.PAGE_VIEW_TRUSTED_PROXIES
+    if proxies:
+        forwarded = [part.strip() for part in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')]
+        forwarded = [part for part in forwarded if part]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def _visitor(request):
+    address = client_address(request)
+    agent = request.META.get('HTTP_USER_AGENT', '')
+    return hashlib.md5(f'{address}|{agent}'.encode()).hexdigest()
+
+
+def record_view(request, obj):
+    """Count a view of ``obj`` by this request's visitor."""
+    if BOT_RE.search(request.META.get('HTTP_USER_AGENT', '')):
+        return
+    key = f'pageview:{obj._meta.label_lower}:{obj.pk}:{_visitor(request)}'
+    if not cache.add(key, 1, settings.PAGE_VIEW_DEDUPE_SECONDS):
+        return
+    with _lock:
+        _buffer[type(obj), obj.pk] += 1
+    if time.monotonic() - _last_flush >= settings.PAGE_VIEW_FLUSH_SECONDS:
+        flush()
+
+
+def flush():
+    """Write the buffered hits of this worker to the database."""
+    global _buffer, _last_flush
+    with _lock:
+        pending, _buffer = _buffer, Counter()
+        _last_flush = time.monotonic()
+    if not pending:
+        return
+
+    # model -> increment -> pks, so each UPDATE covers every row that
+    # gained the same number of views.
+    grouped = defaultdict(lambda: defaultdict(list))
+    for (model, pk), hits in pending.items():
+        grouped[model][hits].append(pk)
+    for model, increments in grouped.items():
+        for hits, pks in increments.items():
+            try:
+                model.objects.filter(pk__in=pks).update(views=F('views') + hits)
+            except DatabaseError:
+                # Keep the hits for the next flush rather than failing the request.
+                logger.warning('Could not write page views for %s', model._meta.label, exc_info=True)
+                with _lock:
+                    for pk in pks:
+                        _buffer[model, pk] += hits
+
+
+atexit.register(flush)
+
+
+def _run(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            flush()
+        except Exception:
+            logger.warning('Page view flush failed', exc_info=True)
+        finally:
+            close_old_connections()
+
+
+def start():
+    """Start this worker's flush thread (once per process)."""
+    global _started_pid
+    if _started_pid == os.getpid():
+        return
+    _started_pid = os.getpid()
+    thread = threading.Thread(
+        target=_run, args=(settings.PAGE_VIEW_FLUSH_SECONDS,), name='page-view-flush', daemon=True,
+    )
+    thread.start()
+
+
+class PageViewMixin:
+    """Count a view of ``self.object`` on every successful GET of a detail view."""
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        record_view(request, self.object)
+        return response
+
+
+def most_viewed(key, limit=10):
+    """Most viewed visible items of ``key`` (a ``PAGE_VIEW_SOURCES`` entry)."""
+    source = SEARCH_SOURCES[key]
+    return source.queryset().filter(views__gt=0).only(*source.fields, 'views').order_by('-views', '-pk')[:limit]
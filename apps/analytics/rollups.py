@@ -0,0 +1,175 @@
+"""
+Daily rollup counters for submissions.
+
+Inquiries, contact messages and event registrations are counted per day into
+``DailyCount`` as they arrive, so trend charts read a few hundred compact rows
+instead of scanning the submission tables.
+
+The counters record submissions received, not rows still stored: deleting a
+submission (by hand or by archiving it) leaves its day's count unchanged.
+Only ``backfill()`` recounts, from the rows that remain, and only for days
+that have not been archived.
+"""
+
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Sum
+from django.db.models.functions import TruncDate, TruncWeek
+from django.utils import timezone
+
+from apps.archive.models import ArchiveSegment
+from apps.contact.models import ContactMessage, Inquiry
+from apps.events.models import Event, EventRegistration
+from apps.programs.models import Program
+from .models import DailyCount
+
+
+Metric = DailyCount.Metric
+
+# metric -> (source model, dimension field, dimension model)
+METRIC_SOURCES = {
+    Metric.INQUIRY: (Inquiry, 'program_id', Program),
+    Metric.MESSAGE: (ContactMessage, None, None),
+    Metric.REGISTRATION: (EventRegistration, 'event_id', Event),
+}
+
+
+def increment(metric, day, dimension_id=0, amount=1):
+    """Add ``amount`` to the counter for ``metric`` on ``day``."""
+    lookup = {'metric': metric, 'date': day, 'dimension_id': dimension_id or 0}
+    if DailyCount.objects.filter(**lookup).update(count=F('count') + amount):
+        return
+    try:
+        with transaction.atomic():
+            DailyCount.objects.create(count=amount, **lookup)
+    except IntegrityError:
+        # Another process created the row first.
+        DailyCount.objects.filter(**lookup).update(count=F('count') + amount)
+
+
+def record(metric, instance):
+    """Count a newly created submission."""
+    _, dimension_field, _ = METRIC_SOURCES[metric]
+    dimension_id = getattr(instance, dimension_field) if dimension_field else 0
+    increment(metric, timezone.localdate(instance.created_at), dimension_id)
+
+
+def rebuildable_since(metric):
+    """
+    The first day whose counters can be rebuilt from the source table.
+
+    Archiving moves old submissions out of the source table (matching
+    ``ArchiveSegment.Kind`` values), so days up to the newest archived row
+    would be rebuilt as zero; their counters are kept. ``None`` when
+    nothing of ``metric`` has been archived.
+    """
+    newest = ArchiveSegment.objects.filter(kind=metric).aggregate(newest=Max('newest'))['newest']
+    if newest is None:
+        return None
+    return timezone.localdate(newest) + timedelta(days=1)
+
+
+def backfill(metric, since=None):
+    """
+    Rebuild the counters for ``metric`` from the source table.
+
+    Only days on or after ``since`` are rebuilt when it is given, and never
+    days before ``rebuildable_since()``. Returns the number of counter rows
+    written.
+    """
+    model, dimension_field, _ = METRIC_SOURCES[metric]
+    first_day = rebuildable_since(metric)
+    if first_day and (since is None or since < first_day):
+        since = first_day
+    source = model.objects.order_by()
+    counters = DailyCount.objects.filter(metric=metric)
+    if since:
+        source = source.filter(created_at__date__gte=since)
+        counters = counters.filter(date__gte=since)
+
+    group_by = ['day', dimension_field] if dimension_field else ['day']
+    rows = (
+        source.annotate(day=TruncDate('created_at'))
+        .values(*group_by)
+        .annotate(total=Count('pk'))
+    )
+    objs = [
+        DailyCount(
+            metric=metric,
+            date=row['day'],
+            dimension_id=(row[dimension_field] or 0) if dimension_field else 0,
+            count=row['total'],
+        )
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        counters.delete()
+        DailyCount.objects.bulk_create(objs, batch_size=1000)
+    return len(objs)
+
+
+def series(metric, start, end, period='day', dimension_id=None):
+    """
+    Return ``[(date, count), ...]`` for every day or week in ``start..end``.
+
+    Missing periods are filled with zero so charts have a continuous axis.
+    """
+    counters = DailyCount.objects.filter(metric=metric, date__range=(start, end))
+    if dimension_id is not None:
+        counters = counters.filter(dimension_id=dimension_id)
+
+    if period == 'week':
+        totals = dict(
+            counters.annotate(period=TruncWeek('date'))
+            .values('period')
+            .annotate(total=Sum('count'))
+            .values_list('period', 'total')
+        )
+        totals = {_as_date(key): value for key, value in totals.items()}
+        current = start - timedelta(days=start.weekday())
+        step = timedelta(weeks=1)
+    else:
+        totals = dict(
+            counters.values('date').annotate(total=Sum('count')).values_list('date', 'total')
+        )
+        current = start
+        step = timedelta(days=1)
+
+    points = []
+    while current <= end:
+        points.append((current, totals.get(current, 0)))
+        current += step
+    return points
+
+
+def breakdown(metric, start, end):
+    """Return totals per program/event for ``metric``, largest first."""
+    _, dimension_field, dimension_model = METRIC_SOURCES[metric]
+    if dimension_model is None:
+        return []
+
+    totals = list(
+        DailyCount.objects.filter(metric=metric, date__range=(start, end))
+        .values('dimension_id')
+        .annotate(total=Sum('count'))
+        .order_by('-total')
+    )
+    names = dict(
+        dimension_model.objects.filter(pk__in=[row['dimension_id'] for row in totals])
+        .values_list('pk', 'name' if dimension_model is Program else 'title')
+    )
+    return [
+        {
+            'dimension_id': row['dimension_id'],
+            'name': names.get(row['dimension_id'], 'Unassigned'),
+            'total': row['total'],
+        }
+        for row in totals
+    ]
+
+
+def _as_date(value):
+    """TruncWeek returns datetimes on some backends; normalise to dates."""
+    return value.date() if hasattr(value, 'date') else value
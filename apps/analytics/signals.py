@@ -0,0 +1,20 @@
+"""
+Signal handlers keeping the daily rollups up to date.
+"""
+
+from django.db.models.signals import post_save
+
+from . import rollups
+
+
+def count_submission(sender, instance, created, raw=False, **kwargs):
+    """Count a new submission into today's rollup row; deletes are not uncounted."""
+    if not created or raw:
+        return
+    for metric, (model, _, _) in rollups.METRIC_SOURCES.items():
+        if sender is model:
+            rollups.record(metric, instance)
+
+
+for _model, _, _ in rollups.METRIC_SOURCES.values():
+    post_save.connect(count_submission, sender=_model, dispatch_uid=f'analytics_count_{_model._meta.label_lower}')
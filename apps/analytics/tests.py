@@ -0,0 +1,194 @@
+from collections import Counter
+from datetime import datetime, time, timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from apps.archive.models import ArchiveSegment
+from apps.contact.models import ContactMessage, Inquiry
+from apps.programs.models import Program
+from . import pageviews, rollups
+from .models import DailyCount
+
+
+MESSAGE = DailyCount.Metric.MESSAGE
+
+
+def at(day):
+    return timezone.make_aware(datetime.combine(day, time(12)))
+
+
+class IncrementTests(TestCase):
+
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.program = Program.objects.create(
+            name='Junior', short_description='', description='', image='programs/p.jpg',
+            age_group='6-12 years', duration='3 months', fee_amount=1500,
+        )
+
+    def message(self):
+        return ContactMessage.objects.create(name='A', email='a@example.com', subject='Hi', message='Hello')
+
+    def inquiry(self, program=None):
+        return Inquiry.objects.create(
+            student_name='Sam', student_age=9, guardian_name='Alex', guardian_email='a@example.com',
+            guardian_phone='1', program=program,
+        )
+
+    def count(self, metric, dimension_id=0):
+        return DailyCount.objects.get(metric=metric, date=self.today, dimension_id=dimension_id).count
+
+    def test_new_submissions_are_counted(self):
+        self.message()
+        message = self.message()
+        message.subject = 'Edited'
+        message.save()
+        self.assertEqual(self.count(MESSAGE), 2)
+
+    def test_inquiries_are_counted_per_program(self):
+        self.inquiry(self.program)
+        self.inquiry(self.program)
+        self.inquiry()
+        self.assertEqual(self.count(DailyCount.Metric.INQUIRY, self.program.pk), 2)
+        self.assertEqual(self.count(DailyCount.Metric.INQUIRY), 1)
+
+    def test_deletes_are_not_uncounted(self):
+        self.message().delete()
+        self.message()
+        ContactMessage.objects.all().delete()
+        self.assertEqual(self.count(MESSAGE), 2)
+        # A backfill recounts the rows that remain.
+        rollups.backfill(MESSAGE)
+        self.assertFalse(DailyCount.objects.filter(metric=MESSAGE).exists())
+
+    def test_increment_creates_then_adds(self):
+        rollups.increment(MESSAGE, self.today, amount=3)
+        rollups.increment(MESSAGE, self.today)
+        self.assertEqual(self.count(MESSAGE), 4)
+
+
+class BackfillTests(TestCase):
+
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.old_day = self.today - timedelta(days=400)
+
+    def message(self, day):
+        message = ContactMessage.objects.create(name='A', email='a@example.com', subject='Hi', message='Hello')
+        ContactMessage.objects.filter(pk=message.pk).update(created_at=at(day))
+        return message
+
+    def counts(self):
+        return dict(DailyCount.objects.filter(metric=MESSAGE).values_list('date', 'count'))
+
+    def test_rebuilds_counters_from_source(self):
+        self.message(self.today)
+        self.message(self.today)
+        DailyCount.objects.all().delete()
+        DailyCount.objects.create(metric=MESSAGE, date=self.old_day, count=7)
+
+        self.assertEqual(rollups.backfill(MESSAGE), 1)
+        self.assertEqual(self.counts(), {self.today: 2})
+
+    def test_keeps_counters_of_archived_days(self):
+        # Archived rows are gone from the source table; their day keeps its count.
+        DailyCount.objects.create(metric=MESSAGE, date=self.old_day, count=7)
+        ArchiveSegment.objects.create(
+            kind=ArchiveSegment.Kind.MESSAGE, path='message/1.jsonl.gz', row_count=7, size=100,
+            first_id=1, last_id=7, oldest=at(self.old_day), newest=at(self.old_day),
+        )
+        self.message(self.today)
+        DailyCount.objects.filter(date=self.today).delete()
+
+        self.assertEqual(rollups.rebuildable_since(MESSAGE), self.old_day + timedelta(days=1))
+        rollups.backfill(MESSAGE)
+        self.assertEqual(self.counts(), {self.old_day: 7, self.today: 1})
+        rollups.backfill(MESSAGE, since=self.old_day - timedelta(days=1))
+        self.assertEqual(self.counts(), {self.old_day: 7, self.today: 1})
+
+
+class ClientAddressTests(SimpleTestCase):
+
+    def address(self, proxies, forwarded=None, remote='10.0.0.1'):
+        meta = {'REMOTE_ADDR': remote}
+        if forwarded is not None:
+            meta['HTTP_X_FORWARDED_FOR'] = forwarded
+        with override_settings(PAGE_VIEW_TRUSTED_PROXIES=proxies):
+            return pageviews.client_address(RequestFactory().get('/', **meta))
+
+    def test_no_trusted_proxies_ignores_the_header(self):
+        self.assertEqual(self.address(0), '10.0.0.1')
+        self.assertEqual(self.address(0, '1.2.3.4'), '10.0.0.1')
+
+    def test_one_proxy(self):
+        self.assertEqual(self.address(1, '203.0.113.7'), '203.0.113.7')
+        # A client-sent header is left of the entry the proxy appended.
+        self.assertEqual(self.address(1, '1.2.3.4, 203.0.113.7'), '203.0.113.7')
+
+    def test_two_proxies(self):
+        self.assertEqual(self.address(2, '203.0.113.7, 10.1.1.1'), '203.0.113.7')
+        self.assertEqual(self.address(2, '1.2.3.4, 5.6.7.8, 203.0.113.7, 10.1.1.1'), '203.0.113.7')
+
+    def test_short_header_falls_back_to_remote_addr(self):
+        self.assertEqual(self.address(2, '203.0.113.7'), '10.0.0.1')
+        self.assertEqual(self.address(1, ' , '), '10.0.0.1')
+        self.assertEqual(self.address(1), '10.0.0.1')
+
+
+@override_settings(PAGE_VIEW_TRUSTED_PROXIES=0, PAGE_VIEW_FLUSH_SECONDS=3600)
+class RecordViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(pageviews, '_buffer', Counter())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.program = Program.objects.create(
+            name='Junior', short_description='', description='', image='programs/p.jpg',
+            age_group='6-12 years', duration='3 months', fee_amount=1500,
+        )
+
+    def view(self, address='10.0.0.1', agent='Mozilla/5.0'):
+        request = RequestFactory().get('/', REMOTE_ADDR=address, HTTP_USER_AGENT=agent)
+        pageviews.record_view(request, self.program)
+
+    def views(self):
+        return Program.objects.values_list('views', flat=True).get(pk=self.program.pk)
+
+    def test_visitor_is_counted_once(self):
+        self.view()
+        self.view()
+        self.view(agent='Other/1.0')
+        self.view(address='10.0.0.2')
+        self.view(agent='Googlebot/2.1')
+        self.assertEqual(self.views(), 0)
+
+        pageviews.flush()
+        self.assertEqual(self.views(), 3)
+        pageviews.flush()
+        self.assertEqual(self.views(), 3)
+
+    def test_counts_again_after_dedupe_window(self):
+        with override_settings(PAGE_VIEW_DEDUPE_SECONDS=0):
+            self.view()
+            self.view()
+        pageviews.flush()
+        self.assertEqual(self.views(), 2)
+
+    def test_failed_flush_keeps_hits(self):
+        self.view()
+        with mock.patch('django.db.models.query.QuerySet.update', side_effect=pageviews.DatabaseError), \
+                self.assertLogs(pageviews.logger, 'WARNING'):
+            pageviews.flush()
+        self.assertEqual(self.views(), 0)
+        pageviews.flush()
+        self.assertEqual(self.views(), 1)
+
+    def test_update_leaves_updated_at(self):
+        updated_at = self.program.updated_at
+        self.view()
+        pageviews.flush()
+        self.assertEqual(Program.objects.get(pk=self.program.pk).updated_at, updated_at)
@@ -0,0 +1,12 @@
+"""
+Analytics admin URLs.
+"""
+
+from django.urls import path
+from . import views_admin
+
+app_name = 'analytics_admin'
+
+urlpatterns = [
+    path('', views_admin.AnalyticsView.as_view(), name='index'),
+]
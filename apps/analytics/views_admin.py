@@ -0,0 +1,62 @@
+"""
+Analytics app admin dashboard views.
+"""
+
+from datetime import timedelta
+
+from django.utils import timezone
+from django.views.generic import TemplateView
+
+from apps.accounts.decorators import AdminRequiredMixin
+from apps.core.site_search import SEARCH_SOURCES
+from . import pageviews, rollups
+from .models import DailyCount
+
+
+class AnalyticsView(AdminRequiredMixin, TemplateView):
+    """Daily/weekly submission trends from the rollup table, and the most viewed pages."""
+    template_name = 'admin_dashboard/analytics/index.html'
+    range_choices = [30, 90, 365]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        try:
+            days = int(self.request.GET.get('days', 30))
+        except ValueError:
+            days = 30
+        if days not in self.range_choices:
+            days = 30
+        period = 'week' if self.request.GET.get('period') == 'week' else 'day'
+
+        end = timezone.localdate()
+        start = end - timedelta(days=days - 1)
+
+        charts = []
+        for metric, label in DailyCount.Metric.choices:
+            points = rollups.series(metric, start, end, period=period)
+            peak = max((count for _, count in points), default=0)
+            charts.append({
+                'metric': metric,
+                'label': label,
+                'points': [
+                    {'date': day, 'count': count, 'percent': round(count * 100 / peak) if peak else 0}
+                    for day, count in points
+                ],
+                'total': sum(count for _, count in points),
+                'breakdown': rollups.breakdown(metric, start, end),
+            })
+
+        context['charts'] = charts
+
+        pageviews.flush()  # include this worker's buffered hits
+        context['most_viewed'] = [
+            {'label': SEARCH_SOURCES[key].label, 'items': pageviews.most_viewed(key, 5)}
+            for key in pageviews.PAGE_VIEW_SOURCES
+        ]
+        context['days'] = days
+        context['period'] = period
+        context['range_choices'] = self.range_choices
+        context['start_date'] = start
+        context['end_date'] = end
+        return context
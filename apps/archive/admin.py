@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import ArchiveSegment
+
+
+@admin.register(ArchiveSegment)
+class ArchiveSegmentAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'row_count', 'size', 'oldest', 'newest', 'created_at']
+    list_filter = ['kind']
+    readonly_fields = ['kind', 'path', 'row_count', 'size', 'first_id', 'last_id', 'oldest', 'newest', 'created_at']
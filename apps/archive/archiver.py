@@ -0,0 +1,251 @@
+"""
+Hot/cold archiving for submission tables.
+
+Old event registrations, contact messages and inquiries that are no longer
+being worked on are moved out of their tables into gzip'd JSON Lines
+segments under ``ARCHIVE_ROOT``, which must be durable storage (see
+``archive_root()``). Each segment is recorded in
+``ArchiveSegment`` so searches and exports only open the files whose date
+range can match.
+
+Rollup counters in ``apps.analytics`` are kept as they are, and
+``backfill_rollups`` leaves archived days alone.
+"""
+
+import csv
+import gzip
+import json
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.contact.models import ContactMessage, Inquiry
+from apps.events.models import Event, EventRegistration
+from .models import ArchiveSegment
+
+
+Kind = ArchiveSegment.Kind
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class ArchivePolicy:
+    """Which rows of a model are archived, and how they are stored and shown."""
+
+    def __init__(self, kind, model, filters, columns, search_fields, related=None, extras=None):
+        self.kind = kind
+        self.model = model
+        self.filters = filters
+        self.columns = columns
+        self.search_fields = search_fields
+        self.related = related or []
+        self.extras = extras or {}
+
+    @property
+    def after_days(self):
+        return settings.ARCHIVE_AFTER_DAYS[self.model._meta.label]
+
+    def cutoff(self, days=None):
+        return timezone.now() - timedelta(days=self.after_days if days is None else days)
+
+    def eligible(self, cutoff):
+        """Rows created before ``cutoff`` that are finished with."""
+        return (
+            self.model.objects.filter(created_at__lt=cutoff, **self.filters)
+            .select_related(*self.related)
+            .order_by('pk')
+        )
+
+    def serialize(self, obj):
+        row = {field.attname: field.value_from_object(obj) for field in self.model._meta.concrete_fields}
+        for key, getter in self.extras.items():
+            row[key] = getter(obj)
+        return row
+
+
+POLICIES = {
+    Kind.REGISTRATION: ArchivePolicy(
+        Kind.REGISTRATION,
+        EventRegistration,
+        filters={'event__status__in': [Event.Status.COMPLETED, Event.Status.CANCELLED]},
+        columns=[
+            ('registration_number', 'Registration #'),
+            ('participant_name', 'Participant'),
+            ('email', 'Email'),
+            ('phone', 'Phone'),
+            ('event_title', 'Event'),
+            ('status', 'Status'),
+            ('created_at', 'Registered'),
+        ],
+        search_fields=['registration_number', 'participant_name', 'email', 'phone', 'event_title'],
+        related=['event'],
+        extras={'event_title': lambda obj: obj.event.title},
+    ),
+    Kind.MESSAGE: ArchivePolicy(
+        Kind.MESSAGE,
+        ContactMessage,
+        filters={'status__in': [ContactMessage.Status.READ, ContactMessage.Status.REPLIED]},
+        columns=[
+            ('name', 'Name'),
+            ('email', 'Email'),
+            ('phone', 'Phone'),
+            ('subject', 'Subject'),
+            ('status', 'Status'),
+            ('created_at', 'Received'),
+        ],
+        search_fields=['name', 'email', 'phone', 'subject', 'message'],
+    ),
+    Kind.INQUIRY: ArchivePolicy(
+        Kind.INQUIRY,
+        Inquiry,
+        filters={'status__in': [Inquiry.Status.ENROLLED, Inquiry.Status.CLOSED]},
+        columns=[
+            ('student_name', 'Student'),
+            ('guardian_name', 'Guardian'),
+            ('guardian_email', 'Email'),
+            ('guardian_phone', 'Phone'),
+            ('program_name', 'Program'),
+            ('status', 'Status'),
+            ('created_at', 'Received'),
+        ],
+        search_fields=['student_name', 'guardian_name', 'guardian_email', 'guardian_phone', 'program_name', 'message'],
+        related=['program'],
+        extras={'program_name': lambda obj: obj.program.name if obj.program else ''},
+    ),
+}
+
+
+def archive_root():
+    """
+    Return the directory segments are stored in.
+
+    Archived rows exist only in their segment files, so this raises
+    ``ImproperlyConfigured`` when ``ARCHIVE_ROOT`` is unset or inside
+    ``BASE_DIR``, whose contents don't survive a redeploy.
+    """
+    if not settings.ARCHIVE_ROOT:
+        raise ImproperlyConfigured('ARCHIVE_ROOT is not set; point it at a mounted volume to archive rows.')
+    root = Path(settings.ARCHIVE_ROOT).resolve()
+    if root.is_relative_to(Path(settings.BASE_DIR).resolve()):
+        raise ImproperlyConfigured(
+            f'ARCHIVE_ROOT ({root}) is inside BASE_DIR, which is not kept across deploys; '
+            'point it at a mounted volume.'
+        )
+    return root
+
+
+# Moving rows
+
+def archive_batch(policy, cutoff, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Move up to ``batch_size`` eligible rows into a new segment.
+
+    The segment file is written and renamed into place before the rows are
+    deleted in the same transaction; if anything fails the file is removed
+    and the rows stay where they were. Returns the segment or ``None`` when
+    nothing is left to archive.
+    """
+    root = archive_root()
+    with transaction.atomic():
+        rows = list(policy.eligible(cutoff).select_for_update(of=('self',))[:batch_size])
+        if not rows:
+            return None
+
+        records = [policy.serialize(obj) for obj in rows]
+        oldest = min(obj.created_at for obj in rows)
+        newest = max(obj.created_at for obj in rows)
+        relative = Path(policy.kind) / f'{newest:%Y}' / (
+            f'{timezone.now():%Y%m%d%H%M%S}-{rows[0].pk}-{rows[-1].pk}.jsonl.gz'
+        )
+        path = root / relative
+        size = _write_segment(path, records)
+
+        try:
+            segment = ArchiveSegment.objects.create(
+                kind=policy.kind,
+                path=relative.as_posix(),
+                row_count=len(rows),
+                size=size,
+                first_id=rows[0].pk,
+                last_id=rows[-1].pk,
+                oldest=oldest,
+                newest=newest,
+            )
+            policy.model.objects.filter(pk__in=[obj.pk for obj in rows]).delete()
+        except Exception:
+            path.unlink(missing_ok=True)
+            raise
+    return segment
+
+
+def _write_segment(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as fh:
+        for record in records:
+            fh.write(json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False))
+            fh.write('\n')
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+
+# Reading archived rows
+
+def read_segment(segment):
+    """Yield the records stored in ``segment``."""
+    with gzip.open(archive_root() / segment.path, 'rt', encoding='utf-8') as fh:
+        for line in fh:
+            yield json.loads(line)
+
+
+def search(kind, query='', start=None, end=None, limit=None):
+    """
+    Yield archived records of ``kind`` matching ``query``, newest segments first.
+
+    ``query`` is matched case-insensitively against the policy's search
+    fields; ``start``/``end`` bound ``created_at`` and prune whole segments.
+    """
+    policy = POLICIES[kind]
+    needle = query.strip().lower()
+    segments = ArchiveSegment.objects.filter(kind=kind)
+    if start:
+        segments = segments.filter(newest__gte=start)
+    if end:
+        segments = segments.filter(oldest__lte=end)
+
+    found = 0
+    for segment in segments.order_by('-newest').iterator():
+        for record in read_segment(segment):
+            if start or end:
+                created = parse_datetime(record['created_at'])
+                if (start and created < start) or (end and created > end):
+                    continue
+            if needle and not any(needle in str(record.get(field) or '').lower() for field in policy.search_fields):
+                continue
+            yield record
+            found += 1
+            if limit and found >= limit:
+                return
+
+
+class _Echo:
+    """File-like object that hands written CSV lines straight back."""
+
+    def write(self, value):
+        return value
+
+
+def export_csv(kind, query='', start=None, end=None):
+    """Yield CSV lines for matching archived records, for a streaming response."""
+    policy = POLICIES[kind]
+    writer = csv.writer(_Echo())
+    yield writer.writerow([label for _, label in policy.columns])
+    for record in search(kind, query, start, end):
+        yield writer.writerow([record.get(key, '') for key, _ in policy.columns])
@@ -0,0 +1,81 @@
+"""
+Management command to move old submissions into cold storage.
+"""
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.archive import archiver
+from apps.archive.models import ArchiveSegment
+
+
+class Command(BaseCommand):
+    help = (
+        'Archive finished registrations, messages and inquiries older than ARCHIVE_AFTER_DAYS '
+        'into ARCHIVE_ROOT (a durable location outside BASE_DIR)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind',
+            choices=ArchiveSegment.Kind.values,
+            help='Only archive this kind of row (default: all)',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Archive rows older than N days (default: ARCHIVE_AFTER_DAYS setting)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=archiver.DEFAULT_BATCH_SIZE,
+            help='Rows per segment and transaction (default: %(default)s)',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=50,
+            help='Stop after this many batches per kind (default: %(default)s)',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0,
+            help='Seconds to sleep between batches to spread out the load',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many rows would be archived',
+        )
+
+    def handle(self, *args, **options):
+        kinds = [options['kind']] if options['kind'] else ArchiveSegment.Kind.values
+        if not options['dry_run']:
+            try:
+                archiver.archive_root()
+            except ImproperlyConfigured as exc:
+                raise CommandError(str(exc))
+
+        for kind in kinds:
+            policy = archiver.POLICIES[kind]
+            cutoff = policy.cutoff(options['days'])
+
+            if options['dry_run']:
+                pending = policy.eligible(cutoff).count()
+                self.stdout.write(f'{kind}: {pending} rows older than {cutoff:%Y-%m-%d} would be archived')
+                continue
+
+            moved = batches = 0
+            while batches < options['max_batches']:
+                segment = archiver.archive_batch(policy, cutoff, options['batch_size'])
+                if segment is None:
+                    break
+                moved += segment.row_count
+                batches += 1
+                if options['pause']:
+                    time.sleep(options['pause'])
+
+            self.stdout.write(self.style.SUCCESS(f'{kind}: {moved} rows archived in {batches} segments'))
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchiveSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('registration', 'Event Registrations'), ('message', 'Contact Messages'), ('inquiry', 'Inquiries')], max_length=20)),
+                ('path', models.CharField(help_text='Relative to ARCHIVE_ROOT', max_length=255, unique=True)),
+                ('row_count', models.PositiveIntegerField()),
+                ('size', models.PositiveBigIntegerField(help_text='Compressed size in bytes')),
+                ('first_id', models.PositiveBigIntegerField()),
+                ('last_id', models.PositiveBigIntegerField()),
+                ('oldest', models.DateTimeField()),
+                ('newest', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archive Segment',
+                'verbose_name_plural': 'Archive Segments',
+                'ordering': ['-newest'],
+                'indexes': [models.Index(fields=['kind', 'newest'], name='archive_segment_kind_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+"""
+Archive app models - Index of cold-storage segments.
+"""
+
+from django.db import models
+
+
+class ArchiveSegment(models.Model):
+    """
+    One gzip'd JSON Lines file of rows moved out of a hot table.
+
+    The row range and creation-date bounds let searches and exports skip
+    segments that cannot contain a match without opening them.
+    """
+
+    class Kind(models.TextChoices):
+        REGISTRATION = 'registration', 'Event Registrations'
+        MESSAGE = 'message', 'Contact Messages'
+        INQUIRY = 'inquiry', 'Inquiries'
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    path = models.CharField(max_length=255, unique=True, help_text="Relative to ARCHIVE_ROOT")
+    row_count = models.PositiveIntegerField()
+    size = models.PositiveBigIntegerField(help_text="Compressed size in bytes")
+    first_id = models.PositiveBigIntegerField()
+    last_id = models.PositiveBigIntegerField()
+    oldest = models.DateTimeField()
+    newest = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-newest']
+        indexes = [
+            models.Index(fields=['kind', 'newest'], name='archive_segment_kind_idx'),
+        ]
+        verbose_name = "Archive Segment"
+        verbose_name_plural = "Archive Segments"
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.row_count} rows ({self.oldest:%Y-%m-%d} - {self.newest:%Y-%m-%d})"
@@ -0,0 +1,13 @@
+"""
+Archive admin URLs.
+"""
+
+from django.urls import path
+from . import views_admin
+
+app_name = 'archive_admin'
+
+urlpatterns = [
+    path('', views_admin.ArchiveView.as_view(), name='index'),
+    path('export/', views_admin.ArchiveExportView.as_view(), name='export'),
+]
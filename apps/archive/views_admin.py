@@ -0,0 +1,97 @@
+"""
+Archive app admin dashboard views.
+"""
+
+from datetime import datetime, time
+
+from django.db.models import Count, Max, Min, Sum
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views import View
+from django.views.generic import TemplateView
+
+from apps.accounts.decorators import AdminRequiredMixin
+from . import archiver
+from .models import ArchiveSegment
+
+
+RESULT_LIMIT = 100
+
+
+class ArchiveFilterMixin:
+    """Read the kind, search term and date range from the query string."""
+
+    def get_filters(self):
+        kind = self.request.GET.get('kind')
+        if kind not in ArchiveSegment.Kind.values:
+            kind = ArchiveSegment.Kind.REGISTRATION
+        return {
+            'kind': kind,
+            'query': self.request.GET.get('q', '').strip(),
+            'start': self._parse_day(self.request.GET.get('start'), time.min),
+            'end': self._parse_day(self.request.GET.get('end'), time.max),
+        }
+
+    @staticmethod
+    def _parse_day(value, at):
+        day = parse_date(value or '')
+        if day is None:
+            return None
+        return timezone.make_aware(datetime.combine(day, at))
+
+
+class ArchiveView(AdminRequiredMixin, ArchiveFilterMixin, TemplateView):
+    """Archive summary and search over archived rows."""
+    template_name = 'admin_dashboard/archive/index.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        filters = self.get_filters()
+        policy = archiver.POLICIES[filters['kind']]
+
+        totals = {
+            row['kind']: row
+            for row in ArchiveSegment.objects.values('kind').annotate(
+                segments=Count('pk'),
+                rows=Sum('row_count'),
+                size=Sum('size'),
+                oldest=Min('oldest'),
+                newest=Max('newest'),
+            ).order_by()
+        }
+        context['summary'] = [
+            {'kind': kind, 'label': label, 'after_days': archiver.POLICIES[kind].after_days, **totals.get(kind, {})}
+            for kind, label in ArchiveSegment.Kind.choices
+        ]
+
+        searching = bool(filters['query'] or filters['start'] or filters['end'])
+        results = []
+        if searching:
+            for record in archiver.search(limit=RESULT_LIMIT, **filters):
+                record['created_at'] = parse_datetime(record['created_at'])
+                results.append([record.get(key, '') for key, _ in policy.columns])
+
+        context.update({
+            'kind': filters['kind'],
+            'kind_choices': ArchiveSegment.Kind.choices,
+            'search_query': filters['query'],
+            'start': self.request.GET.get('start', ''),
+            'end': self.request.GET.get('end', ''),
+            'searching': searching,
+            'columns': [label for _, label in policy.columns],
+            'results': results,
+            'result_limit': RESULT_LIMIT,
+        })
+        return context
+
+
+class ArchiveExportView(AdminRequiredMixin, ArchiveFilterMixin, View):
+    """Stream matching archived rows as CSV."""
+
+    def get(self, request):
+        filters = self.get_filters()
+        response = StreamingHttpResponse(archiver.export_csv(**filters), content_type='text/csv')
+        filename = f"archive-{filters['kind']}-{timezone.localdate():%Y%m%d}.csv"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
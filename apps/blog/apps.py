@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.blog'
+
+    def ready(self):
+        from . import feeds
+        feeds.BlogFeed.connect()
@@ -0,0 +1,53 @@
+"""
+Blog app RSS/Atom feeds.
+"""
+
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+
+from apps.core.feeds import FEED_LENGTH, CachedFeed, site_name
+from .models import BlogCategory, BlogPost
+
+
+class BlogFeed(CachedFeed):
+    """Latest published blog posts."""
+    cache_name = 'blog-feed'
+    models = [BlogPost, BlogCategory]
+    description = 'Latest articles from our blog.'
+
+    def title(self):
+        return f'{site_name()} Blog'
+
+    def link(self):
+        return reverse('blog:list')
+
+    def items(self):
+        return (
+            BlogPost.objects.filter(status='published')
+            .select_related('category', 'author')
+            .order_by('-published_at')[:FEED_LENGTH]
+        )
+
+    def item_link(self, item):
+        return reverse('blog:detail', kwargs={'slug': item.slug})
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.excerpt
+
+    def item_pubdate(self, item):
+        return item.published_at
+
+    def item_author_name(self, item):
+        if item.author:
+            return item.author.get_full_name() or item.author.username
+
+    def item_categories(self, item):
+        return [item.category.name] if item.category else []
+
+
+class AtomBlogFeed(BlogFeed):
+    feed_type = Atom1Feed
+    subtitle = BlogFeed.description
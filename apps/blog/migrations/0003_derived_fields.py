@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_site_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='first_image_url',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='plain_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=1, editable=False, help_text='Minutes'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_derived_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='blogpost',
+            name='views',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:24
+
+from django.db import migrations
+
+from apps.core import derived
+
+
+BATCH_SIZE = 500
+FIELDS = ['plain_text', 'word_count', 'reading_time', 'first_image_url']
+
+
+def backfill(apps, schema_editor):
+    # Historical models don't have compute_derived_fields(); mirror it here.
+    BlogPost = apps.get_model('blog', 'BlogPost')
+    batch = []
+    for obj in BlogPost.objects.only('content').order_by('pk').iterator(chunk_size=BATCH_SIZE):
+        obj.plain_text = derived.plain_text(obj.content)
+        obj.word_count = derived.word_count(obj.plain_text)
+        obj.reading_time = derived.reading_time(obj.word_count)
+        obj.first_image_url = derived.first_image_url(obj.content)
+        batch.append(obj)
+        if len(batch) == BATCH_SIZE:
+            BlogPost.objects.bulk_update(batch, FIELDS)
+            batch = []
+    BlogPost.objects.bulk_update(batch, FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_view_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -4,17 +4,20 @@ Blog app models.
 
 from django.db import models
 from django.contrib.auth.models import User
-from django.utils.text import slugify
 from django.utils import timezone
-from apps.core.models import TimeStampedModel
+from apps.core import derived
+from apps.core.models import DerivedFieldsModel, TimeStampedModel, UniqueSlugModel
+from apps.core.querycache import CachingQuerySet
 
 
-class BlogCategory(TimeStampedModel):
+class BlogCategory(UniqueSlugModel, TimeStampedModel):
     """Blog category."""
 
     name = models.CharField(max_length=100)
     slug = models.SlugField(unique=True, blank=True)
 
+    slug_from = ('name',)
+
     class Meta:
         ordering = ['name']
         verbose_name = "Blog Category"
@@ -23,13 +26,17 @@ class BlogCategory(TimeStampedModel):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
 
+class BlogPostQuerySet(CachingQuerySet):
+    def cards(self):
+        """Only the columns blog post cards and listings render."""
+        return self.only(
+            'title', 'slug', 'excerpt', 'featured_image', 'featured_image_alt',
+            'category', 'author', 'published_at', 'is_featured', 'reading_time',
+        )
 
-class BlogPost(TimeStampedModel):
+
+class BlogPost(UniqueSlugModel, DerivedFieldsModel, TimeStampedModel):
     """Blog post/article."""
 
     class Status(models.TextChoices):
@@ -60,7 +67,26 @@ class BlogPost(TimeStampedModel):
     meta_title = models.CharField(max_length=70, blank=True)
     meta_description = models.TextField(max_length=160, blank=True)
 
-    views = models.PositiveIntegerField(default=0)
+    views = models.PositiveIntegerField(default=0, editable=False)
+
+    # Derived from content on save
+    plain_text = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False, help_text="Minutes")
+    first_image_url = models.CharField(max_length=500, blank=True, editable=False)
+
+    slug_from = ('title',)
+
+    search_fields = {'title': 'A', 'excerpt': 'B', 'content': 'C'}
+
+    derived_fields = {
+        'plain_text': ['content'],
+        'word_count': ['content'],
+        'reading_time': ['content'],
+        'first_image_url': ['content'],
+    }
+
+    objects = BlogPostQuerySet.as_manager()
 
     class Meta:
         ordering = ['-published_at']
@@ -71,18 +97,12 @@ class BlogPost(TimeStampedModel):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
         if self.status == self.Status.PUBLISHED and not self.published_at:
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
 
-    @property
-    def reading_time(self):
-        """Estimate reading time in minutes."""
-        word_count = len(self.content.split())
-        return max(1, round(word_count / 200))
-
-    def increment_views(self):
-        self.views += 1
-        self.save(update_fields=['views'])
+    def compute_derived_fields(self):
+        self.plain_text = derived.plain_text(self.content)
+        self.word_count = derived.word_count(self.plain_text)
+        self.reading_time = derived.reading_time(self.word_count)
+        self.first_image_url = derived.first_image_url(self.content)
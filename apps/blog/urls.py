@@ -3,11 +3,13 @@ Blog app frontend URLs.
 """
 
 from django.urls import path
-from . import views
+from . import feeds, views
 
 app_name = 'blog'
 
 urlpatterns = [
+    path('feed/', feeds.BlogFeed(), name='feed'),
+    path('feed/atom/', feeds.AtomBlogFeed(), name='feed_atom'),
     path('', views.BlogListView.as_view(), name='list'),
     path('<slug:slug>/', views.BlogDetailView.as_view(), name='detail'),
 ]
@@ -3,6 +3,9 @@ Blog app frontend views.
 """
 
 from django.views.generic import ListView, DetailView
+
+from apps.analytics.pageviews import PageViewMixin
+from apps.core.related import related_to
 from .models import BlogPost, BlogCategory
 
 
@@ -14,7 +17,7 @@ class BlogListView(ListView):
     paginate_by = 9
 
     def get_queryset(self):
-        queryset = BlogPost.objects.filter(status='published').order_by('-published_at')
+        queryset = BlogPost.objects.filter(status='published').cards().order_by('-published_at')
         category_slug = self.kwargs.get('category_slug')
         if category_slug:
             queryset = queryset.filter(category__slug=category_slug)
@@ -27,7 +30,7 @@ class BlogListView(ListView):
         return context
 
 
-class BlogDetailView(DetailView):
+class BlogDetailView(PageViewMixin, DetailView):
     """Public blog post detail page."""
     model = BlogPost
     template_name = 'frontend/blog/detail.html'
@@ -39,8 +42,5 @@ class BlogDetailView(DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['related_posts'] = BlogPost.objects.filter(
-            status='published',
-            category=self.object.category
-        ).exclude(pk=self.object.pk)[:3]
+        context['related_posts'] = related_to('blog', self.object, self.get_queryset())
         return context
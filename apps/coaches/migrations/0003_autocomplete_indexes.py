@@ -0,0 +1,42 @@
+"""
+Case-insensitive prefix indexes for the admin autocomplete endpoint.
+
+``istartswith`` compiles to ``UPPER(col) LIKE UPPER(%s)`` on PostgreSQL and to
+a case-insensitive ``LIKE`` on SQLite, so each backend needs its own index.
+"""
+
+from django.db import migrations
+
+from apps.core.db import run_vendor_sql
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coaches', '0002_add_meta_fields'),
+    ]
+
+    operations = [
+        run_vendor_sql(
+            forward={
+                'postgresql': [
+                    'CREATE INDEX coaches_first_name_prefix_idx ON coaches_coach (UPPER("first_name"::text) text_pattern_ops)',
+                    'CREATE INDEX coaches_last_name_prefix_idx ON coaches_coach (UPPER("last_name"::text) text_pattern_ops)',
+                ],
+                'sqlite': [
+                    'CREATE INDEX coaches_first_name_prefix_idx ON coaches_coach ("first_name" COLLATE NOCASE)',
+                    'CREATE INDEX coaches_last_name_prefix_idx ON coaches_coach ("last_name" COLLATE NOCASE)',
+                ],
+            },
+            reverse={
+                'postgresql': [
+                    'DROP INDEX coaches_first_name_prefix_idx',
+                    'DROP INDEX coaches_last_name_prefix_idx',
+                ],
+                'sqlite': [
+                    'DROP INDEX coaches_first_name_prefix_idx',
+                    'DROP INDEX coaches_last_name_prefix_idx',
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+"""
+Full-text search over coach profiles for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coaches', '0003_autocomplete_indexes'),
+    ]
+
+    operations = [
+        create_search_index('coaches_coach', {
+            'first_name': 'A',
+            'last_name': 'A',
+            'designation': 'B',
+            'specialization': 'B',
+            'bio': 'C',
+        }, 'coaches_coach'),
+    ]
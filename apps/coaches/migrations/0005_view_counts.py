@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coaches', '0004_site_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coach',
+            name='views',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
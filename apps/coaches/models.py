@@ -3,11 +3,20 @@ Coaches app models.
 """
 
 from django.db import models
-from django.utils.text import slugify
-from apps.core.models import TimeStampedModel
+from apps.core.models import TimeStampedModel, UniqueSlugModel
+from apps.core.querycache import CachingQuerySet
 
 
-class Coach(TimeStampedModel):
+class CoachQuerySet(CachingQuerySet):
+    def cards(self):
+        """Only the columns coach cards and listings render."""
+        return self.only(
+            'first_name', 'last_name', 'slug', 'photo', 'designation', 'specialization',
+            'qualifications', 'experience_years', 'instagram_url', 'linkedin_url',
+        )
+
+
+class Coach(UniqueSlugModel, TimeStampedModel):
     """Coach profile for website display."""
 
     class Status(models.TextChoices):
@@ -46,8 +55,25 @@ class Coach(TimeStampedModel):
     meta_title = models.CharField(max_length=70, blank=True, help_text="SEO title (max 70 chars)")
     meta_description = models.CharField(max_length=160, blank=True, help_text="SEO description (max 160 chars)")
 
+    views = models.PositiveIntegerField(default=0, editable=False)
+
+    slug_from = ('first_name', 'last_name')
+
+    search_fields = {
+        'first_name': 'A',
+        'last_name': 'A',
+        'designation': 'B',
+        'specialization': 'B',
+        'bio': 'C',
+    }
+
+    objects = CoachQuerySet.as_manager()
+
     class Meta:
         ordering = ['display_order', 'first_name']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='coaches_updated_idx'),
+        ]
         verbose_name = "Coach"
         verbose_name_plural = "Coaches"
 
@@ -57,8 +83,3 @@ class Coach(TimeStampedModel):
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.first_name}-{self.last_name}")
-        super().save(*args, **kwargs)
@@ -2,7 +2,11 @@
 Coaches app frontend views.
 """
 
+from django.http import Http404
 from django.views.generic import ListView, DetailView
+
+from apps.analytics.pageviews import PageViewMixin
+from apps.core import catalog
 from .models import Coach
 
 
@@ -17,15 +21,18 @@ class CoachListView(ListView):
         return Coach.objects.filter(
             status='active',
             show_on_website=True
-        ).order_by('display_order', 'first_name')
+        ).cards().order_by('display_order', 'first_name')
 
 
-class CoachDetailView(DetailView):
+class CoachDetailView(PageViewMixin, DetailView):
     """Public coach profile page."""
     model = Coach
     template_name = 'frontend/coaches/detail.html'
     context_object_name = 'coach'
     slug_url_kwarg = 'slug'
 
-    def get_queryset(self):
-        return Coach.objects.filter(status='active', show_on_website=True)
+    def get_object(self, queryset=None):
+        coach = catalog.get(Coach, slug=self.kwargs['slug'], status='active', show_on_website=True)
+        if coach is None:
+            raise Http404('No coach found matching the query')
+        return coach
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0001_initial'),
+        ('programs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['created_at'], name='contact_msg_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['status'], name='contact_msg_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inquiry',
+            index=models.Index(fields=['created_at'], name='contact_inq_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inquiry',
+            index=models.Index(fields=['status'], name='contact_inq_status_idx'),
+        ),
+    ]
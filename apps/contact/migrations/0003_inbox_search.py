@@ -0,0 +1,34 @@
+"""
+Full-text search over contact messages and inquiries.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets FTS5 tables that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0002_add_list_indexes'),
+    ]
+
+    operations = [
+        create_search_index('contact_contactmessage', {
+            'subject': 'A',
+            'name': 'A',
+            'email': 'B',
+            'phone': 'B',
+            'message': 'C',
+        }, 'contact_msg'),
+        create_search_index('contact_inquiry', {
+            'student_name': 'A',
+            'guardian_name': 'A',
+            'guardian_email': 'B',
+            'guardian_phone': 'B',
+            'message': 'C',
+        }, 'contact_inq'),
+    ]
@@ -24,8 +24,14 @@ class ContactMessage(TimeStampedModel):
     replied_at = models.DateTimeField(null=True, blank=True)
     admin_notes = models.TextField(blank=True)
 
+    search_fields = {'subject': 'A', 'name': 'A', 'email': 'B', 'phone': 'B', 'message': 'C'}
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='contact_msg_created_idx'),
+            models.Index(fields=['status'], name='contact_msg_status_idx'),
+        ]
         verbose_name = "Contact Message"
         verbose_name_plural = "Contact Messages"
 
@@ -64,8 +70,20 @@ class Inquiry(TimeStampedModel):
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.NEW)
     admin_notes = models.TextField(blank=True)
 
+    search_fields = {
+        'student_name': 'A',
+        'guardian_name': 'A',
+        'guardian_email': 'B',
+        'guardian_phone': 'B',
+        'message': 'C',
+    }
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='contact_inq_created_idx'),
+            models.Index(fields=['status'], name='contact_inq_status_idx'),
+        ]
         verbose_name = "Inquiry"
         verbose_name_plural = "Inquiries"
 
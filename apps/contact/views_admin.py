@@ -9,11 +9,13 @@ from django.views import View
 from django.shortcuts import get_object_or_404, redirect
 
 from apps.accounts.decorators import AdminRequiredMixin
+from apps.core.pagination import KeysetPaginationMixin
+from apps.core.site_search import INBOX_INDEXES
 from .models import ContactMessage, Inquiry
 
 
 # Contact Message Views
-class MessageListView(AdminRequiredMixin, ListView):
+class MessageListView(AdminRequiredMixin, KeysetPaginationMixin, ListView):
     """Admin contact message listing."""
     model = ContactMessage
     template_name = 'admin_dashboard/messages/list.html'
@@ -25,12 +27,25 @@ class MessageListView(AdminRequiredMixin, ListView):
         status = self.request.GET.get('status')
         if status:
             queryset = queryset.filter(status=status)
+        if self.search_query:
+            queryset = INBOX_INDEXES[ContactMessage].search(queryset, self.search_query)
         return queryset
 
+    def get_keyset_ordering(self):
+        # Search results are ranked best match first.
+        if self.search_query:
+            return ('-search_rank', '-id')
+        return super().get_keyset_ordering()
+
+    @property
+    def search_query(self):
+        return self.request.GET.get('q', '').strip()
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['status_choices'] = ContactMessage.Status.choices
         context['selected_status'] = self.request.GET.get('status', '')
+        context['search_query'] = self.search_query
         context['new_count'] = ContactMessage.objects.filter(status='new').count()
         return context
 
@@ -75,7 +90,7 @@ class MessageDeleteView(AdminRequiredMixin, DeleteView):
 
 
 # Inquiry Views
-class InquiryListView(AdminRequiredMixin, ListView):
+class InquiryListView(AdminRequiredMixin, KeysetPaginationMixin, ListView):
     """Admin inquiry listing."""
     model = Inquiry
     template_name = 'admin_html/messages.html'
@@ -87,12 +102,25 @@ class InquiryListView(AdminRequiredMixin, ListView):
         status = self.request.GET.get('status')
         if status:
             queryset = queryset.filter(status=status)
+        if self.search_query:
+            queryset = INBOX_INDEXES[Inquiry].search(queryset, self.search_query)
         return queryset
 
+    def get_keyset_ordering(self):
+        # Search results are ranked best match first.
+        if self.search_query:
+            return ('-search_rank', '-id')
+        return super().get_keyset_ordering()
+
+    @property
+    def search_query(self):
+        return self.request.GET.get('q', '').strip()
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['status_choices'] = Inquiry.Status.choices
         context['selected_status'] = self.request.GET.get('status', '')
+        context['search_query'] = self.search_query
         context['new_count'] = Inquiry.objects.filter(status='new').count()
         return context
 
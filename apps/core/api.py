@@ -0,0 +1,297 @@
+"""
+Read-only JSON API for public content.
+
+Each ``Resource`` describes one collection: which rows are public (the
+``SEARCH_SOURCES`` rules where there is one), the fields a client may ask for,
+and what each field costs to load. A request's ``?fields=`` list is turned
+into one query plan (``only`` columns, ``select_related`` joins and
+``prefetch_related`` lookups for just those fields), so a client asking for
+names and slugs never loads descriptions or related rows.
+
+Responses are cached through ``apps.core.xmlcache`` under the content
+versions of the resource's models (``apps.core.versions``), and carry an
+ETag for conditional requests.
+"""
+
+from django.db.models import Prefetch
+
+from apps.coaches.models import Coach
+from apps.events.models import Event
+from apps.gallery.models import GalleryCategory, GalleryImage
+from apps.news.models import News
+from apps.programs.models import Batch, Program
+from apps.tournaments.models import Match, Team, Tournament
+from . import xmlcache
+from .site_search import SEARCH_SOURCES
+
+
+API_VERSION = 'v1'
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidRequest(ValueError):
+    """A query parameter the API cannot honour; the message is shown to the client."""
+
+
+def _media_url(file, request):
+    return request.build_absolute_uri(file.url) if file else None
+
+
+class Field:
+    """
+    One attribute of a resource.
+
+    ``value(obj, request)`` returns the JSON value (default: the attribute of
+    the same name). ``only``, ``select`` and ``prefetch`` are what the query
+    needs to produce it without further queries.
+    """
+
+    def __init__(self, value=None, only=None, select=(), prefetch=()):
+        self.value = value
+        self.only = only
+        self.select = select
+        self.prefetch = prefetch
+
+    def bind(self, name):
+        if self.only is None:
+            self.only = (name,)
+        if self.value is None:
+            self.value = lambda obj, request: getattr(obj, name)
+        return self
+
+
+def media(name):
+    """Absolute URL of the file in column ``name``."""
+    return Field(lambda obj, request: _media_url(getattr(obj, name), request), only=(name,))
+
+
+def display(name):
+    """Human-readable label of a choices column."""
+    return Field(lambda obj, request: getattr(obj, f'get_{name}_display')(), only=(name,))
+
+
+def team(name):
+    """A match's home or away team, joined in the same query."""
+    columns = ('name', 'slug', 'short_name', 'logo')
+
+    def value(obj, request):
+        team = getattr(obj, name)
+        return {
+            'name': team.name,
+            'slug': team.slug,
+            'short_name': team.short_name,
+            'logo': _media_url(team.logo, request),
+        }
+
+    return Field(value, only=tuple(f'{name}__{column}' for column in columns), select=(name,))
+
+
+class Resource:
+    """One collection exposed at ``/api/v1/<key>/``."""
+
+    def __init__(self, key, queryset, fields, list_fields, ordering, models, lookup='slug', filters=None):
+        self.key = key
+        self._queryset = queryset
+        self.fields = {name: field.bind(name) for name, field in fields.items()}
+        # Fields returned by the list endpoint when ``?fields=`` is not given.
+        self.list_fields = list_fields
+        # Keyset order; must end in a unique column.
+        self.ordering = ordering
+        # Models whose changes can alter a response, for cache invalidation.
+        self.models = models
+        self.lookup = lookup
+        # Query parameter -> lookup for simple equality filters on the list.
+        self.filters = filters or {}
+
+    @property
+    def cache_name(self):
+        return f'api-{self.key}'
+
+    def queryset(self):
+        """Publicly visible rows."""
+        return self._queryset()
+
+    def parse_fields(self, raw, default):
+        """Field names requested by a ``?fields=`` value."""
+        if not raw:
+            return list(default)
+        names = [name.strip() for name in raw.split(',') if name.strip()]
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise InvalidRequest(
+                f'Unknown field(s) for {self.key}: {", ".join(unknown)}. '
+                f'Available: {", ".join(self.fields)}.'
+            )
+        return list(dict.fromkeys(names))
+
+    def plan(self, queryset, names):
+        """``queryset`` loading exactly what ``names`` need."""
+        only, select, prefetch = [self.lookup], [], []
+        only.extend(name.lstrip('-') for name in self.ordering)
+        for name in names:
+            field = self.fields[name]
+            only.extend(field.only)
+            select.extend(field.select)
+            prefetch.extend(field.prefetch)
+        queryset = queryset.only(*dict.fromkeys(only))
+        if select:
+            queryset = queryset.select_related(*dict.fromkeys(select))
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+    def filter(self, queryset, params):
+        lookups = {lookup: params[param] for param, lookup in self.filters.items() if params.get(param)}
+        return queryset.filter(**lookups) if lookups else queryset
+
+    def serialize(self, obj, names, request):
+        return {name: self.fields[name].value(obj, request) for name in names}
+
+
+def _batches(program, request):
+    return [
+        {
+            'name': batch.name,
+            'schedule': batch.schedule,
+            'venue': batch.venue,
+            'coach': batch.coach.full_name if batch.coach else None,
+        }
+        for batch in program.api_batches
+    ]
+
+
+def _images(category, request):
+    return [
+        {'title': image.title, 'image': _media_url(image.image, request), 'alt_text': image.alt_text}
+        for image in category.api_images
+    ]
+
+
+def _public_matches():
+    return Match.objects.exclude(tournament__status=Tournament.Status.DRAFT)
+
+
+RESOURCES = {
+    resource.key: resource for resource in [
+        Resource(
+            'programs', SEARCH_SOURCES['programs'].queryset,
+            fields={
+                'slug': Field(), 'name': Field(), 'short_description': Field(), 'description': Field(),
+                'image': media('image'), 'age_group': Field(), 'duration': Field(),
+                'sessions_per_week': Field(), 'session_duration': Field(),
+                'fee_amount': Field(), 'fee_period': Field(), 'features': Field(), 'is_featured': Field(),
+                'batches': Field(_batches, only=(), prefetch=(Prefetch(
+                    'batches',
+                    queryset=Batch.objects.filter(status='active').select_related('coach')
+                    .only('program', 'name', 'schedule', 'venue', 'coach__first_name', 'coach__last_name'),
+                    to_attr='api_batches',
+                ),)),
+            },
+            list_fields=('slug', 'name', 'short_description', 'image', 'age_group', 'fee_amount', 'fee_period'),
+            ordering=('display_order', 'id'),
+            models=[Program, Batch, Coach],
+        ),
+        Resource(
+            'coaches', SEARCH_SOURCES['coaches'].queryset,
+            fields={
+                'slug': Field(),
+                'name': Field(lambda obj, request: obj.full_name, only=('first_name', 'last_name')),
+                'first_name': Field(), 'last_name': Field(), 'photo': media('photo'),
+                'designation': Field(), 'specialization': Field(), 'bio': Field(),
+                'experience_years': Field(), 'qualifications': Field(), 'achievements': Field(),
+                'linkedin_url': Field(), 'instagram_url': Field(),
+            },
+            list_fields=('slug', 'name', 'photo', 'designation', 'specialization', 'experience_years'),
+            ordering=('display_order', 'id'),
+            models=[Coach],
+        ),
+        Resource(
+            'events', SEARCH_SOURCES['events'].queryset,
+            fields={
+                'slug': Field(), 'title': Field(), 'event_type': Field(), 'event_type_display': display('event_type'),
+                'short_description': Field(), 'description': Field(), 'featured_image': media('featured_image'),
+                'start_date': Field(), 'end_date': Field(), 'start_time': Field(), 'end_time': Field(),
+                'registration_deadline': Field(), 'venue': Field(), 'venue_address': Field(),
+                'google_maps_link': Field(), 'registration_required': Field(),
+                'registration_fee': Field(), 'is_free': Field(), 'status': Field(),
+                'program': Field(
+                    lambda obj, request: {'slug': obj.program.slug, 'name': obj.program.name} if obj.program else None,
+                    only=('program__slug', 'program__name'), select=('program',),
+                ),
+            },
+            list_fields=('slug', 'title', 'event_type', 'short_description', 'featured_image', 'start_date', 'venue', 'status'),
+            ordering=('-start_date', '-id'),
+            models=[Event, Program],
+            filters={'status': 'status', 'event_type': 'event_type'},
+        ),
+        Resource(
+            'tournaments', SEARCH_SOURCES['tournaments'].queryset,
+            fields={
+                'slug': Field(), 'name': Field(), 'short_description': Field(), 'description': Field(),
+                'logo': media('logo'), 'banner': media('banner'), 'tournament_type': Field(),
+                'start_date': Field(), 'end_date': Field(), 'venue': Field(), 'organizer': Field(),
+                'status': Field(), 'is_major': Field(),
+            },
+            list_fields=('slug', 'name', 'short_description', 'logo', 'tournament_type', 'start_date', 'end_date', 'status'),
+            ordering=('-start_date', '-id'),
+            models=[Tournament],
+            filters={'status': 'status'},
+        ),
+        Resource(
+            'matches', _public_matches,
+            fields={
+                'id': Field(),
+                'tournament': Field(
+                    lambda obj, request: {'slug': obj.tournament.slug, 'name': obj.tournament.name},
+                    only=('tournament__slug', 'tournament__name'), select=('tournament',),
+                ),
+                'home_team': team('home_team'), 'away_team': team('away_team'),
+                'match_type': Field(), 'group_name': Field(), 'match_date': Field(), 'match_time': Field(),
+                'venue': Field(), 'status': Field(), 'home_score': Field(), 'away_score': Field(),
+                'home_score_extra': Field(), 'away_score_extra': Field(),
+                'home_score_penalties': Field(), 'away_score_penalties': Field(),
+                'current_minute': Field(), 'highlights_url': Field(),
+            },
+            list_fields=(
+                'id', 'tournament', 'home_team', 'away_team', 'match_type', 'match_date', 'match_time',
+                'status', 'home_score', 'away_score',
+            ),
+            ordering=('-match_date', '-id'),
+            models=[Match, Team, Tournament],
+            lookup='id',
+            filters={'tournament': 'tournament__slug', 'status': 'status'},
+        ),
+        Resource(
+            'news', SEARCH_SOURCES['news'].queryset,
+            fields={
+                'slug': Field(), 'title': Field(), 'category': Field(), 'excerpt': Field(), 'content': Field(),
+                'featured_image': media('featured_image'), 'published_at': Field(), 'reading_time': Field(),
+                'is_featured': Field(), 'is_pinned': Field(),
+            },
+            list_fields=('slug', 'title', 'category', 'excerpt', 'featured_image', 'published_at'),
+            ordering=('-published_at', '-id'),
+            models=[News],
+            filters={'category': 'category'},
+        ),
+        Resource(
+            'gallery', SEARCH_SOURCES['gallery'].queryset,
+            fields={
+                'slug': Field(), 'name': Field(), 'description': Field(), 'cover_image': media('cover_image'),
+                'images': Field(_images, only=(), prefetch=(Prefetch(
+                    'images',
+                    queryset=GalleryImage.objects.filter(is_active=True).only('category', 'title', 'image', 'alt_text'),
+                    to_attr='api_images',
+                ),)),
+            },
+            list_fields=('slug', 'name', 'description', 'cover_image'),
+            ordering=('display_order', 'id'),
+            models=[GalleryCategory, GalleryImage],
+        ),
+    ]
+}
+
+
+for _resource in RESOURCES.values():
+    xmlcache.connect(_resource.cache_name, _resource.models)
@@ -0,0 +1,74 @@
+"""
+Autocomplete support for admin foreign-key fields.
+
+Large reference tables (teams, tournaments, programs, ...) are not rendered
+as full ``<select>`` lists. ``AutocompleteSelect`` renders only the selected
+option and the admin JavaScript fetches matches from ``AutocompleteView`` as
+the user types, using an indexed case-insensitive prefix search.
+"""
+
+from django import forms
+from django.apps import apps
+from django.db.models import Q
+from django.urls import reverse
+
+
+AUTOCOMPLETE_LIMIT = 20
+
+# source name -> (model label, prefix-searched fields, ordering)
+AUTOCOMPLETE_SOURCES = {
+    'teams': ('tournaments.Team', ('name', 'short_name'), ('name',)),
+    'tournaments': ('tournaments.Tournament', ('name',), ('name',)),
+    'programs': ('programs.Program', ('name',), ('name',)),
+    'coaches': ('coaches.Coach', ('first_name', 'last_name'), ('first_name', 'last_name')),
+    'gallery-categories': ('gallery.GalleryCategory', ('name',), ('name',)),
+}
+
+
+def search(source, term, limit=AUTOCOMPLETE_LIMIT):
+    """Return ``[(pk, label), ...]`` for objects whose fields start with ``term``."""
+    label, fields, ordering = AUTOCOMPLETE_SOURCES[source]
+    queryset = apps.get_model(label).objects.order_by(*ordering)
+    term = term.strip()
+    if term:
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f'{field}__istartswith': term})
+        queryset = queryset.filter(condition)
+    return [(obj.pk, str(obj)) for obj in queryset[:limit]]
+
+
+class AutocompleteSelect(forms.Select):
+    """
+    Select widget that renders only the current value.
+
+    The remaining options are loaded on demand from the autocomplete
+    endpoint, so the page size does not grow with the related table.
+    """
+
+    def __init__(self, source, attrs=None):
+        if source not in AUTOCOMPLETE_SOURCES:
+            raise ValueError(f"Unknown autocomplete source: {source}")
+        self.source = source
+        default_attrs = {'class': 'form-select'}
+        if attrs:
+            default_attrs.update(attrs)
+        super().__init__(attrs=default_attrs)
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs['data-autocomplete-url'] = reverse('admin_dashboard:autocomplete', args=[self.source])
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        selected = {str(v) for v in value if v not in ('', None)}
+        options = []
+        if not self.is_required or not selected:
+            options.append(self.create_option(name, '', '---------', not selected, 0))
+
+        queryset = getattr(self.choices, 'queryset', None)
+        pks = [pk for pk in selected if pk.isdigit()]
+        if queryset is not None and pks:
+            for index, obj in enumerate(queryset.filter(pk__in=pks), start=1):
+                options.append(self.create_option(name, obj.pk, str(obj), True, index))
+        return [(None, options, 0)]
@@ -0,0 +1,290 @@
+"""
+Streaming site backup and bulk restore.
+
+A backup is a directory holding one gzip'd JSON Lines file per model, a tar
+of ``MEDIA_ROOT`` (and ``ARCHIVE_ROOT`` when present) and a
+``manifest.json`` written last, so an interrupted export is easy to spot.
+Rows are streamed with ``iterator()`` and media is added file by file, so
+memory use stays flat regardless of table or media size.
+
+Restores insert rows with ``bulk_create`` in foreign-key dependency order.
+Nothing goes through ``Model.save()`` and no model signals are sent, so
+profiles, notifications, counters and slugs are not regenerated on top of
+the restored data. Sequences are reset afterwards, and the content versions
+of the restored models bumped.
+"""
+
+import gzip
+import json
+import os
+import tarfile
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.color import no_style
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from . import search, versions
+from .models import ContentVersion
+
+
+BACKUP_FORMAT = 1
+MANIFEST_NAME = 'manifest.json'
+INSERT_BATCH_SIZE = 1000
+EXPORT_CHUNK_SIZE = 2000
+
+
+class BackupError(Exception):
+    pass
+
+
+def backup_models():
+    """
+    Models included in a backup, parents before children.
+
+    Every model of the project's own apps plus the user model. Auth groups,
+    permissions, content types, sessions, admin logs and the content version
+    ledger are environment specific and left out.
+    """
+    candidates = [get_user_model()]
+    for config in apps.get_app_configs():
+        if config.name.startswith('apps.'):
+            candidates.extend(
+                model for model in config.get_models()
+                if model._meta.managed and not model._meta.proxy and model is not ContentVersion
+            )
+    included = set(candidates)
+
+    # Auto-created many-to-many tables, when both sides are backed up.
+    for model in list(candidates):
+        for field in model._meta.local_many_to_many:
+            through = field.remote_field.through
+            if through._meta.auto_created and field.related_model in included:
+                candidates.append(through)
+                included.add(through)
+
+    return _sort_by_dependencies(candidates)
+
+
+def _sort_by_dependencies(models):
+    pending = {
+        model: {
+            field.related_model
+            for field in model._meta.concrete_fields
+            if field.is_relation and field.related_model in models and field.related_model is not model
+        }
+        for model in models
+    }
+    ordered = []
+    while pending:
+        ready = [model for model, deps in pending.items() if not deps - set(ordered)]
+        if not ready:
+            # A dependency cycle; the remaining order is arbitrary but
+            # constraints are deferred until commit on supported backends.
+            ready = list(pending)
+        for model in ready:
+            ordered.append(model)
+            del pending[model]
+    return ordered
+
+
+def _data_file(model):
+    return f'data/{model._meta.label_lower}.jsonl.gz'
+
+
+# Export
+
+def export_site(output, include_media=True, progress=None):
+    """Write a backup of every model (and media) into the ``output`` directory."""
+    output = Path(output)
+    if (output / MANIFEST_NAME).exists():
+        raise BackupError(f'{output} already contains a backup')
+    (output / 'data').mkdir(parents=True, exist_ok=True)
+
+    manifest = {
+        'format': BACKUP_FORMAT,
+        'created_at': timezone.now().isoformat(),
+        'models': [],
+        'directories': {},
+    }
+
+    for model in backup_models():
+        count = _export_model(model, output / _data_file(model))
+        manifest['models'].append({'label': model._meta.label_lower, 'file': _data_file(model), 'rows': count})
+        if progress:
+            progress(f'{model._meta.label}: {count} rows')
+
+    if include_media:
+        for name, root in _directories().items():
+            if not root.is_dir():
+                continue
+            count = _tar_directory(root, output / f'{name}.tar')
+            manifest['directories'][name] = {'file': f'{name}.tar', 'files': count}
+            if progress:
+                progress(f'{name}: {count} files')
+
+    # Written last: a directory without a manifest is an incomplete backup.
+    with open(output / MANIFEST_NAME, 'w', encoding='utf-8') as fh:
+        json.dump(manifest, fh, indent=2)
+    return manifest
+
+
+def _export_model(model, path):
+    attnames = [field.attname for field in model._meta.concrete_fields]
+    rows = (
+        model._base_manager.using(router.db_for_read(model))
+        .order_by('pk')
+        .values_list(*attnames)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    count = 0
+    with gzip.open(path, 'wt', encoding='utf-8') as fh:
+        for row in rows:
+            fh.write(json.dumps(dict(zip(attnames, row)), cls=DjangoJSONEncoder, ensure_ascii=False))
+            fh.write('\n')
+            count += 1
+    return count
+
+
+def _directories():
+    directories = {'media': Path(settings.MEDIA_ROOT)}
+    archive_root = getattr(settings, 'ARCHIVE_ROOT', None)
+    if archive_root:
+        directories['archive'] = Path(archive_root)
+    return directories
+
+
+def _tar_directory(root, path):
+    count = 0
+    # Stream mode ('w|') never seeks, so files are copied through in chunks.
+    with tarfile.open(path, 'w|') as tar:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                full_path = Path(dirpath) / filename
+                tar.add(full_path, arcname=full_path.relative_to(root).as_posix(), recursive=False)
+                count += 1
+    return count
+
+
+# Import
+
+def import_site(source, flush=False, include_media=True, progress=None):
+    """
+    Restore a backup written by ``export_site``.
+
+    The target tables must be empty unless ``flush`` is given, in which case
+    their rows are deleted first. All rows are restored in one transaction.
+    """
+    source = Path(source)
+    try:
+        with open(source / MANIFEST_NAME, encoding='utf-8') as fh:
+            manifest = json.load(fh)
+    except FileNotFoundError:
+        raise BackupError(f'{source} has no {MANIFEST_NAME}; the backup is missing or incomplete')
+    if manifest.get('format') != BACKUP_FORMAT:
+        raise BackupError(f"Unsupported backup format: {manifest.get('format')}")
+
+    entries = []
+    for entry in manifest['models']:
+        try:
+            entries.append((apps.get_model(entry['label']), entry))
+        except LookupError:
+            raise BackupError(f"Unknown model in backup: {entry['label']}")
+    models = [model for model, _ in entries]
+
+    using = router.db_for_write(models[0])
+    connection = connections[using]
+    with transaction.atomic(using=using):
+        if flush:
+            _flush(connection, models)
+        else:
+            occupied = [model._meta.label for model in models if model._base_manager.using(using).exists()]
+            if occupied:
+                raise BackupError(f"Target tables are not empty: {', '.join(occupied)}. Use --flush to replace them.")
+
+        for model, entry in entries:
+            count = _import_model(model, source / entry['file'], using)
+            if progress:
+                progress(f'{model._meta.label}: {count} rows')
+
+        with connection.cursor() as cursor:
+            for statement in connection.ops.sequence_reset_sql(no_style(), models):
+                cursor.execute(statement)
+        versions.bump(*models)
+
+    for index in search.SEARCH_INDEXES.values():
+        index.rebuild(using)
+
+    if include_media:
+        for name, entry in manifest.get('directories', {}).items():
+            root = _directories().get(name)
+            if root is None:
+                continue
+            root.mkdir(parents=True, exist_ok=True)
+            with tarfile.open(source / entry['file'], 'r|') as tar:
+                tar.extractall(root, filter='data')
+            if progress:
+                progress(f"{name}: {entry['files']} files")
+
+    cache.clear()
+    return manifest
+
+
+def _flush(connection, models):
+    """
+    Delete every row of ``models``, children before parents.
+
+    Rows are deleted rather than truncated: ``TRUNCATE`` without ``CASCADE``
+    fails on PostgreSQL when any table outside the set has a foreign key to
+    one inside it, even an empty one, and with ``CASCADE`` it silently empties
+    those tables too. Rows outside the backup that still point at rows about
+    to go (admin log entries, group memberships) stop the flush instead.
+    """
+    flushed = set(models)
+    referencing = []
+    for model in apps.get_models(include_auto_created=True):
+        if model in flushed:
+            continue
+        for field in model._meta.concrete_fields:
+            if field.is_relation and field.related_model in flushed:
+                rows = model._base_manager.using(connection.alias).filter(**{f'{field.name}__isnull': False})
+                if rows.exists():
+                    referencing.append(f'{model._meta.label}.{field.name}')
+    if referencing:
+        raise BackupError(
+            f"Rows outside the backup reference the tables to flush: {', '.join(referencing)}. "
+            'Remove them before restoring.'
+        )
+
+    with connection.cursor() as cursor:
+        for model in reversed(models):
+            cursor.execute(f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)}')
+
+
+def _import_model(model, path, using):
+    fields = {field.attname: field for field in model._meta.concrete_fields}
+    manager = model._base_manager.using(using)
+    batch = []
+    count = 0
+    with gzip.open(path, 'rt', encoding='utf-8') as fh:
+        for line in fh:
+            row = json.loads(line)
+            batch.append(model(**{
+                name: fields[name].to_python(value) if value is not None else None
+                for name, value in row.items()
+                if name in fields
+            }))
+            if len(batch) >= INSERT_BATCH_SIZE:
+                manager.bulk_create(batch)
+                count += len(batch)
+                batch = []
+    if batch:
+        manager.bulk_create(batch)
+        count += len(batch)
+    return count
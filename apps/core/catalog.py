@@ -0,0 +1,183 @@
+"""
+In-memory snapshot of the small reference tables.
+
+Programs, coaches, facilities and their categories, achievements,
+accreditations, board members and gallery categories hold a few dozen rows
+each, yet list pages, detail pages, the chatbot and the footer queried
+them on every request. Each worker instead keeps a read-only snapshot of
+these tables:
+
+* every row is a ``__slots__`` record holding its column values;
+* records are kept in the model's ``Meta.ordering`` (display order first)
+  and indexed by primary key, by slug and by the columns in
+  ``CATALOG_TABLES`` (status, visibility flags, category), so lookups and
+  filtered lists are dictionary reads;
+* ``get()`` and ``filter()`` return fresh model instances built from the
+  records (``Model.from_db``), with foreign keys to other catalog tables
+  already attached, so views and templates use them like queried objects
+  without touching the database.
+
+The snapshot is immutable. When one of its models changes in any worker
+(``apps.core.invalidation``) the snapshot is dropped, and the next access
+builds a new one (one query per table) and swaps it in as a whole, so a
+request never sees a mix of old and new rows.
+"""
+
+import logging
+import threading
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+
+from . import invalidation
+
+
+logger = logging.getLogger(__name__)
+
+# Catalog model -> columns to index besides the primary key and slug.
+CATALOG_TABLES = {
+    'programs.program': ('status',),
+    'coaches.coach': ('status', 'show_on_website'),
+    'facilities.facilitycategory': ('is_active',),
+    'facilities.facility': ('is_active', 'category_id'),
+    'achievements.achievement': ('is_active', 'show_on_homepage'),
+    'accreditations.accreditation': ('is_active', 'show_on_homepage'),
+    'core.boardmember': ('show_on_website',),
+    'gallery.gallerycategory': ('is_active',),
+}
+
+
+class Record:
+    """One row; subclasses add a slot per column."""
+
+    __slots__ = ()
+
+
+class Table:
+    """The rows of one model, in ``Meta.ordering``, with their indexes."""
+
+    __slots__ = ('model', 'columns', 'records', 'by_pk', 'by_slug', 'indexes', 'relations')
+
+    def __init__(self, model, indexed):
+        self.model = model
+        self.columns = tuple(field.attname for field in model._meta.concrete_fields)
+        record_class = type(f'{model.__name__}Record', (Record,), {'__slots__': self.columns})
+
+        records = []
+        for values in model._default_manager.values_list(*self.columns):
+            record = record_class()
+            for column, value in zip(self.columns, values):
+                setattr(record, column, value)
+            records.append(record)
+        self.records = tuple(records)
+
+        pk = model._meta.pk.attname
+        self.by_pk = {getattr(record, pk): record for record in records}
+        self.by_slug = {record.slug: record for record in records} if 'slug' in self.columns else {}
+        self.indexes = {}
+        for column in indexed:
+            index = {}
+            for record in records:
+                index.setdefault(getattr(record, column), []).append(record)
+            self.indexes[column] = {value: tuple(rows) for value, rows in index.items()}
+        # Foreign keys to other catalog tables: (field, related label).
+        self.relations = tuple(
+            (field, field.related_model._meta.label_lower)
+            for field in model._meta.concrete_fields
+            if field.is_relation and field.related_model._meta.label_lower in CATALOG_TABLES
+        )
+
+    def filter(self, **equals):
+        """Records whose columns equal ``equals``, in table order."""
+        candidates = self.records
+        if 'slug' in equals:
+            record = self.by_slug.get(equals['slug'])
+            candidates = (record,) if record is not None else ()
+        else:
+            # Start from the smallest index that applies.
+            for column, value in equals.items():
+                if column in self.indexes:
+                    rows = self.indexes[column].get(value, ())
+                    if len(rows) < len(candidates):
+                        candidates = rows
+        return [
+            record for record in candidates
+            if all(getattr(record, column) == value for column, value in equals.items())
+        ]
+
+
+class Catalog:
+    """Immutable snapshot of every table in ``CATALOG_TABLES``."""
+
+    def __init__(self):
+        self.tables = {
+            label: Table(apps.get_model(label), indexed) for label, indexed in CATALOG_TABLES.items()
+        }
+
+    def instance(self, table, record):
+        obj = table.model.from_db(DEFAULT_DB_ALIAS, table.columns, [getattr(record, c) for c in table.columns])
+        for field, label in table.relations:
+            related_table = self.tables[label]
+            related = related_table.by_pk.get(getattr(record, field.attname))
+            if related is not None:
+                field.set_cached_value(obj, self.instance(related_table, related))
+        return obj
+
+    def filter(self, model, **equals):
+        table = self.tables[model._meta.label_lower]
+        return [self.instance(table, record) for record in table.filter(**equals)]
+
+    def get(self, model, **equals):
+        """The first matching object, or ``None``."""
+        table = self.tables[model._meta.label_lower]
+        records = table.filter(**equals)
+        return self.instance(table, records[0]) if records else None
+
+
+_snapshot = None
+_generation = 0
+_lock = threading.Lock()
+
+
+def snapshot():
+    """This worker's current catalog, built if missing."""
+    global _snapshot
+    current = _snapshot
+    if current is not None:
+        return current
+    with _lock:
+        if _snapshot is None:
+            generation = _generation
+            built = Catalog()
+            # A change delivered during the build may be missing from it.
+            if generation != _generation:
+                return built
+            _snapshot = built
+        return _snapshot
+
+
+def warm():
+    """Build the snapshot ahead of the first request; failures are retried lazily."""
+    try:
+        snapshot()
+    except DatabaseError:
+        logger.warning('Catalog snapshot not built at startup', exc_info=True)
+
+
+def _expire(labels):
+    global _snapshot, _generation
+    _generation += 1
+    _snapshot = None
+
+
+def filter(model, **equals):
+    """Objects of ``model`` whose columns equal ``equals``, in ``Meta.ordering``."""
+    return snapshot().filter(model, **equals)
+
+
+def get(model, **equals):
+    """The object of ``model`` matching ``equals``, or ``None``."""
+    return snapshot().get(model, **equals)
+
+
+invalidation.subscribe(CATALOG_TABLES, _expire)
@@ -9,6 +9,7 @@ def navigation(request):
     """
     Provide consistent navigation items across all pages.
     """
+    from apps.core import catalog
     from apps.programs.models import Program
 
     # Define main navigation items
@@ -122,6 +123,7 @@ def navigation(request):
         {'name': 'Achievements', 'url_name': 'achievements:list'},
         {'name': 'Tournaments', 'url_name': 'tournaments:list'},
         {'name': 'Gallery', 'url_name': 'gallery:list'},
+        {'name': 'Search', 'url_name': 'frontend:search'},
         {'name': 'Contact', 'url_name': 'frontend:contact'},
     ]
 
@@ -133,7 +135,7 @@ def navigation(request):
 
     # Get programs for footer
     try:
-        footer_programs = Program.objects.filter(status='active')[:5]
+        footer_programs = catalog.filter(Program, status='active')[:5]
     except Exception:
         footer_programs = []
 
@@ -144,6 +146,15 @@ def navigation(request):
     }
 
 
+def content_versions(request):
+    """
+    Expose content versions for template fragment cache keys.
+    """
+    from apps.core.versions import TemplateVersions
+
+    return {'content_versions': TemplateVersions()}
+
+
 def site_settings(request):
     """
     Add site settings to template context.
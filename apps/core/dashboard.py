@@ -0,0 +1,77 @@
+"""
+Admin dashboard statistics.
+
+All dashboard counters are gathered in a single ``UNION ALL`` query and kept
+in the cache for a short time. Signal handlers in ``apps.core.signals`` drop
+the cached value whenever one of the counted models is written, so the
+dashboard costs one aggregate query after a change and none otherwise.
+"""
+
+from django.core.cache import cache
+from django.db.models import CharField, Count, Q, Value
+
+from apps.programs.models import Program, Batch
+from apps.coaches.models import Coach
+from apps.gallery.models import GalleryImage
+from apps.hero.models import HeroSlide
+from apps.testimonials.models import Testimonial
+from apps.contact.models import ContactMessage, Inquiry
+from apps.events.models import Event, EventRegistration
+from apps.news.models import News
+
+
+DASHBOARD_STATS_CACHE_KEY = 'dashboard:stats'
+DASHBOARD_STATS_TIMEOUT = 60  # seconds
+
+# (context key, model, filter) - one row of the UNION ALL query each.
+DASHBOARD_COUNTS = [
+    ('total_programs', Program, Q(status='active')),
+    ('total_batches', Batch, Q(status='active')),
+    ('total_coaches', Coach, Q(status='active')),
+    ('upcoming_events', Event, Q(status='upcoming')),
+    ('new_messages', ContactMessage, Q(status='new')),
+    ('new_inquiries', Inquiry, Q(status='new')),
+    ('total_registrations', EventRegistration, Q()),
+    ('total_news', News, Q(status='published')),
+    ('hero_count', HeroSlide, Q(is_active=True)),
+    ('gallery_count', GalleryImage, Q(is_active=True)),
+    ('testimonial_count', Testimonial, Q(is_active=True)),
+]
+
+# Models whose writes invalidate the cached statistics.
+DASHBOARD_MODELS = {model for _, model, _ in DASHBOARD_COUNTS}
+
+
+def _count_query(key, model, condition):
+    """Build a one-row ``SELECT 'key', COUNT(*)`` queryset for a counter."""
+    return (
+        model.objects.filter(condition)
+        .order_by()
+        .values(key=Value(key, output_field=CharField()))
+        .annotate(total=Count('pk'))
+        .values_list('key', 'total')
+    )
+
+
+def compute_dashboard_stats():
+    """Run every dashboard counter in one UNION ALL query."""
+    queries = [_count_query(*spec) for spec in DASHBOARD_COUNTS]
+    combined = queries[0].union(*queries[1:], all=True)
+
+    stats = {key: 0 for key, _, _ in DASHBOARD_COUNTS}
+    stats.update(dict(combined))
+    return stats
+
+
+def get_dashboard_stats():
+    """Return cached dashboard statistics, recomputing them on a miss."""
+    stats = cache.get(DASHBOARD_STATS_CACHE_KEY)
+    if stats is None:
+        stats = compute_dashboard_stats()
+        cache.set(DASHBOARD_STATS_CACHE_KEY, stats, DASHBOARD_STATS_TIMEOUT)
+    return stats
+
+
+def invalidate_dashboard_stats():
+    """Drop the cached statistics so the next dashboard load recomputes them."""
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
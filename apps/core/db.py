@@ -0,0 +1,74 @@
+"""
+Database helpers shared by migrations and backend-specific queries.
+"""
+
+from django.db import migrations
+
+
+def run_vendor_sql(forward, reverse=None):
+    """
+    Build a migration operation that runs backend-specific SQL.
+
+    ``forward`` and ``reverse`` map a connection vendor (``'postgresql'``,
+    ``'sqlite'``) to a list of statements. Vendors without an entry are
+    skipped, so the same migration works on every supported database.
+    """
+    reverse = reverse or {}
+
+    def _runner(statements_by_vendor):
+        def run(apps, schema_editor):
+            for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+                schema_editor.execute(statement)
+        return run
+
+    return migrations.RunPython(_runner(forward), _runner(reverse))
+
+
+def search_index_sql(table, fields, name):
+    """
+    Statements creating and dropping the full-text index of ``table``.
+
+    ``fields`` maps columns to weight letters in index order and ``name``
+    prefixes the PostgreSQL index names. PostgreSQL gets generated
+    ``search_document`` (plain text, trigram GIN index) and ``search_vector``
+    (weighted tsvector, GIN index) columns; SQLite an FTS5 table
+    ``<table>_fts`` filled from the existing rows. Returns
+    ``(forward, reverse)`` for ``run_vendor_sql``.
+    """
+    columns = list(fields)
+    sources = [f"COALESCE({column}, '')" for column in columns]
+    document = " || ' ' || ".join(sources)
+    vector = ' || '.join(
+        f"setweight(to_tsvector('simple'::regconfig, COALESCE({column}, '')), '{weight}')"
+        for column, weight in fields.items()
+    )
+    forward = {
+        'postgresql': [
+            'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+            f"ALTER TABLE {table} ADD COLUMN search_document text GENERATED ALWAYS AS ({document}) STORED",
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED",
+            f'CREATE INDEX {name}_search_vector_idx ON {table} USING GIN (search_vector)',
+            f'CREATE INDEX {name}_search_trgm_idx ON {table} USING GIN (search_document gin_trgm_ops)',
+        ],
+        'sqlite': [
+            f"CREATE VIRTUAL TABLE {table}_fts USING fts5("
+            f"{', '.join(columns)}, tokenize = 'unicode61 remove_diacritics 2')",
+            f"INSERT INTO {table}_fts (rowid, {', '.join(columns)}) "
+            f"SELECT id, {', '.join(sources)} FROM {table}",
+        ],
+    }
+    reverse = {
+        'postgresql': [
+            f'ALTER TABLE {table} DROP COLUMN search_vector',
+            f'ALTER TABLE {table} DROP COLUMN search_document',
+        ],
+        'sqlite': [
+            f'DROP TABLE {table}_fts',
+        ],
+    }
+    return forward, reverse
+
+
+def create_search_index(table, fields, name):
+    """Migration operation adding a full-text index; see ``search_index_sql``."""
+    return run_vendor_sql(*search_index_sql(table, fields, name))
@@ -0,0 +1,60 @@
+"""
+Helpers for values derived from content fields.
+
+Models built on ``DerivedFieldsModel`` use these in
+``compute_derived_fields()`` to fill their stored columns at save time, so
+templates read a column instead of re-parsing HTML on every render.
+``summary`` is the query-time counterpart used by card projections.
+"""
+
+import html
+import re
+
+from django.db.models import Value
+from django.db.models.functions import Coalesce, Left, NullIf
+from django.utils.html import strip_tags
+
+
+WORDS_PER_MINUTE = 200
+
+IMG_SRC_RE = re.compile(r'<img\b[^>]*?\bsrc\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+BLOCK_TAG_RE = re.compile(r'<(?:br|/p|/div|/li|/h[1-6]|/tr|/blockquote)\b[^>]*>', re.IGNORECASE)
+SPACE_RE = re.compile(r'[^\S\n]+')
+
+
+def plain_text(value):
+    """Text of an HTML fragment, with entities decoded and whitespace collapsed."""
+    # Keep a line break where a block ends so words either side stay apart.
+    text = html.unescape(strip_tags(BLOCK_TAG_RE.sub('\n', value or '')))
+    lines = (SPACE_RE.sub(' ', line).strip() for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def word_count(text):
+    return len(text.split())
+
+
+def reading_time(words):
+    """Minutes to read ``words`` words, at least one."""
+    return max(1, round(words / WORDS_PER_MINUTE))
+
+
+def lines(value):
+    """Non-blank, stripped lines of a "one per line" text field."""
+    return [line.strip() for line in (value or '').splitlines() if line.strip()]
+
+
+def first_image_url(value):
+    """``src`` of the first ``<img>`` in an HTML fragment, or ''."""
+    match = IMG_SRC_RE.search(value or '')
+    return html.unescape(match.group(1))[:500] if match else ''
+
+
+def summary(short_field, long_field, length=300):
+    """
+    Query expression for a card summary: ``short_field``, or the first
+    ``length`` characters of ``long_field`` when it is blank.
+
+    Lets card querysets defer the long field while keeping the fallback.
+    """
+    return Coalesce(NullIf(short_field, Value('')), Left(long_field, length))
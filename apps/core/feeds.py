@@ -0,0 +1,59 @@
+"""
+Base class for the public RSS/Atom feeds.
+
+Feed readers poll every few minutes while content changes a few times a
+day, so rendered feeds are kept in ``apps.core.xmlcache`` until one of the
+feed's models is saved or deleted. ``Last-Modified`` comes from the items'
+``updated_at`` (via ``item_updateddate``) and every response has an ETag,
+so most polls end in a 304 without touching the database.
+"""
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+
+from . import xmlcache
+from .models import SiteSettings
+
+
+FEED_LENGTH = 20
+
+
+def site_name():
+    return SiteSettings.get_settings().site_name
+
+
+class CachedFeed(Feed):
+    """
+    Feed whose XML is cached until one of ``models`` changes.
+
+    Subclasses set ``cache_name`` and ``models``; the app registers the
+    invalidation with ``connect()`` from its ``AppConfig.ready``.
+    """
+
+    cache_name = None
+    models = ()
+
+    @classmethod
+    def connect(cls):
+        # Feed titles include the site name.
+        xmlcache.connect(cls.cache_name, [SiteSettings, *cls.models])
+
+    def cache_parts(self, request, *args, **kwargs):
+        """Extra cache-key parts for feeds whose items depend on more than the models."""
+        return ()
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+    def __call__(self, request, *args, **kwargs):
+        version = xmlcache.generations([self.cache_name])[self.cache_name]
+        key = xmlcache.cache_key(
+            request, self.cache_name, type(self).__name__, version,
+            args, sorted(kwargs.items()), *self.cache_parts(request, *args, **kwargs),
+        )
+        return xmlcache.cached_response(
+            request, key,
+            lambda: super(CachedFeed, self).__call__(request, *args, **kwargs),
+            settings.FEED_CACHE_TIMEOUT,
+        )
+
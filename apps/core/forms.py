@@ -4,6 +4,7 @@ Core app forms.
 
 import json
 from django import forms
+from .importers import IMPORTERS
 from .models import SiteSettings, PageSettings, AboutPageContent, HomepageContent, BoardMember, CommunityActivity, CommunityPageContent
 
 
@@ -279,3 +280,22 @@ class CommunityPageContentForm(forms.ModelForm):
             'stats_beneficiaries': forms.NumberInput(attrs={'class': 'form-input', 'min': 0}),
             'stats_hours': forms.NumberInput(attrs={'class': 'form-input', 'min': 0}),
         }
+
+
+class BulkImportForm(forms.Form):
+    """Upload form for CSV/XLSX bulk imports."""
+
+    kind = forms.ChoiceField(
+        choices=[(key, spec.label) for key, spec in IMPORTERS.items()],
+        widget=forms.Select(attrs={'class': 'form-select'}),
+    )
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'class': 'form-input', 'accept': '.csv,.xlsx'}),
+        help_text="CSV (UTF-8) or Excel .xlsx with a header row",
+    )
+
+    def clean_file(self):
+        upload = self.cleaned_data['file']
+        if not upload.name.lower().endswith(('.csv', '.xlsx')):
+            raise forms.ValidationError('Upload a .csv or .xlsx file.')
+        return upload
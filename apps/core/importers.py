@@ -0,0 +1,458 @@
+"""
+Bulk CSV/XLSX import for admin-managed content.
+
+Files are read row by row and processed in chunks. Each chunk preloads the
+rows it updates and the foreign keys it references (looked up by slug) in a
+handful of queries, validates every row against the app's admin ModelForm
+and collects per-row errors. Nothing is written unless the whole file is
+valid; then all rows go in with ``bulk_create``/``bulk_update`` inside one
+transaction.
+
+``bulk_create`` bypasses ``Model.save()``, so each spec repeats the defaults
+its model's ``save()`` fills in (short name, ...). Slugs left blank are built
+from the model's ``slug_from`` fields and allocated for the whole file with
+one ``SlugAllocator``. Such rows are matched to existing rows on those
+fields (their natural key) instead, so importing the same file twice
+updates rather than duplicates: the n-th row with a given name updates the
+n-th existing item with it, and rows beyond those become new items with
+numbered slugs.
+"""
+
+import csv
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django import forms
+from django.db import IntegrityError, models, transaction
+from django.forms import modelform_factory
+from django.utils import timezone
+
+from apps.coaches.forms import CoachForm
+from apps.events.forms import EventForm
+from apps.programs.forms import ProgramForm
+from apps.programs.models import Program
+from apps.tournaments.forms import MatchForm, TeamForm
+from apps.tournaments.models import Team, Tournament
+from . import search, slugs, sync, versions
+
+
+CHUNK_SIZE = 500
+PREVIEW_ROWS = 50
+MAX_ERRORS = 200
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'x', 'on'}
+
+
+class ImportFileError(Exception):
+    """The uploaded file cannot be read at all."""
+
+
+@dataclass
+class ImportSpec:
+    """How rows of one kind map onto a model."""
+
+    label: str
+    form_class: type
+    list_url: str
+    # Column identifying existing rows to update: 'slug' or 'id'.
+    key: str = 'slug'
+    # column -> (model, slug field) for foreign keys given as slugs.
+    lookups: dict = field(default_factory=dict)
+    prepare: object = None
+
+    @property
+    def model(self):
+        return self.form_class._meta.model
+
+    @property
+    def slug_from(self):
+        """Columns joined to build the slug when the file leaves it blank."""
+        return getattr(self.model, 'slug_from', ())
+
+    @property
+    def columns(self):
+        """Importable columns: the admin form's fields minus file uploads."""
+        opts = self.model._meta
+        columns = [
+            name for name in self.form_class._meta.fields
+            if not isinstance(opts.get_field(name), models.FileField)
+        ]
+        if self.key == 'id':
+            columns.insert(0, 'id')
+        return columns
+
+
+def _prepare_team(team):
+    if not team.short_name:
+        team.short_name = team.name[:3].upper()
+
+
+IMPORTERS = {
+    'teams': ImportSpec('Teams', TeamForm, 'admin_dashboard:teams:list', prepare=_prepare_team),
+    'matches': ImportSpec(
+        'Matches', MatchForm, 'admin_dashboard:matches:list', key='id',
+        lookups={
+            'tournament': (Tournament, 'slug'),
+            'home_team': (Team, 'slug'),
+            'away_team': (Team, 'slug'),
+        },
+    ),
+    'programs': ImportSpec('Programs', ProgramForm, 'admin_dashboard:programs:list'),
+    'coaches': ImportSpec('Coaches', CoachForm, 'admin_dashboard:coaches:list'),
+    'events': ImportSpec(
+        'Events', EventForm, 'admin_dashboard:events:list',
+        lookups={'program': (Program, 'slug')},
+    ),
+}
+
+
+# Reading files
+
+def read_rows(path):
+    """
+    Open a CSV or XLSX file and return ``(columns, rows)``.
+
+    ``rows`` lazily yields ``(row_number, {column: value})`` with blank cells
+    left out; header names are lower-cased with spaces turned into
+    underscores.
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.xlsx':
+        rows = _read_xlsx(path)
+    else:
+        rows = _read_csv(path)
+
+    try:
+        header = next(rows)
+    except StopIteration:
+        raise ImportFileError('The file is empty.')
+    columns = [_normalise_header(name) for name in header]
+
+    def numbered_rows():
+        for number, values in enumerate(rows, start=2):
+            row = {
+                column: value
+                for column, value in zip(columns, values)
+                if column and value not in (None, '')
+            }
+            if row:
+                yield number, row
+
+    return [column for column in columns if column], numbered_rows()
+
+
+def _read_csv(path):
+    with open(path, encoding='utf-8-sig', newline='') as fh:
+        try:
+            yield from csv.reader(fh)
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise ImportFileError(f'Could not read the CSV file: {exc}')
+
+
+def _read_xlsx(path):
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportFileError('XLSX import needs the openpyxl package; upload a CSV file instead.')
+    try:
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    except Exception as exc:
+        raise ImportFileError(f'Could not read the XLSX file: {exc}')
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _normalise_header(name):
+    return str(name or '').strip().lower().replace(' ', '_').replace('-', '_')
+
+
+def template_csv(spec):
+    """Return a CSV header line listing the importable columns."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(spec.columns)
+    return buffer.getvalue()
+
+
+# Validation and writing
+
+class LookupField(forms.Field):
+    """Resolve a slug to an instance from a preloaded map."""
+
+    def __init__(self, mapping, model, **kwargs):
+        self.mapping = mapping
+        self.model = model
+        super().__init__(**kwargs)
+
+    def clean(self, value):
+        value = str(value or '').strip()
+        if not value:
+            if self.required:
+                raise forms.ValidationError('This field is required.')
+            return None
+        try:
+            return self.mapping[value]
+        except KeyError:
+            raise forms.ValidationError(f'No {self.model._meta.verbose_name} with slug "{value}".')
+
+
+class ImportForm(forms.ModelForm):
+    """
+    Base for generated import forms.
+
+    Uniqueness is handled per chunk by the importer, and foreign keys were
+    already resolved from the preloaded maps, so neither is re-checked with
+    a query per row.
+    """
+
+    def _get_validation_exclusions(self):
+        exclude = super()._get_validation_exclusions()
+        exclude.update(name for name, form_field in self.fields.items() if isinstance(form_field, LookupField))
+        return exclude
+
+    def validate_unique(self):
+        pass
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    total: int = 0
+    error_count: int = 0
+    errors: list = field(default_factory=list)
+    preview: list = field(default_factory=list)
+    columns: list = field(default_factory=list)
+    ignored_columns: list = field(default_factory=list)
+
+    @property
+    def is_valid(self):
+        return self.error_count == 0
+
+
+class Importer:
+    """Validate and write one uploaded file for ``spec``."""
+
+    def __init__(self, spec, path):
+        self.spec = spec
+        self.path = path
+        self.model = spec.model
+
+    def run(self, dry_run=True):
+        result = ImportResult()
+        header, rows = read_rows(self.path)
+        form_class = self._build_form(header, result)
+        pending_create, pending_update, seen_keys = [], [], {}
+        # (new instance, slug base) for created rows whose slug is generated.
+        self.slug_bases = []
+        # Pks of existing rows already matched by an earlier row.
+        self.matched = set()
+
+        chunk = []
+        for number, row in rows:
+            chunk.append((number, row))
+            if len(chunk) >= CHUNK_SIZE:
+                self._process_chunk(chunk, form_class, result, pending_create, pending_update, seen_keys)
+                chunk = []
+        if chunk:
+            self._process_chunk(chunk, form_class, result, pending_create, pending_update, seen_keys)
+
+        if result.is_valid and not dry_run:
+            self._write(pending_create, pending_update, result)
+        else:
+            result.created = len(pending_create)
+            result.updated = len(pending_update)
+        return result
+
+    def _build_form(self, header, result):
+        # The form only contains the columns the file provides, so updates
+        # leave every other field untouched.
+        allowed = self.spec.columns
+        present = [name for name in allowed if name in header and name != 'id']
+        result.columns = [name for name in allowed if name in header]
+        result.ignored_columns = [name for name in header if name not in allowed]
+        self.update_fields = present
+        return modelform_factory(self.model, form=ImportForm, fields=present)
+
+    def _process_chunk(self, chunk, form_class, result, pending_create, pending_update, seen_keys):
+        lookup_fields = self._preload_lookups(chunk)
+        existing = self._preload_existing(chunk)
+        natural = self._preload_natural(chunk)
+        boolean_fields = {
+            name for name, model_field in form_class.base_fields.items()
+            if isinstance(model_field, forms.BooleanField)
+        }
+
+        for number, row in chunk:
+            result.total += 1
+            key = self._row_key(row)
+            generated = self.spec.key == 'slug' and not str(row.get('slug') or '').strip()
+            base = key if generated else ''
+            if generated:
+                instance = self._match_natural(natural.get(key, ()))
+            else:
+                if key and key in seen_keys:
+                    self._error(result, number, self.spec.key, f'Duplicate {self.spec.key} "{key}" (also on row {seen_keys[key]}).')
+                    continue
+                if key:
+                    seen_keys[key] = number
+                instance = existing.get(key)
+                if instance is not None:
+                    self.matched.add(instance.pk)
+            if self.spec.key == 'id' and key and instance is None:
+                self._error(result, number, 'id', f'No {self.model._meta.verbose_name} with id {key}.')
+                continue
+
+            data = self._form_data(row, boolean_fields)
+            if self.spec.key == 'slug' and 'slug' in form_class.base_fields:
+                # Matched rows keep their slug; new ones get one allocated on write.
+                data['slug'] = instance.slug if generated and instance is not None else key
+            form = form_class(data=data, instance=instance)
+            for name, lookup_field in lookup_fields.items():
+                if name in form.fields:
+                    form.fields[name] = lookup_field
+
+            if not form.is_valid():
+                for name, messages in form.errors.items():
+                    for message in messages:
+                        self._error(result, number, name if name != '__all__' else '', message)
+                continue
+
+            obj = form.instance
+            if self.spec.key == 'slug' and not obj.slug:
+                obj.slug = key
+            if self.spec.prepare:
+                self.spec.prepare(obj)
+
+            if instance is None:
+                pending_create.append(obj)
+                if base:
+                    self.slug_bases.append((obj, base))
+                action = 'create'
+            else:
+                pending_update.append(obj)
+                action = 'update'
+            if len(result.preview) < PREVIEW_ROWS:
+                result.preview.append({'row': number, 'action': action, 'label': str(obj)})
+
+    def _row_key(self, row):
+        if self.spec.key == 'id':
+            return str(row.get('id') or '').strip()
+        slug = str(row.get('slug') or '').strip()
+        if not slug and self.spec.slug_from:
+            slug = self._natural_key(row.get(column) for column in self.spec.slug_from)
+        return slug
+
+    def _form_data(self, row, boolean_fields):
+        data = {}
+        for name, value in row.items():
+            if name in boolean_fields:
+                if str(value).strip().lower() in TRUE_VALUES:
+                    data[name] = 'on'
+                continue
+            data[name] = value.strip() if isinstance(value, str) else value
+        return data
+
+    def _preload_lookups(self, chunk):
+        """One query per foreign-key column for the whole chunk."""
+        fields = {}
+        form_fields = self.spec.form_class.base_fields
+        for column, (model, slug_field) in self.spec.lookups.items():
+            if column not in self.update_fields:
+                continue
+            slugs = {str(row[column]).strip() for _, row in chunk if row.get(column)}
+            mapping = {
+                getattr(obj, slug_field): obj
+                for obj in model.objects.filter(**{f'{slug_field}__in': slugs})
+            }
+            fields[column] = LookupField(mapping, model, required=form_fields[column].required)
+        return fields
+
+    def _preload_existing(self, chunk):
+        """Rows the chunk updates, keyed like ``_row_key``."""
+        keys = {key for key in (self._row_key(row) for _, row in chunk) if key}
+        if not keys:
+            return {}
+        if self.spec.key == 'id':
+            ids = [key for key in keys if key.isdigit()]
+            return {str(obj.pk): obj for obj in self.model.objects.filter(pk__in=ids)}
+        return {obj.slug: obj for obj in self.model.objects.filter(slug__in=keys)}
+
+    def _natural_key(self, values):
+        max_length = self.model._meta.get_field('slug').max_length
+        return slugs.slug_base(*values, max_length=max_length)
+
+    def _preload_natural(self, chunk):
+        """Existing rows sharing a natural key with the chunk's slug-less rows, oldest first."""
+        if self.spec.key != 'slug' or not self.spec.slug_from:
+            return {}
+        first = self.spec.slug_from[0]
+        values = {
+            str(row[first]).strip() for _, row in chunk
+            if row.get(first) and not str(row.get('slug') or '').strip()
+        }
+        if not values:
+            return {}
+        natural = {}
+        for obj in self.model.objects.filter(**{f'{first}__in': values}).order_by('pk'):
+            key = self._natural_key(getattr(obj, column) for column in self.spec.slug_from)
+            natural.setdefault(key, []).append(obj)
+        return natural
+
+    def _match_natural(self, candidates):
+        """The oldest of ``candidates`` no earlier row has matched, or ``None``."""
+        for obj in candidates:
+            if obj.pk not in self.matched:
+                self.matched.add(obj.pk)
+                return obj
+        return None
+
+    def _error(self, result, number, column, message):
+        # Keep validating so the count stays right, but cap the report.
+        result.error_count += 1
+        if len(result.errors) < MAX_ERRORS:
+            result.errors.append({'row': number, 'column': column, 'message': message})
+
+    def _write(self, pending_create, pending_update, result):
+        now = timezone.now()
+        update_fields = list(self.update_fields)
+        has_timestamp = any(f.name == 'updated_at' for f in self.model._meta.concrete_fields)
+        if has_timestamp:
+            update_fields.append('updated_at')
+            for obj in pending_update:
+                obj.updated_at = now
+
+        allocator = slugs.SlugAllocator(self.model)
+        for attempt in range(slugs.SLUG_RETRIES):
+            allocator.prefetch(base for _, base in self.slug_bases)
+            for obj, base in self.slug_bases:
+                obj.slug = allocator.allocate(base)
+            try:
+                with transaction.atomic():
+                    self.model.objects.bulk_create(pending_create, batch_size=CHUNK_SIZE)
+                    if pending_update and update_fields:
+                        updated_pks = [obj.pk for obj in pending_update]
+                        before = sync.visibility(self.model, updated_pks)
+                        self.model.objects.bulk_update(pending_update, update_fields, batch_size=CHUNK_SIZE)
+                        # Bulk writes send no post_save either: tombstone rows
+                        # the file unpublished and touch the rows embedding them.
+                        sync.bulk_written(self.model, updated_pks, before)
+                    # Bulk writes send no post_save, so refresh the search index here.
+                    index = search.SEARCH_INDEXES.get(self.model)
+                    if index:
+                        index.update_many(pending_create + pending_update)
+                    versions.bump(self.model)
+                break
+            except IntegrityError:
+                # Retry only when another process took one of the generated slugs.
+                generated = [obj.slug for obj, _ in self.slug_bases]
+                raced = self.model.objects.filter(slug__in=generated).exists()
+                if not raced or attempt == slugs.SLUG_RETRIES - 1:
+                    raise
+                allocator.forget()
+                for obj in pending_create:
+                    obj.pk = None
+        result.created = len(pending_create)
+        result.updated = len(pending_update)
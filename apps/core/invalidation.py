@@ -0,0 +1,203 @@
+"""
+Cross-worker invalidation for in-memory caches.
+
+Each worker keeps some content in memory (site settings and page sections,
+the typeahead index). A save clears those copies in the worker that made
+it, but every other worker and node must hear about it too. The content
+version ledger (``apps.core.versions``) is the shared record of what
+changed; this module delivers its changes to subscribers in every worker:
+
+* ``subscribe(models, callback)`` registers ``callback(labels)`` for changes
+  to ``models``.
+* In the writing worker, ``versions.bump()`` publishes the change at once
+  and again when the transaction commits.
+* Every other worker runs a bus thread (``start()``, called from
+  ``gunicorn.conf.py``). On PostgreSQL it ``LISTEN``s on a channel that
+  ``bump()`` ``NOTIFY``s in the writing transaction, so changes arrive as
+  soon as they commit. Elsewhere, and as a safety net for notifications lost
+  while reconnecting, it reads the ledger every
+  ``INVALIDATION_POLL_INTERVAL`` seconds and delivers the models whose
+  version moved.
+"""
+
+import logging
+import os
+import select
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections, transaction
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'aifa_content_changed'
+
+# label -> [(callback, local)]
+_subscribers = {}
+# label -> last version delivered in this worker
+_seen = {}
+_lock = threading.Lock()
+_started_pid = None
+
+
+def _label(model):
+    return model if isinstance(model, str) else model._meta.label_lower
+
+
+def subscribe(models, callback, local=True):
+    """
+    Call ``callback(labels)`` when any of ``models`` changes in any worker.
+
+    With ``local=False`` changes made by this worker are not delivered, for
+    subscribers that already apply their own writes.
+    """
+    for model in models:
+        _subscribers.setdefault(_label(model), []).append((callback, local))
+
+
+def _dispatch(labels, local):
+    callbacks = {}
+    for label in labels:
+        for callback, wants_local in _subscribers.get(label, ()):
+            if wants_local or not local:
+                callbacks.setdefault(callback, set()).add(label)
+    for callback, changed in callbacks.items():
+        try:
+            callback(changed)
+        except Exception:
+            logger.exception('Invalidation callback %r failed', callback)
+
+
+def publish(changed, using=DEFAULT_DB_ALIAS):
+    """
+    Deliver ``changed`` (``{label: new version}``) from the writing worker.
+
+    Called by ``versions.bump()`` inside the writing transaction.
+    """
+    if not changed:
+        return
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        # Sent by PostgreSQL when the transaction commits, never on rollback.
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [CHANNEL, ' '.join(changed)])
+
+    # At once, so this worker reads its own writes even inside the
+    # transaction, and again on commit, in case a concurrent request cached
+    # the old content in between.
+    _dispatch(changed, local=True)
+    transaction.on_commit(lambda: _committed(changed), using=using)
+
+
+def _committed(changed):
+    with _lock:
+        for label, version in changed.items():
+            # Only skip the poll for versions nobody else moved meanwhile.
+            if _seen.get(label, 0) == version - 1:
+                _seen[label] = version
+    _dispatch(changed, local=True)
+
+
+def poll():
+    """Deliver the models whose version moved since this worker last looked."""
+    from .models import ContentVersion
+    from .versions import EPOCH
+
+    current = dict(ContentVersion.objects.values_list('model', 'version'))
+    with _lock:
+        if _seen.get(EPOCH) not in (None, current.get(EPOCH)):
+            # A new ledger: its counters restarted, so anything may have changed.
+            changed = list(_subscribers)
+            _seen.clear()
+            _seen.update(current)
+        else:
+            changed = [label for label, version in current.items() if version > _seen.get(label, 0)]
+            for label in changed:
+                _seen[label] = current[label]
+    if changed:
+        _dispatch(changed, local=False)
+    return changed
+
+
+def _listen(interval):
+    """Wait for notifications on a dedicated connection (psycopg2), polling on each wakeup."""
+    wrapper = connections[DEFAULT_DB_ALIAS]
+    connection = wrapper.get_new_connection(wrapper.get_connection_params())
+    try:
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN {CHANNEL}')
+        while True:
+            # Also catches up on anything missed before LISTEN took effect.
+            close_old_connections()
+            poll()
+            if select.select([connection], [], [], interval) != ([], [], []):
+                connection.poll()
+                connection.notifies.clear()
+    finally:
+        connection.close()
+
+
+def _run(interval):
+    while True:
+        try:
+            if connections[DEFAULT_DB_ALIAS].vendor == 'postgresql':
+                _listen(interval)
+            else:
+                while True:
+                    time.sleep(interval)
+                    close_old_connections()
+                    poll()
+        except Exception:
+            logger.warning('Invalidation bus failed; retrying', exc_info=True)
+            time.sleep(interval)
+
+
+def start():
+    """Start this worker's bus thread (once per process)."""
+    global _started_pid
+    if _started_pid == os.getpid():
+        return
+    _started_pid = os.getpid()
+    from .models import ContentVersion
+
+    try:
+        # Caches built from here on are current; only later changes count.
+        with _lock:
+            _seen.update(ContentVersion.objects.values_list('model', 'version'))
+    except Exception:
+        logger.warning('Invalidation bus started without the current versions', exc_info=True)
+    finally:
+        close_old_connections()
+    thread = threading.Thread(
+        target=_run, args=(settings.INVALIDATION_POLL_INTERVAL,), name='invalidation-bus', daemon=True,
+    )
+    thread.start()
+
+
+_missing = object()
+
+
+class LocalCache:
+    """Values kept in this worker until one of ``models`` changes in any worker."""
+
+    def __init__(self, *models):
+        self._values = {}
+        self._generation = 0
+        subscribe(models, self.clear)
+
+    def get_or_set(self, key, load):
+        value = self._values.get(key, _missing)
+        if value is _missing:
+            generation = self._generation
+            value = load()
+            # Don't keep a value loaded while a change was being delivered.
+            if generation == self._generation:
+                self._values[key] = value
+        return value
+
+    def clear(self, labels=None):
+        self._generation += 1
+        self._values = {}
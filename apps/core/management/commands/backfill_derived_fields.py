@@ -0,0 +1,50 @@
+"""
+Management command to fill stored derived fields on existing rows.
+"""
+from itertools import chain
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.core import versions
+from apps.core.models import DerivedFieldsModel
+
+
+BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored derived fields (word count, reading time, plain text, ...) of every row'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            help='Only backfill this model, as app_label.ModelName (default: all)',
+        )
+
+    def handle(self, *args, **options):
+        models = [model for model in apps.get_models() if issubclass(model, DerivedFieldsModel)]
+        if options['model']:
+            models = [model for model in models if model._meta.label_lower == options['model'].lower()]
+
+        for model in models:
+            fields = list(model.derived_fields)
+            sources = set(chain.from_iterable(model.derived_fields.values()))
+            batch, total = [], 0
+            for obj in model.objects.only(*sources).order_by('pk').iterator(chunk_size=BATCH_SIZE):
+                obj.compute_derived_fields()
+                batch.append(obj)
+                if len(batch) == BATCH_SIZE:
+                    total += self._write(model, batch, fields)
+                    batch = []
+            total += self._write(model, batch, fields)
+            if total:
+                versions.bump(model)
+            self.stdout.write(self.style.SUCCESS(f'{model._meta.label}: {total} rows updated'))
+
+    def _write(self, model, batch, fields):
+        # bulk_update leaves updated_at alone; these are not content edits.
+        with transaction.atomic():
+            model.objects.bulk_update(batch, fields)
+        return len(batch)
@@ -0,0 +1,110 @@
+"""
+Management command to benchmark the SQLite cache backend against Django's
+LocMem and file-based caches.
+"""
+import multiprocessing
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+
+BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'filebased': 'django.core.cache.backends.filebased.FileBasedCache',
+    'sqlite': 'apps.core.sqlite_cache.SQLiteCache',
+}
+
+VALUE = {'title': 'Under 14 Academy', 'slug': 'under-14-academy', 'body': 'x' * 1000}
+
+
+def _make_cache(name, directory):
+    location = {
+        'locmem': f'benchmark-{name}',
+        'filebased': str(directory / 'files'),
+        'sqlite': str(directory / 'cache.sqlite3'),
+    }[name]
+    # Room for every key, so eviction does not skew the timings.
+    return import_string(BACKENDS[name])(location, {
+        'TIMEOUT': 300,
+        'OPTIONS': {'MAX_ENTRIES': 1_000_000, 'MAX_BYTES': 1024 ** 3},
+    })
+
+
+def _incr_worker(name, directory, count):
+    cache = _make_cache(name, directory)
+    for _ in range(count):
+        cache.incr('counter')
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the SQLite cache backend against LocMemCache and FileBasedCache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--operations', type=int, default=2000, help='Operations per measurement')
+        parser.add_argument('--processes', type=int, default=4, help='Processes for the shared counter test')
+        parser.add_argument('--backends', default=','.join(BACKENDS), help='Comma-separated backends to run')
+
+    def handle(self, *args, **options):
+        count = options['operations']
+        names = [name.strip() for name in options['backends'].split(',') if name.strip()]
+        directory = Path(tempfile.mkdtemp(prefix='cache-benchmark-'))
+        try:
+            self.stdout.write(f'{"":<14}' + ''.join(f'{name:>12}' for name in names) + '   (µs per operation)')
+            results = {name: self._measure(_make_cache(name, directory), count) for name in names}
+            for operation in next(iter(results.values())):
+                self.stdout.write(
+                    f'{operation:<14}' + ''.join(f'{results[name][operation]:>12.1f}' for name in names)
+                )
+            self.stdout.write('')
+            for name in names:
+                self._shared_counter(name, directory, options['processes'], count // 4)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _measure(self, cache, count):
+        keys = [f'key-{i}' for i in range(count)]
+        timings = {}
+
+        def timed(operation, run):
+            start = time.perf_counter()
+            run()
+            timings[operation] = (time.perf_counter() - start) / count * 1e6
+
+        timed('set', lambda: [cache.set(key, VALUE) for key in keys])
+        timed('get (hit)', lambda: [cache.get(key) for key in keys])
+        timed('get (miss)', lambda: [cache.get(f'missing-{key}') for key in keys])
+        timed('get_many(10)', lambda: [cache.get_many(keys[i:i + 10]) for i in range(count)])
+        timed('add (exists)', lambda: [cache.add(key, VALUE) for key in keys])
+        cache.set('counter', 0)
+        timed('incr', lambda: [cache.incr('counter') for _ in keys])
+        timed('delete', lambda: [cache.delete(key) for key in keys])
+        cache.clear()
+        return timings
+
+    def _shared_counter(self, name, directory, processes, count):
+        """Increment one key from several processes and check what the parent sees."""
+        cache = _make_cache(name, directory)
+        cache.set('counter', 0)
+        context = multiprocessing.get_context('fork')
+        workers = [
+            context.Process(target=_incr_worker, args=(name, directory, count)) for _ in range(processes)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        expected = processes * count
+        seen = cache.get('counter')
+        self.stdout.write(
+            f'{name:<10} {processes} processes x {count} incr: counter is {seen} of {expected} '
+            f'({"shared, no lost updates" if seen == expected else "not shared or updates lost"}), '
+            f'{elapsed:.2f}s'
+        )
+        cache.clear()
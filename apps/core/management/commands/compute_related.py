@@ -0,0 +1,30 @@
+"""
+Management command to recompute the related-content links.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.core.related import RELATED_COUNT, RELATED_FIELDS, compute
+
+
+class Command(BaseCommand):
+    help = 'Recompute related news, blog posts, programs and events (only items edited since the last run by default)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind', choices=sorted(RELATED_FIELDS),
+            help='Only recompute this content type (default: all)',
+        )
+        parser.add_argument(
+            '--full', action='store_true',
+            help='Recompute every item, not just the ones edited since the last run',
+        )
+        parser.add_argument(
+            '--top', type=int, default=RELATED_COUNT,
+            help=f'Related items stored per item (default: {RELATED_COUNT})',
+        )
+
+    def handle(self, *args, **options):
+        kinds = [options['kind']] if options['kind'] else list(RELATED_FIELDS)
+        for kind in kinds:
+            updated = compute(kind, full=options['full'], count=options['top'])
+            self.stdout.write(self.style.SUCCESS(f'{kind}: {updated} items updated'))
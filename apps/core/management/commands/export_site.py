@@ -0,0 +1,29 @@
+"""
+Management command to write a streaming backup of the whole site.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core import backup
+
+
+class Command(BaseCommand):
+    help = 'Export every model as JSON Lines and tar MEDIA_ROOT into a backup directory'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Directory to write the backup into')
+        parser.add_argument(
+            '--no-media',
+            action='store_true',
+            help='Skip MEDIA_ROOT and ARCHIVE_ROOT',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            backup.export_site(
+                options['output'],
+                include_media=not options['no_media'],
+                progress=self.stdout.write,
+            )
+        except backup.BackupError as exc:
+            raise CommandError(exc)
+        self.stdout.write(self.style.SUCCESS(f"Backup written to {options['output']}"))
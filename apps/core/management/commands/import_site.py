@@ -0,0 +1,35 @@
+"""
+Management command to restore a backup written by export_site.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core import backup
+
+
+class Command(BaseCommand):
+    help = 'Bulk-restore a backup directory written by export_site'
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', help='Backup directory to restore from')
+        parser.add_argument(
+            '--flush',
+            action='store_true',
+            help='Empty the target tables before restoring (otherwise they must be empty)',
+        )
+        parser.add_argument(
+            '--no-media',
+            action='store_true',
+            help='Restore database rows only',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            backup.import_site(
+                options['source'],
+                flush=options['flush'],
+                include_media=not options['no_media'],
+                progress=self.stdout.write,
+            )
+        except backup.BackupError as exc:
+            raise CommandError(exc)
+        self.stdout.write(self.style.SUCCESS(f"Restored {options['source']}"))
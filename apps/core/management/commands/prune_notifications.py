@@ -0,0 +1,15 @@
+"""
+Management command to delete old admin notifications.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core import notifications
+
+
+class Command(BaseCommand):
+    help = f'Delete admin notifications older than NOTIFICATION_RETENTION_DAYS ({settings.NOTIFICATION_RETENTION_DAYS} days)'
+
+    def handle(self, *args, **options):
+        deleted = notifications.prune()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} notifications deleted'))
@@ -0,0 +1,15 @@
+"""
+Management command to delete old delta-sync tombstones.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = f'Delete tombstones older than SYNC_TOMBSTONE_DAYS ({settings.SYNC_TOMBSTONE_DAYS} days)'
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} tombstones deleted'))
@@ -0,0 +1,27 @@
+"""
+Management command to rebuild the SQLite full-text search tables.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.core.search import SEARCH_INDEXES
+
+
+class Command(BaseCommand):
+    help = 'Repopulate the FTS5 search tables from their source tables (SQLite only)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            help='Only rebuild this model, as app_label.ModelName (default: all)',
+        )
+
+    def handle(self, *args, **options):
+        indexes = SEARCH_INDEXES.values()
+        if options['model']:
+            indexes = [index for index in indexes if index.model._meta.label_lower == options['model'].lower()]
+
+        for index in indexes:
+            if index.rebuild():
+                self.stdout.write(self.style.SUCCESS(f'{index.model._meta.label}: search index rebuilt'))
+            else:
+                self.stdout.write(f'{index.model._meta.label}: maintained by the database, nothing to do')
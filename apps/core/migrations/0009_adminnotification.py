@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_add_federation_logo_alt_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('message', 'Contact Message'), ('inquiry', 'Inquiry'), ('registration', 'Event Registration')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('url', models.CharField(blank=True, max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Admin Notification',
+                'verbose_name_plural': 'Admin Notifications',
+                'ordering': ['-id'],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_adminnotification'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20)),
+                ('source_id', models.PositiveBigIntegerField()),
+                ('target_id', models.PositiveBigIntegerField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Related Link',
+                'verbose_name_plural': 'Related Links',
+                'ordering': ['kind', 'source_id', 'rank'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='relatedlink',
+            constraint=models.UniqueConstraint(fields=('kind', 'source_id', 'rank'), name='core_related_link_uniq'),
+        ),
+    ]
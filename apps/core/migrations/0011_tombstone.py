@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_related_links'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('key', models.CharField(help_text='Slug (or id) the object was served under', max_length=220)),
+                ('deleted_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Tombstone',
+                'verbose_name_plural': 'Tombstones',
+                'ordering': ['deleted_at', 'id'],
+                'indexes': [models.Index(fields=['deleted_at', 'id'], name='core_tombstone_deleted_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_tombstone'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text="Model label, e.g. 'programs.program'", max_length=100, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('changed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Content Version',
+                'verbose_name_plural': 'Content Versions',
+                'ordering': ['model'],
+            },
+        ),
+    ]
@@ -2,8 +2,12 @@
 Core app models - Site settings and base models.
 """
 
-from django.db import models
-from django.utils.text import slugify
+import copy
+
+from django.db import IntegrityError, models, transaction
+
+from . import derived, invalidation, slugs
+from .querycache import CachingQuerySet
 
 
 class TimeStampedModel(models.Model):
@@ -12,10 +16,88 @@ class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CachingQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
 
+class DerivedFieldsModel(models.Model):
+    """
+    Abstract base for models that store values derived from their content.
+
+    ``derived_fields`` maps each stored column to the fields it is computed
+    from. ``compute_derived_fields()`` (using the helpers in
+    ``apps.core.derived``) runs on save, so reads are a plain column access.
+    Rows written without ``save()`` are filled by the
+    ``backfill_derived_fields`` command; rows that predate a derived column
+    are filled by a data migration next to the one adding it.
+    """
+
+    derived_fields = {}
+
+    class Meta:
+        abstract = True
+
+    def compute_derived_fields(self):
+        """Set each column in ``derived_fields`` from its sources; subclasses override this."""
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.compute_derived_fields()
+        else:
+            update_fields = set(update_fields)
+            stale = {name for name, sources in self.derived_fields.items() if update_fields.intersection(sources)}
+            if stale:
+                self.compute_derived_fields()
+                kwargs['update_fields'] = update_fields | stale
+        super().save(*args, **kwargs)
+
+
+class UniqueSlugModel(models.Model):
+    """
+    Abstract base for models with a unique ``slug`` filled in on save.
+
+    A blank slug is built from the ``slug_from`` fields and made unique with
+    ``apps.core.slugs``. If another process takes the same slug before the
+    insert, the slug is allocated again and the save retried.
+    """
+
+    slug_from = ()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self.slug:
+            return super().save(*args, **kwargs)
+        base = slugs.slug_base(*(getattr(self, name) for name in self.slug_from))
+        for attempt in range(slugs.SLUG_RETRIES):
+            self.slug = slugs.unique_slug(type(self), base, exclude=self.pk)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                taken = type(self)._default_manager.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                if not taken or attempt == slugs.SLUG_RETRIES - 1:
+                    self.slug = ''
+                    raise
+
+
+# Site settings and page content are read on nearly every request, so each
+# worker keeps them until they are edited (through any worker).
+_page_content = invalidation.LocalCache(
+    'core.sitesettings', 'core.pagesettings', 'core.aboutpagecontent',
+    'core.homepagecontent', 'core.communitypagecontent',
+)
+
+
+def _cached_content(key, load):
+    # A copy, so callers (admin forms) can change it without touching the cache.
+    return copy.copy(_page_content.get_or_set(key, load))
+
+
 class SiteSettings(models.Model):
     """Singleton model for site-wide settings."""
 
@@ -71,8 +153,7 @@ class SiteSettings(models.Model):
 
     @classmethod
     def get_settings(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
+        return _cached_content('site_settings', lambda: cls.objects.get_or_create(pk=1)[0])
 
 
 class PageSettings(TimeStampedModel):
@@ -135,8 +216,9 @@ class PageSettings(TimeStampedModel):
     @classmethod
     def get_for_page(cls, page_type):
         """Get or create settings for a specific page."""
-        obj, _ = cls.objects.get_or_create(page_type=page_type)
-        return obj
+        return _cached_content(
+            ('page_settings', page_type), lambda: cls.objects.get_or_create(page_type=page_type)[0]
+        )
 
 
 class AboutPageContent(models.Model):
@@ -210,8 +292,7 @@ class AboutPageContent(models.Model):
     @classmethod
     def get_content(cls):
         """Get or create the about page content."""
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
+        return _cached_content('about_page', lambda: cls.objects.get_or_create(pk=1)[0])
 
     def get_values_list(self):
         """Return core values as a list, with defaults if empty."""
@@ -237,7 +318,7 @@ class AboutPageContent(models.Model):
         return {**defaults, **self.statistics}
 
 
-class BoardMember(TimeStampedModel):
+class BoardMember(UniqueSlugModel, TimeStampedModel):
     """Board of Directors member for About page."""
 
     first_name = models.CharField(max_length=50)
@@ -251,6 +332,8 @@ class BoardMember(TimeStampedModel):
     show_on_website = models.BooleanField(default=True)
     display_order = models.PositiveIntegerField(default=0)
 
+    slug_from = ('first_name', 'last_name')
+
     class Meta:
         ordering = ['display_order', 'first_name']
         verbose_name = "Board Member"
@@ -263,13 +346,16 @@ class BoardMember(TimeStampedModel):
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(f"{self.first_name}-{self.last_name}")
-        super().save(*args, **kwargs)
+
+class CommunityActivityQuerySet(CachingQuerySet):
+    def cards(self):
+        """Only the columns activity cards render."""
+        return self.only(
+            'title', 'slug', 'category', 'image', 'date', 'location', 'beneficiaries', 'is_featured',
+        ).annotate(card_summary=derived.summary('short_description', 'description'))
 
 
-class CommunityActivity(TimeStampedModel):
+class CommunityActivity(UniqueSlugModel, TimeStampedModel):
     """Community outreach and charity activities."""
 
     class Category(models.TextChoices):
@@ -293,6 +379,10 @@ class CommunityActivity(TimeStampedModel):
     show_on_website = models.BooleanField(default=True)
     display_order = models.PositiveIntegerField(default=0)
 
+    slug_from = ('title',)
+
+    objects = CommunityActivityQuerySet.as_manager()
+
     class Meta:
         ordering = ['-date', 'display_order']
         verbose_name = "Community Activity"
@@ -301,11 +391,6 @@ class CommunityActivity(TimeStampedModel):
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
-
 
 class CommunityPageContent(models.Model):
     """Singleton model for Community page content."""
@@ -352,8 +437,7 @@ class CommunityPageContent(models.Model):
 
     @classmethod
     def get_content(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
+        return _cached_content('community_page', lambda: cls.objects.get_or_create(pk=1)[0])
 
 
 class HomepageContent(models.Model):
@@ -440,8 +524,7 @@ class HomepageContent(models.Model):
     @classmethod
     def get_content(cls):
         """Get or create the homepage content."""
-        obj, _ = cls.objects.get_or_create(pk=1)
-        return obj
+        return _cached_content('homepage', lambda: cls.objects.get_or_create(pk=1)[0])
 
     def get_marquee_items(self):
         """Return marquee items with defaults if empty."""
@@ -466,3 +549,102 @@ class HomepageContent(models.Model):
                 {"icon": "trophy", "text": "Proven Track Record"},
             ]
         return self.about_section_features
+
+
+class AdminNotification(models.Model):
+    """
+    Feed entry announcing a new submission to dashboard staff.
+
+    The auto-incrementing primary key doubles as the feed version: clients
+    poll with the last ID they have seen and receive only newer entries.
+    Pruned by ``prune_notifications``.
+    """
+
+    class Kind(models.TextChoices):
+        MESSAGE = 'message', 'Contact Message'
+        INQUIRY = 'inquiry', 'Inquiry'
+        REGISTRATION = 'registration', 'Event Registration'
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=200)
+    url = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-id']
+        verbose_name = "Admin Notification"
+        verbose_name_plural = "Admin Notifications"
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.title}"
+
+
+class RelatedLink(models.Model):
+    """
+    One precomputed "related content" edge: ``target_id`` is the ``rank``-th
+    most similar item to ``source_id`` among items of the same ``kind``.
+
+    Written by the ``compute_related`` command (see ``apps.core.related``).
+    """
+
+    kind = models.CharField(max_length=20)
+    source_id = models.PositiveBigIntegerField()
+    target_id = models.PositiveBigIntegerField()
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['kind', 'source_id', 'rank']
+        verbose_name = "Related Link"
+        verbose_name_plural = "Related Links"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'source_id', 'rank'], name='core_related_link_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.source_id} -> {self.target_id}"
+
+
+class Tombstone(models.Model):
+    """
+    Record of a deleted API object, so delta-sync clients learn about
+    deletions (see ``apps.core.sync``). Pruned by ``prune_tombstones``.
+    """
+
+    resource = models.CharField(max_length=20)
+    object_id = models.PositiveBigIntegerField()
+    key = models.CharField(max_length=220, help_text="Slug (or id) the object was served under")
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['deleted_at', 'id']
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='core_tombstone_deleted_idx'),
+        ]
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
+
+    def __str__(self):
+        return f"{self.resource} {self.key} deleted {self.deleted_at}"
+
+
+class ContentVersion(models.Model):
+    """
+    Change counter for one model, bumped whenever one of its rows is written
+    (see ``apps.core.versions``). Cache keys built from these counters change
+    as soon as the content behind them does, in every worker.
+    """
+
+    model = models.CharField(max_length=100, unique=True, help_text="Model label, e.g. 'programs.program'")
+    version = models.PositiveBigIntegerField(default=0)
+    changed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['model']
+        verbose_name = "Content Version"
+        verbose_name_plural = "Content Versions"
+
+    def __str__(self):
+        return f"{self.model} v{self.version}"
@@ -0,0 +1,114 @@
+"""
+Admin notification feed.
+
+New submissions append an ``AdminNotification`` row. The feed version is
+``<newest notification ID>.<submission writes>``, where the second part is
+the sum of the content versions (``apps.core.versions``) of the submission
+models, so marking a message read moves it too and badge counts drop.
+The version is cached until a submission is written; polling clients send
+the version they last saw and, when nothing changed, the check is a single
+cache read.
+
+Notifications older than ``NOTIFICATION_RETENTION_DAYS`` are deleted by the
+``prune_notifications`` command; the newest ``NOTIFICATION_FEED_LIMIT`` are
+always kept, so the feed and its version survive a quiet spell.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from django.urls import reverse
+from django.utils import timezone
+
+from . import versions
+from .models import AdminNotification
+
+
+NOTIFICATION_VERSION_CACHE_KEY = 'notifications:version'
+NOTIFICATION_VERSION_TIMEOUT = 10  # seconds; bounds staleness across workers
+NOTIFICATION_FEED_LIMIT = 20
+
+# Models whose rows are counted in the badges; tracked in the ledger.
+FEED_MODELS = ('contact.contactmessage', 'contact.inquiry', 'events.eventregistration')
+
+
+def current_version():
+    """Return the feed version (``'0.0'`` when nothing was ever submitted)."""
+    version = cache.get(NOTIFICATION_VERSION_CACHE_KEY)
+    if version is None:
+        latest = AdminNotification.objects.aggregate(latest=Max('id'))['latest'] or 0
+        ledger = versions.current()
+        writes = sum(ledger.get(model, 0) for model in FEED_MODELS)
+        version = f'{latest}.{writes}'
+        cache.set(NOTIFICATION_VERSION_CACHE_KEY, version, NOTIFICATION_VERSION_TIMEOUT)
+    return version
+
+
+def latest_id(version):
+    """Return the newest notification ID in a feed version (0 when malformed)."""
+    try:
+        return max(0, int(str(version).partition('.')[0]))
+    except ValueError:
+        return 0
+
+
+def invalidate_version():
+    """Drop the cached version once the current transaction commits."""
+    transaction.on_commit(lambda: cache.delete(NOTIFICATION_VERSION_CACHE_KEY))
+
+
+def get_feed(since, limit=NOTIFICATION_FEED_LIMIT):
+    """Return notifications newer than ``since``, newest first."""
+    return list(AdminNotification.objects.filter(id__gt=since).order_by('-id')[:limit])
+
+
+def prune():
+    """Delete notifications past ``NOTIFICATION_RETENTION_DAYS``; returns the number deleted."""
+    cutoff = timezone.now() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    kept = AdminNotification.objects.order_by('-id').values_list('id', flat=True)[NOTIFICATION_FEED_LIMIT - 1:NOTIFICATION_FEED_LIMIT]
+    deleted, _ = AdminNotification.objects.filter(created_at__lt=cutoff, id__lt=kept).delete()
+    return deleted
+
+
+def notify(kind, object_id, title, url=''):
+    """Append a notification to the feed."""
+    notification = AdminNotification.objects.create(
+        kind=kind,
+        object_id=object_id,
+        title=title[:200],
+        url=url,
+    )
+    return notification
+
+
+def notify_message(message):
+    notify(
+        AdminNotification.Kind.MESSAGE,
+        message.pk,
+        f"{message.name}: {message.subject}",
+        reverse('admin_dashboard:messages:detail', args=[message.pk]),
+    )
+
+
+def notify_inquiry(inquiry):
+    title = inquiry.student_name
+    if inquiry.program_id:
+        title = f"{title} ({inquiry.program.name})"
+    notify(
+        AdminNotification.Kind.INQUIRY,
+        inquiry.pk,
+        title,
+        reverse('admin_dashboard:inquiries:detail', args=[inquiry.pk]),
+    )
+
+
+def notify_registration(registration):
+    notify(
+        AdminNotification.Kind.REGISTRATION,
+        registration.pk,
+        f"{registration.participant_name} registered for {registration.event.title}",
+        reverse('admin_dashboard:events:registration-detail', args=[registration.pk]),
+    )
@@ -0,0 +1,208 @@
+"""
+Keyset (seek) pagination for large admin tables.
+
+OFFSET pagination gets slower the deeper you page and needs an exact
+``COUNT(*)`` on every request. Keyset pagination instead remembers the sort
+key of the last row shown and asks for rows "after" it, so every page costs
+the same index range scan. Totals are approximate and cached.
+"""
+
+import base64
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import Q
+
+
+APPROXIMATE_COUNT_TIMEOUT = 300  # seconds
+# Below this many rows an exact COUNT is cheap enough to run.
+EXACT_COUNT_THRESHOLD = 10000
+
+
+def approximate_count(queryset):
+    """
+    Return a cached, possibly approximate row count for ``queryset``.
+
+    Unfiltered querysets on PostgreSQL read the planner estimate from
+    ``pg_class.reltuples``; everything else falls back to an exact COUNT that
+    is cached for a few minutes.
+    """
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    digest = hashlib.md5(f'{sql}|{params}'.encode()).hexdigest()
+    cache_key = f'approx_count:{digest}'
+
+    total = cache.get(cache_key)
+    if total is not None:
+        return total
+
+    total = None
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql' and not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 for never-analyzed tables; small tables get exact counts.
+        if row and row[0] >= EXACT_COUNT_THRESHOLD:
+            total = row[0]
+    if total is None:
+        total = queryset.count()
+
+    cache.set(cache_key, total, APPROXIMATE_COUNT_TIMEOUT)
+    return total
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    """A page of results plus the cursors for its neighbours."""
+
+    is_keyset = True
+
+    def __init__(self, object_list, has_next, has_previous, next_url, previous_url, first_url, approximate_total):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_url = next_url
+        self.previous_url = previous_url
+        self.first_url = first_url
+        self.approximate_total = approximate_total
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginationMixin:
+    """
+    Drop-in replacement for ``ListView`` pagination using a seek cursor.
+
+    ``keyset_ordering`` lists the sort key, most significant first, and must
+    end in a unique field (normally ``id``) so the order is total. Prefix a
+    field with ``-`` for descending order. Annotations (e.g. ``search_rank``)
+    may be used as sort keys too.
+    """
+
+    keyset_ordering = ('-created_at', '-id')
+    cursor_param = 'cursor'
+
+    def get_keyset_ordering(self):
+        return self.keyset_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        ordering = self.get_keyset_ordering()
+        try:
+            direction, values = self.decode_cursor(self.request.GET.get(self.cursor_param), ordering, queryset)
+        except InvalidCursor:
+            direction, values = 'next', None
+
+        total = approximate_count(queryset)
+
+        if direction == 'previous':
+            seek_ordering = [self._flip(field) for field in ordering]
+        else:
+            seek_ordering = list(ordering)
+        queryset = queryset.order_by(*seek_ordering)
+        if values is not None:
+            queryset = queryset.filter(self._seek_filter(seek_ordering, values))
+
+        rows = list(queryset[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if direction == 'previous':
+            rows.reverse()
+            has_next, has_previous = values is not None, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        page = KeysetPage(
+            object_list=rows,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_url=self._page_url('next', rows[-1], ordering) if has_next and rows else None,
+            previous_url=self._page_url('previous', rows[0], ordering) if has_previous and rows else None,
+            first_url=self._page_url(None, None, ordering),
+            approximate_total=total,
+        )
+        return None, page, rows, page.has_other_pages()
+
+    # Cursor encoding
+
+    def encode_cursor(self, direction, obj, ordering):
+        values = [self._field_value(obj, field.lstrip('-')) for field in ordering]
+        payload = json.dumps([direction, values], default=str)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor, ordering, queryset=None):
+        if not cursor:
+            return 'next', None
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            direction, raw_values = json.loads(base64.urlsafe_b64decode(padded))
+        except (ValueError, TypeError):
+            raise InvalidCursor(cursor)
+        if direction not in ('next', 'previous') or len(raw_values) != len(ordering):
+            raise InvalidCursor(cursor)
+
+        values = []
+        for field_name, raw in zip(ordering, raw_values):
+            field = self._get_field(queryset, field_name.lstrip('-'))
+            try:
+                values.append(field.to_python(raw))
+            except Exception:
+                raise InvalidCursor(cursor)
+        return direction, values
+
+    # Helpers
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    def _get_field(self, queryset, name):
+        """Resolve a model field or an annotation such as a search rank."""
+        if queryset is not None and name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        return self.model._meta.get_field(name)
+
+    @staticmethod
+    def _field_value(obj, name):
+        if name in ('id', 'pk'):
+            return obj.pk
+        return getattr(obj, name)
+
+    @staticmethod
+    def _seek_filter(ordering, values):
+        """Build ``(a, b) < (x, y)`` style row comparison from simple lookups."""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _page_url(self, direction, obj, ordering):
+        params = self.request.GET.copy()
+        params.pop(self.cursor_param, None)
+        params.pop('page', None)
+        if direction:
+            params[self.cursor_param] = self.encode_cursor(direction, obj, ordering)
+        query = params.urlencode()
+        return f'?{query}' if query else '?'
@@ -0,0 +1,127 @@
+"""
+Query result cache for repeated public querysets.
+
+``Model.objects.cached().filter(...)`` (on managers built from
+``CachingQuerySet``) stores the rows of the queryset in the default cache
+and serves later evaluations of the same query from there. The key is made
+of the SQL and its parameters plus the content versions
+(``apps.core.versions``) of every model whose table the query reads: its
+own, the joins in its ``alias_map`` (``select_related``, related-field
+filters) and those of its subqueries. Any save or delete of one of those
+models makes the entry unreachable; stale entries are evicted by the
+cache's own LRU.
+
+Rows are cached before ``prefetch_related`` runs, so prefetched relations
+are still loaded on every evaluation. Results larger than
+``QUERY_CACHE_MAX_ENTRY_BYTES`` are not cached, and neither are queries
+reading a model that is not versioned (see ``versions.VERSIONED_MODELS``),
+auto-created many-to-many tables included, or a table no model owns;
+those always run against the database.
+"""
+
+import hashlib
+import pickle
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models.sql import Query
+
+
+_models = None
+
+
+def _models_by_table():
+    global _models
+    if _models is None:
+        _models = {model._meta.db_table: model for model in apps.get_models(include_auto_created=True)}
+    return _models
+
+
+def _tables(query):
+    """Names of the tables ``query`` reads: its own, joins and subqueries."""
+    tables = {query.get_meta().db_table}
+    tables.update(join.table_name for join in query.alias_map.values())
+    for combined in query.combined_queries:
+        tables |= _tables(combined)
+    expressions = [query.where, *query.annotations.values()]
+    while expressions:
+        expression = expressions.pop()
+        if isinstance(expression, Query):
+            tables |= _tables(expression)
+        elif isinstance(getattr(expression, 'query', None), Query):
+            # Subquery and Exists.
+            tables |= _tables(expression.query)
+        elif hasattr(expression, 'get_source_expressions'):
+            expressions.extend(expression.get_source_expressions())
+    return tables
+
+
+def _key(queryset):
+    """Cache key for the rows of ``queryset``, or ``None`` when it can't be cached."""
+    from . import versions
+
+    query = queryset.query.chain()
+    sql, params = query.get_compiler(using=queryset.db).as_sql()
+    models_by_table = _models_by_table()
+    read = {queryset.model}
+    for table in _tables(query):
+        if table not in models_by_table:
+            return None
+        read.add(models_by_table[table])
+    labels = sorted(versions.label(model) for model in read)
+    # Versions are only kept current for models tracked in every process
+    # (at startup), so a model tracked later could change unnoticed.
+    if not versions.tracked.issuperset(labels):
+        return None
+    digest = hashlib.md5(
+        repr((queryset.db, queryset._iterable_class.__name__, sql, params)).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'querycache:{versions.label(queryset.model)}:{digest}:{versions.token(*labels)}'
+
+
+def fetch(queryset):
+    """The rows of ``queryset``, from the cache when possible."""
+    key = _key(queryset)
+    if key is None:
+        return list(queryset._iterable_class(queryset))
+    data = cache.get(key)
+    if data is not None:
+        return pickle.loads(data)
+    rows = list(queryset._iterable_class(queryset))
+    data = pickle.dumps(rows, pickle.HIGHEST_PROTOCOL)
+    if len(data) <= settings.QUERY_CACHE_MAX_ENTRY_BYTES:
+        cache.set(key, data, queryset._cache_timeout)
+    return rows
+
+
+class CachingQuerySet(models.QuerySet):
+    """QuerySet with ``cached()``."""
+
+    _cache_timeout = None
+    _cache_results = False
+
+    def cached(self, timeout=None):
+        """
+        Serve this queryset's rows from the query cache.
+
+        Entries are dropped by content changes, so ``timeout`` (default
+        ``QUERY_CACHE_TIMEOUT``) only bounds how long unused ones linger.
+        """
+        clone = self._chain()
+        clone._cache_results = True
+        clone._cache_timeout = settings.QUERY_CACHE_TIMEOUT if timeout is None else timeout
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._cache_results = self._cache_results
+        clone._cache_timeout = self._cache_timeout
+        return clone
+
+    def _fetch_all(self):
+        if self._result_cache is None and self._cache_results:
+            self._result_cache = fetch(self)
+        super()._fetch_all()
@@ -0,0 +1,170 @@
+"""
+Precomputed "related content" for news, blog posts, programs and events.
+
+``compute`` builds TF-IDF vectors over each item's title, summary and body
+(title words count most), finds the most similar items of the same kind by
+cosine similarity and stores them as ``RelatedLink`` rows. Detail pages then
+read their related items with one indexed query instead of guessing.
+
+Runs are incremental: only items edited since the previous run are
+recomputed, together with the items they are now most similar to, and
+items whose related list points at something no longer published. Term
+weights drift slowly as content is added; ``--full`` recomputes everything.
+
+``compute_related`` runs after migrations on every deploy (``release.sh``);
+schedule it as well to pick up edits made between deploys.
+"""
+
+import math
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Max, OuterRef, Subquery
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from .models import RelatedLink
+from .search import TOKEN_RE
+from .site_search import SEARCH_SOURCES
+
+
+RELATED_COUNT = 6
+# Only the strongest terms of each item are matched, which keeps the
+# similarity pass fast without changing the top results.
+MAX_TERMS = 40
+
+# kind -> {field: weight}; kinds are keys of ``SEARCH_SOURCES``.
+RELATED_FIELDS = {
+    'news': {'title': 3, 'excerpt': 2, 'plain_text': 1},
+    'blog': {'title': 3, 'excerpt': 2, 'plain_text': 1},
+    'programs': {'name': 3, 'short_description': 2, 'description': 1},
+    'events': {'title': 3, 'short_description': 2, 'description': 1},
+}
+
+STOP_WORDS = frozenset("""
+    about after again also among and any are because been before being between both but
+    can could did does doing down during each few for from further had has have having her
+    here hers him his how into its just more most new not now off once only other our ours
+    out over own same she should some such than that the their theirs them then there these
+    they this those through too under until very was were what when where which while who
+    whom why will with would you your yours
+""".split())
+
+
+def tokenize(text):
+    return [
+        word for word in TOKEN_RE.findall(strip_tags(text or '').lower())
+        if len(word) > 2 and not word.isdigit() and word not in STOP_WORDS
+    ]
+
+
+def _term_counts(values, fields):
+    counts = Counter()
+    for field, weight in fields.items():
+        for word in tokenize(values[field]):
+            counts[word] += weight
+    return counts
+
+
+def _vectors(documents):
+    """L2-normalised TF-IDF vectors (sublinear TF) for ``{pk: Counter}``."""
+    document_frequency = Counter()
+    for counts in documents.values():
+        document_frequency.update(counts.keys())
+    total = len(documents)
+
+    vectors = {}
+    for pk, counts in documents.items():
+        weights = {
+            term: (1 + math.log(count)) * math.log((1 + total) / (1 + document_frequency[term]))
+            for term, count in counts.items()
+        }
+        strongest = sorted(weights.items(), key=lambda item: item[1], reverse=True)[:MAX_TERMS]
+        norm = math.sqrt(sum(weight * weight for _, weight in strongest))
+        if norm:
+            vectors[pk] = {term: weight / norm for term, weight in strongest}
+    return vectors
+
+
+def _most_similar(pk, vectors, postings, count):
+    scores = defaultdict(float)
+    for term, weight in vectors.get(pk, {}).items():
+        for other, other_weight in postings[term]:
+            if other != pk:
+                scores[other] += weight * other_weight
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:count]
+
+
+def compute(kind, full=False, count=RELATED_COUNT):
+    """
+    Recompute related links for ``kind``; returns the number of items updated.
+
+    Items edited after the previous run (by ``updated_at``) are recomputed;
+    with ``full`` every item is.
+    """
+    source = SEARCH_SOURCES[kind]
+    fields = RELATED_FIELDS[kind]
+    started = timezone.now()
+
+    documents, updated = {}, {}
+    for pk, updated_at, *values in source.queryset().values_list('pk', 'updated_at', *fields).iterator():
+        documents[pk] = _term_counts(dict(zip(fields, values)), fields)
+        updated[pk] = updated_at
+
+    vectors = _vectors(documents)
+    postings = defaultdict(list)
+    for pk, vector in vectors.items():
+        for term, weight in vector.items():
+            postings[term].append((pk, weight))
+
+    links = RelatedLink.objects.filter(kind=kind)
+    existing = defaultdict(set)
+    for source_id, target_id in links.values_list('source_id', 'target_id').iterator():
+        existing[source_id].add(target_id)
+
+    last_run = None if full else links.aggregate(last=Max('computed_at'))['last']
+    if last_run is None:
+        dirty = set(documents)
+    else:
+        dirty = {pk for pk, updated_at in updated.items() if updated_at > last_run}
+        # Lists pointing at items that were unpublished or deleted.
+        dirty |= {pk for pk, targets in existing.items() if pk in documents and targets - documents.keys()}
+
+    results = {pk: _most_similar(pk, vectors, postings, count) for pk in dirty}
+    # An edited item may now belong in the lists of the items it resembles.
+    for pk in list(results):
+        for other, _ in results[pk]:
+            if other not in results:
+                results[other] = _most_similar(other, vectors, postings, count)
+
+    stale = [pk for pk in existing if pk not in documents]
+    with transaction.atomic():
+        links.filter(source_id__in=stale).delete()
+        links.filter(source_id__in=list(results)).delete()
+        RelatedLink.objects.bulk_create(
+            [
+                RelatedLink(kind=kind, source_id=pk, target_id=other, rank=rank, score=score, computed_at=started)
+                for pk, similar in results.items()
+                for rank, (other, score) in enumerate(similar)
+            ],
+            batch_size=1000,
+        )
+    return len(results)
+
+
+def related_to(kind, obj, queryset=None, limit=3):
+    """
+    Items related to ``obj``, most similar first, in a single query.
+
+    Only items still visible on the public site are returned; ``queryset``
+    narrows that further or adds ``select_related``.
+    """
+    if queryset is None:
+        queryset = SEARCH_SOURCES[kind].queryset()
+    links = RelatedLink.objects.filter(kind=kind, source_id=obj.pk)
+    return (
+        queryset
+        .filter(pk__in=links.values('target_id'))
+        .annotate(related_rank=Subquery(links.filter(target_id=OuterRef('pk')).values('rank')[:1]))
+        .order_by('related_rank')[:limit]
+    )
@@ -0,0 +1,251 @@
+"""
+Indexed full-text search for model tables.
+
+Each searchable model declares its indexed columns and their weights as
+``search_fields`` and is registered in ``apps.core.site_search``. The
+backend-specific index is created by its app's migrations
+(``apps.core.db.create_search_index``):
+
+* PostgreSQL: generated ``search_vector`` (weighted tsvector, GIN index) and
+  ``search_document`` (plain text, trigram GIN index) columns on the table
+  itself, so the database keeps them current on every write.
+* SQLite: an FTS5 table named ``<db_table>_fts`` keyed by the row id, kept in
+  sync by the signal handlers registered here.
+
+Other backends fall back to ``icontains`` lookups. ``SearchIndex.search``
+returns the queryset filtered to matches and annotated with ``search_rank``
+(higher is better) so it can be ordered and keyset-paginated like any field.
+``SearchIndex.snippets`` returns highlighted excerpts for a page of results.
+"""
+
+import re
+
+from django.db import connections, router
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+
+# tsvector weight -> relative importance, matching PostgreSQL's ts_rank defaults.
+WEIGHTS = {'A': 1.0, 'B': 0.4, 'C': 0.2, 'D': 0.1}
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+# Highlight markers used inside the database snippet functions. Control
+# characters never occur in indexed text, so the snippet can be escaped as
+# a whole and the markers swapped for <mark> tags afterwards.
+MARK_START = '\x02'
+MARK_END = '\x03'
+SNIPPET_WORDS = 24
+
+SEARCH_INDEXES = {}
+
+
+class SearchIndex:
+    """
+    Full-text index over ``fields`` of ``model``.
+
+    ``fields`` maps field names to a weight letter (``'A'`` .. ``'D'``); the
+    order must match the columns created by the migration.
+    """
+
+    def __init__(self, model, fields):
+        self.model = model
+        self.fields = dict(fields)
+        self.table = model._meta.db_table
+        self.fts_table = f'{self.table}_fts'
+
+    def __repr__(self):
+        return f'<SearchIndex {self.model._meta.label}>'
+
+    def vendor(self, using=None):
+        using = using or router.db_for_read(self.model)
+        return connections[using].vendor
+
+    # Querying
+
+    def search(self, queryset, term):
+        """Filter ``queryset`` to rows matching ``term`` and annotate ``search_rank``."""
+        tokens = TOKEN_RE.findall(term or '')
+        if not tokens:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField())).none()
+
+        vendor = self.vendor(queryset.db)
+        if vendor == 'postgresql':
+            return self._search_postgresql(queryset, term.strip())
+        if vendor == 'sqlite':
+            return self._search_sqlite(queryset, tokens)
+
+        condition = Q()
+        for field in self.fields:
+            condition |= Q(**{f'{field}__icontains': term.strip()})
+        return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    def _search_postgresql(self, queryset, term):
+        qn = connections[queryset.db].ops.quote_name
+        vector = f'{qn(self.table)}.{qn("search_vector")}'
+        document = f'{qn(self.table)}.{qn("search_document")}'
+        pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+        # The ILIKE branch is served by the trigram index and catches partial
+        # words, e-mail fragments and phone numbers the tsquery misses.
+        matches = RawSQL(
+            f"({vector} @@ websearch_to_tsquery('simple', %s) OR {document} ILIKE %s)",
+            [term, pattern],
+            output_field=BooleanField(),
+        )
+        rank = RawSQL(
+            f"(ts_rank({vector}, websearch_to_tsquery('simple', %s)) + word_similarity(%s, {document}))",
+            [term, term],
+            output_field=FloatField(),
+        )
+        return queryset.filter(matches).annotate(search_rank=rank)
+
+    def _search_sqlite(self, queryset, tokens):
+        qn = connections[queryset.db].ops.quote_name
+        fts = qn(self.fts_table)
+        weights = ', '.join(str(WEIGHTS[weight]) for weight in self.fields.values())
+        match = self._fts_match(tokens)
+
+        matches = RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [match])
+        # bm25() only runs inside a MATCH query, so the rank is a subquery on
+        # the row's id, which FTS5 answers by seeking to it in each doclist.
+        # It is lower-is-better, so negate it to rank like ts_rank.
+        rank = RawSQL(
+            f'(SELECT -bm25({fts}, {weights}) FROM {fts} '
+            f'WHERE {fts} MATCH %s AND {fts}.rowid = {qn(self.table)}.{qn("id")})',
+            [match],
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank)
+
+    def _fts_match(self, tokens):
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    # Snippets
+
+    def snippets(self, term, pks, using=None):
+        """
+        Return ``{pk: snippet}`` for the rows ``pks`` that match ``term``.
+
+        Snippets are HTML-safe with the matched words wrapped in ``<mark>``.
+        Meant for a page of results; only those rows are read.
+        """
+        tokens = TOKEN_RE.findall(term or '')
+        pks = list(pks)
+        if not tokens or not pks:
+            return {}
+
+        using = using or router.db_for_read(self.model)
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        placeholders = ', '.join(['%s'] * len(pks))
+        if connection.vendor == 'sqlite':
+            fts = qn(self.fts_table)
+            sql = (
+                f"SELECT rowid, snippet({fts}, -1, %s, %s, '…', {SNIPPET_WORDS}) FROM {fts} "
+                f"WHERE {fts} MATCH %s AND rowid IN ({placeholders})"
+            )
+            params = [MARK_START, MARK_END, self._fts_match(tokens), *pks]
+        elif connection.vendor == 'postgresql':
+            options = (
+                f'StartSel={MARK_START}, StopSel={MARK_END}, MaxWords={SNIPPET_WORDS}, '
+                f'MinWords={SNIPPET_WORDS // 2}, MaxFragments=2, FragmentDelimiter=" … "'
+            )
+            sql = (
+                f"SELECT {qn('id')}, ts_headline('simple', {qn('search_document')}, "
+                f"websearch_to_tsquery('simple', %s), %s) FROM {qn(self.table)} "
+                f"WHERE {qn('id')} IN ({placeholders})"
+            )
+            params = [term.strip(), options, *pks]
+        else:
+            return {}
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return {pk: format_snippet(snippet) for pk, snippet in cursor.fetchall()}
+
+    # SQLite index maintenance
+
+    def update(self, instance, using):
+        values = [str(getattr(instance, field) or '') for field in self.fields]
+        columns = ', '.join(self.fields)
+        placeholders = ', '.join(['%s'] * len(values))
+        with connections[using].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.fts_table} WHERE rowid = %s', [instance.pk])
+            cursor.execute(
+                f'INSERT INTO {self.fts_table} (rowid, {columns}) VALUES (%s, {placeholders})',
+                [instance.pk, *values],
+            )
+
+    def update_many(self, instances, using=None):
+        """Re-index rows written without signals (``bulk_create``/``bulk_update``)."""
+        using = using or router.db_for_write(self.model)
+        if connections[using].vendor != 'sqlite':
+            return
+        columns = ', '.join(self.fields)
+        placeholders = ', '.join(['%s'] * len(self.fields))
+        rows = [
+            [instance.pk, *(str(getattr(instance, field) or '') for field in self.fields)]
+            for instance in instances
+        ]
+        with connections[using].cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {self.fts_table} WHERE rowid = %s', [[row[0]] for row in rows])
+            cursor.executemany(
+                f'INSERT INTO {self.fts_table} (rowid, {columns}) VALUES (%s, {placeholders})',
+                rows,
+            )
+
+    def remove(self, pk, using):
+        with connections[using].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.fts_table} WHERE rowid = %s', [pk])
+
+    def rebuild(self, using=None):
+        """Repopulate the FTS5 table from the source table. No-op elsewhere."""
+        using = using or router.db_for_write(self.model)
+        if connections[using].vendor != 'sqlite':
+            return False
+        columns = ', '.join(self.fields)
+        sources = ', '.join(f"COALESCE({field}, '')" for field in self.fields)
+        with connections[using].cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.fts_table}')
+            cursor.execute(
+                f'INSERT INTO {self.fts_table} (rowid, {columns}) '
+                f'SELECT id, {sources} FROM {self.table}'
+            )
+        return True
+
+
+def format_snippet(snippet):
+    """Escape a raw database snippet and turn its markers into ``<mark>`` tags."""
+    text = escape(strip_tags(snippet or ''))
+    return mark_safe(text.replace(MARK_START, '<mark>').replace(MARK_END, '</mark>'))
+
+
+def register(model, fields=None):
+    """
+    Create the index for ``model`` over ``fields`` (default
+    ``model.search_fields``) and keep its SQLite FTS table in sync.
+    """
+    index = SearchIndex(model, fields or model.search_fields)
+    SEARCH_INDEXES[model] = index
+    post_save.connect(_index_saved, sender=model, dispatch_uid=f'search_index_save_{model._meta.label}')
+    post_delete.connect(_index_deleted, sender=model, dispatch_uid=f'search_index_delete_{model._meta.label}')
+    return index
+
+
+def _index_saved(sender, instance, raw=False, using=None, update_fields=None, **kwargs):
+    index = SEARCH_INDEXES[sender]
+    if connections[using].vendor != 'sqlite':
+        return
+    # Status changes and note edits don't touch indexed text.
+    if update_fields is not None and not set(update_fields) & set(index.fields):
+        return
+    index.update(instance, using)
+
+
+def _index_deleted(sender, instance, using=None, **kwargs):
+    if connections[using].vendor == 'sqlite':
+        SEARCH_INDEXES[sender].remove(instance.pk, using)
@@ -0,0 +1,46 @@
+"""
+Signal handlers for the core app.
+"""
+
+from django.db.models.signals import post_delete, post_save
+
+from apps.contact.models import ContactMessage, Inquiry
+from apps.events.models import EventRegistration
+from . import notifications, versions
+from .dashboard import DASHBOARD_MODELS, invalidate_dashboard_stats
+
+
+def clear_dashboard_stats(sender, **kwargs):
+    """Invalidate cached dashboard statistics when a counted model changes."""
+    invalidate_dashboard_stats()
+
+
+for model in DASHBOARD_MODELS:
+    post_save.connect(clear_dashboard_stats, sender=model, dispatch_uid=f'dashboard_stats_save_{model._meta.label_lower}')
+    post_delete.connect(clear_dashboard_stats, sender=model, dispatch_uid=f'dashboard_stats_delete_{model._meta.label_lower}')
+
+
+NOTIFICATION_HANDLERS = {
+    ContactMessage: notifications.notify_message,
+    Inquiry: notifications.notify_inquiry,
+    EventRegistration: notifications.notify_registration,
+}
+
+
+def notify_new_submission(sender, instance, created, raw=False, **kwargs):
+    """Add new public submissions to the admin notification feed."""
+    if created and not raw:
+        NOTIFICATION_HANDLERS[sender](instance)
+
+
+def feed_changed(sender, **kwargs):
+    """New submissions and status changes move the notification feed version."""
+    notifications.invalidate_version()
+
+
+versions.track(*notifications.FEED_MODELS)
+
+for model in NOTIFICATION_HANDLERS:
+    post_save.connect(notify_new_submission, sender=model, dispatch_uid=f'notify_{model._meta.label_lower}')
+    post_save.connect(feed_changed, sender=model, dispatch_uid=f'notification_feed_save_{model._meta.label_lower}')
+    post_delete.connect(feed_changed, sender=model, dispatch_uid=f'notification_feed_delete_{model._meta.label_lower}')
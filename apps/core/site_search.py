@@ -0,0 +1,149 @@
+"""
+Public site-wide search.
+
+Each ``SearchSource`` registers the full-text index of a model (over its
+``search_fields``, see ``apps.core.search``) and pairs it with the rows the
+public site actually shows and the page that displays them. Results are answered from the indexes (FTS5 on
+SQLite, tsvector/GIN on PostgreSQL); the content tables are only read for
+the page of results being shown.
+"""
+
+from django.urls import reverse
+
+from apps.achievements.models import Achievement
+from apps.blog.models import BlogPost
+from apps.coaches.models import Coach
+from apps.contact.models import ContactMessage, Inquiry
+from apps.events.models import Event
+from apps.facilities.models import Facility
+from apps.gallery.models import GalleryCategory
+from apps.news.models import News
+from apps.programs.models import Program
+from apps.tournaments.models import Tournament
+from . import search
+
+
+RESULTS_PER_PAGE = 20
+
+
+class SearchSource:
+    """One searchable content type on the public site."""
+
+    def __init__(self, key, label, model, filters, url_name, fields, exclude=None, url_kwarg='slug'):
+        self.key = key
+        self.label = label
+        self.index = search.register(model)
+        self.filters = filters
+        self.exclude = exclude or {}
+        self.url_name = url_name
+        # Columns needed to render a result; the rest stay deferred.
+        self.fields = fields
+        self.url_kwarg = url_kwarg
+
+    def queryset(self):
+        """Rows visible on the public site."""
+        queryset = self.index.model.objects.filter(**self.filters)
+        if self.exclude:
+            queryset = queryset.exclude(**self.exclude)
+        return queryset
+
+    def search(self, term):
+        return (
+            self.index.search(self.queryset(), term)
+            .only(*self.fields)
+            .order_by('-search_rank', '-pk')
+        )
+
+    def url(self, obj):
+        if self.url_kwarg:
+            return reverse(self.url_name, kwargs={self.url_kwarg: obj.slug})
+        return reverse(self.url_name)
+
+
+SEARCH_SOURCES = {
+    source.key: source for source in [
+        SearchSource(
+            'programs', 'Programs', Program, {'status': 'active'},
+            'programs:detail', ('name', 'slug'),
+        ),
+        SearchSource(
+            'coaches', 'Coaches', Coach, {'status': 'active', 'show_on_website': True},
+            'coaches:detail', ('first_name', 'last_name', 'slug'),
+        ),
+        SearchSource(
+            'news', 'News', News, {'status': 'published'},
+            'news:detail', ('title', 'slug'),
+        ),
+        SearchSource(
+            'blog', 'Blog', BlogPost, {'status': 'published'},
+            'blog:detail', ('title', 'slug'),
+        ),
+        SearchSource(
+            'events', 'Events', Event, {}, 'events:detail', ('title', 'slug'),
+            exclude={'status': 'draft'},
+        ),
+        SearchSource(
+            'facilities', 'Facilities', Facility, {'is_active': True},
+            'facilities:detail', ('name', 'slug'),
+        ),
+        SearchSource(
+            'tournaments', 'Tournaments', Tournament, {}, 'tournaments:detail', ('name', 'slug'),
+            exclude={'status': 'draft'},
+        ),
+        SearchSource(
+            'achievements', 'Achievements', Achievement, {'is_active': True},
+            'achievements:list', ('title', 'year'), url_kwarg=None,
+        ),
+        SearchSource(
+            'gallery', 'Gallery', GalleryCategory, {'is_active': True},
+            'gallery:category', ('name', 'slug'),
+        ),
+    ]
+}
+
+
+# The admin inbox search; not shown on the public site.
+INBOX_INDEXES = {model: search.register(model) for model in (ContactMessage, Inquiry)}
+
+
+def _results(source, objects, term):
+    snippets = source.index.snippets(term, [obj.pk for obj in objects])
+    return [
+        {
+            'type': source.key,
+            'type_label': source.label,
+            'title': str(obj),
+            'url': source.url(obj),
+            'snippet': snippets.get(obj.pk, ''),
+            'rank': obj.search_rank,
+        }
+        for obj in objects
+    ]
+
+
+def match_counts(term):
+    """Number of matches per source, for the content-type filter."""
+    return {key: source.search(term).count() for key, source in SEARCH_SOURCES.items()}
+
+
+def search_all(term, counts, limit=RESULTS_PER_PAGE):
+    """Best ``limit`` matches across every source that has any."""
+    candidates = []
+    for key, source in SEARCH_SOURCES.items():
+        if counts.get(key):
+            candidates.extend((obj.search_rank, source, obj) for obj in source.search(term)[:limit])
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+    candidates = candidates[:limit]
+
+    results = []
+    for source in SEARCH_SOURCES.values():
+        objects = [obj for _, candidate_source, obj in candidates if candidate_source is source]
+        if objects:
+            results.extend(_results(source, objects, term))
+    results.sort(key=lambda result: result['rank'], reverse=True)
+    return results
+
+
+def search_source(source, term, objects):
+    """Result dicts for ``objects``, a page of ``source.search(term)``."""
+    return _results(source, list(objects), term)
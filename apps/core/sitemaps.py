@@ -0,0 +1,120 @@
+"""
+XML sitemaps for search engines.
+
+One ``Sitemap`` per public detail route, listed in a sitemap index at
+``/sitemap.xml``. Visibility and URLs come from ``SEARCH_SOURCES`` so the
+sitemap lists exactly what the public site shows. Sections longer than
+``SITEMAP_PAGE_SIZE`` are split into pages (``?p=2`` ...).
+
+Rendered XML is cached through ``apps.core.xmlcache`` under a generation
+per section, bumped when a model behind the section is saved or deleted.
+Crawlers are served from the cache; the database is only read again after
+a change.
+"""
+
+from django.conf import settings
+from django.contrib.sitemaps import Sitemap, views as sitemap_views
+from django.db.models import Max
+from django.db.models.functions import Coalesce, Greatest
+from django.urls import reverse
+
+from apps.gallery.models import GalleryImage
+from apps.tournaments.models import Match
+from . import xmlcache
+from .site_search import SEARCH_SOURCES
+
+
+class StaticSitemap(Sitemap):
+    changefreq = 'monthly'
+
+    def items(self):
+        return [
+            'frontend:home', 'frontend:about', 'frontend:community', 'frontend:contact',
+            'frontend:search', 'frontend:sitemap', 'frontend:privacy', 'frontend:terms',
+            'programs:list', 'coaches:list', 'events:list', 'news:list', 'blog:list',
+            'gallery:list', 'achievements:list', 'accreditations:list',
+            'facilities:list', 'tournaments:list',
+        ]
+
+    def location(self, item):
+        return reverse(item)
+
+
+class SourceSitemap(Sitemap):
+    """Detail pages of one ``SEARCH_SOURCES`` entry, ``lastmod`` from ``updated_at``."""
+
+    def __init__(self, key, changefreq='weekly', children=None):
+        self.source = SEARCH_SOURCES[key]
+        self.changefreq = changefreq
+        # Related rows listed on the page (matches on a tournament page);
+        # their latest ``updated_at`` counts towards the item's ``lastmod``.
+        self.children = children
+        self.limit = settings.SITEMAP_PAGE_SIZE
+
+    def items(self):
+        queryset = self.source.queryset().only('slug', 'updated_at').order_by('pk')
+        if self.children:
+            queryset = queryset.annotate(
+                last_modified=Greatest('updated_at', Coalesce(Max(f'{self.children}__updated_at'), 'updated_at'))
+            )
+        return queryset
+
+    def location(self, item):
+        return self.source.url(item)
+
+    def lastmod(self, item):
+        return getattr(item, 'last_modified', item.updated_at)
+
+    def get_latest_lastmod(self):
+        # One aggregate instead of iterating every item.
+        queryset = self.source.queryset()
+        latest = queryset.aggregate(latest=Max('updated_at'))['latest']
+        if self.children:
+            child = queryset.aggregate(latest=Max(f'{self.children}__updated_at'))['latest']
+            latest = max(filter(None, [latest, child]), default=None)
+        return latest
+
+
+SITEMAPS = {
+    'pages': StaticSitemap,
+    'programs': lambda: SourceSitemap('programs'),
+    'coaches': lambda: SourceSitemap('coaches', 'monthly'),
+    'events': lambda: SourceSitemap('events'),
+    'news': lambda: SourceSitemap('news', 'monthly'),
+    'blog': lambda: SourceSitemap('blog', 'monthly'),
+    'facilities': lambda: SourceSitemap('facilities', 'monthly'),
+    'tournaments': lambda: SourceSitemap('tournaments', 'daily', children='matches'),
+    'gallery': lambda: SourceSitemap('gallery', children='images'),
+}
+
+# Models whose writes change each section.
+SITEMAP_MODELS = {
+    key: [SEARCH_SOURCES[key].index.model]
+    for key in SITEMAPS if key in SEARCH_SOURCES
+}
+SITEMAP_MODELS['tournaments'].append(Match)
+SITEMAP_MODELS['gallery'].append(GalleryImage)
+
+
+def index(request):
+    versions = xmlcache.generations(f'sitemap-{section}' for section in SITEMAPS)
+    return xmlcache.cached_response(
+        request,
+        xmlcache.cache_key(request, 'sitemap-index', sorted(versions.items())),
+        lambda: sitemap_views.index(request, SITEMAPS, sitemap_url_name='frontend:sitemap_section'),
+        settings.SITEMAP_CACHE_TIMEOUT,
+    )
+
+
+def section(request, section):
+    version = xmlcache.generations([f'sitemap-{section}'])[f'sitemap-{section}']
+    return xmlcache.cached_response(
+        request,
+        xmlcache.cache_key(request, f'sitemap-{section}', version, request.GET.get('p', '1')),
+        lambda: sitemap_views.sitemap(request, SITEMAPS, section=section),
+        settings.SITEMAP_CACHE_TIMEOUT,
+    )
+
+
+for _section, _models in SITEMAP_MODELS.items():
+    xmlcache.connect(f'sitemap-{_section}', _models)
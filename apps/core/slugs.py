@@ -0,0 +1,102 @@
+"""
+Unique slug allocation.
+
+A slug that is already taken gets the smallest free numeric suffix:
+``summer-camp``, ``summer-camp-1``, ``summer-camp-2``, ... The taken slugs
+for a base are read with one ``slug = base OR slug LIKE 'base-%'`` query
+and the free suffix is found in Python, instead of probing one candidate per
+query. Numbers that are part of a title (``cup-2024``) are never mistaken
+for counters, since only the exact candidates are checked. ``SlugAllocator`` keeps what it has read and handed out, so a bulk
+import allocates thousands of slugs with a few batched queries.
+
+Another process can still take the same slug between the lookup and the
+insert; ``UniqueSlugModel.save()`` and the importer retry with a fresh
+allocation when the insert fails on the unique index.
+"""
+
+from django.db.models import Q
+from django.utils.text import slugify
+
+
+# Room kept for a suffix when the base fills the column: '-' and six digits.
+SUFFIX_LENGTH = 7
+
+# Attempts at saving a new slug before an IntegrityError is re-raised.
+SLUG_RETRIES = 3
+
+# Bases looked up per query when prefetching.
+PREFETCH_BATCH = 200
+
+
+def slug_base(*values, max_length=None):
+    """Slugified base for ``values`` joined by hyphens, cut to ``max_length``."""
+    return slugify('-'.join(str(value or '') for value in values))[:max_length].strip('-')
+
+
+class SlugAllocator:
+    """
+    Hands out unique values of ``field`` for ``model``.
+
+    Slugs handed out are remembered as taken, so rows allocated in one batch
+    never collide with each other. ``exclude`` is the pk of a row whose own
+    slug is free to reuse.
+    """
+
+    def __init__(self, model, field='slug', exclude=None):
+        self.model = model
+        self.field = field
+        self.max_length = model._meta.get_field(field).max_length
+        self.exclude = exclude
+        self._fetched = set()  # bases already looked up
+        self._taken = set()
+        self._next_suffix = {}  # stem -> lowest suffix that may be free
+
+    def _base(self, base):
+        return slug_base(base, max_length=self.max_length) or self.model._meta.model_name
+
+    def _stem(self, base):
+        """``base`` shortened so a suffix still fits the column."""
+        return base[:self.max_length - SUFFIX_LENGTH].rstrip('-')
+
+    def prefetch(self, bases):
+        """Read the slugs taken for each of ``bases`` in batched queries."""
+        pending = {base: self._stem(base) for base in map(self._base, bases) if base not in self._fetched}
+        items = list(pending.items())
+        for start in range(0, len(items), PREFETCH_BATCH):
+            batch = dict(items[start:start + PREFETCH_BATCH])
+            stems = set(batch.values())
+            condition = Q(**{f'{self.field}__in': list(batch)})
+            for stem in stems:
+                condition |= Q(**{f'{self.field}__startswith': f'{stem}-'})
+            queryset = self.model._default_manager.filter(condition)
+            if self.exclude is not None:
+                queryset = queryset.exclude(pk=self.exclude)
+            self._fetched.update(batch)
+            self._taken.update(queryset.values_list(self.field, flat=True))
+
+    def allocate(self, base):
+        """Return ``base`` if it is free, otherwise the lowest free suffixed slug."""
+        base = self._base(base)
+        self.prefetch([base])
+        slug = base
+        if slug in self._taken:
+            stem = self._stem(base)
+            # Taken slugs are only ever added, so lower suffixes stay taken.
+            suffix = self._next_suffix.get(stem, 1)
+            while f'{stem}-{suffix}' in self._taken:
+                suffix += 1
+            self._next_suffix[stem] = suffix + 1
+            slug = f'{stem}-{suffix}'
+        self._taken.add(slug)
+        return slug
+
+    def forget(self):
+        """Drop everything read so far, e.g. after losing a race."""
+        self._fetched.clear()
+        self._taken.clear()
+        self._next_suffix.clear()
+
+
+def unique_slug(model, base, field='slug', exclude=None):
+    """A free slug for one ``model`` row, built from ``base``."""
+    return SlugAllocator(model, field, exclude).allocate(base)
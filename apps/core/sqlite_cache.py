@@ -0,0 +1,287 @@
+"""
+Cache backend shared by every worker on one host, stored in a SQLite file.
+
+Django's ``LocMemCache`` is per process, so each gunicorn worker warms and
+holds its own copy; ``FileBasedCache`` is shared but culls by scanning the
+directory and has no atomic ``incr``. This backend keeps entries in one
+SQLite database in WAL mode, so readers never block the writer and all
+processes see the same entries:
+
+* ``incr``/``decr`` are a single ``UPDATE ... RETURNING`` on integers, which
+  are stored as SQLite integers rather than pickles. Results that don't fit
+  in 64 bits are pickled, so counters never turn into floats.
+* ``add`` is a single upsert that only replaces an expired entry.
+* Entries expire by timeout; the total size of keys and values is kept by
+  triggers and, past ``MAX_BYTES``, the least recently used entries are
+  evicted down to ``CULL_RATIO`` of it. Reads refresh an entry's access time
+  at most every ``ACCESS_RESOLUTION`` seconds, so hot keys don't turn every
+  read into a write.
+
+Configuration::
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'apps.core.sqlite_cache.SQLiteCache',
+            'LOCATION': '/var/tmp/aifa-cache.sqlite3',
+            'OPTIONS': {'MAX_BYTES': 64 * 1024 * 1024},
+        },
+    }
+
+``python manage.py benchmark_cache`` compares it with ``LocMemCache`` and
+``FileBasedCache``.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+
+# SQLite's default limit on bound parameters is 999 before 3.32.
+BATCH_SIZE = 500
+
+SCHEMA = [
+    '''CREATE TABLE IF NOT EXISTS cache (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        expires REAL,
+        accessed REAL NOT NULL,
+        size INTEGER NOT NULL
+    ) WITHOUT ROWID''',
+    'CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)',
+    'CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)',
+    'CREATE TABLE IF NOT EXISTS cache_size (id INTEGER PRIMARY KEY CHECK (id = 1), bytes INTEGER NOT NULL)',
+    'INSERT OR IGNORE INTO cache_size VALUES (1, 0)',
+    '''CREATE TRIGGER IF NOT EXISTS cache_inserted AFTER INSERT ON cache
+       BEGIN UPDATE cache_size SET bytes = bytes + new.size; END''',
+    '''CREATE TRIGGER IF NOT EXISTS cache_updated AFTER UPDATE OF size ON cache
+       BEGIN UPDATE cache_size SET bytes = bytes - old.size + new.size; END''',
+    '''CREATE TRIGGER IF NOT EXISTS cache_deleted AFTER DELETE ON cache
+       BEGIN UPDATE cache_size SET bytes = bytes - old.size; END''',
+]
+
+# Integers outside this range don't fit SQLite's INTEGER and are pickled.
+_MIN_INT, _MAX_INT = -2 ** 63, 2 ** 63 - 1
+INT_SIZE = 8
+
+
+class SQLiteCache(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._path = os.path.abspath(location)
+        self._max_bytes = int(options.get('MAX_BYTES', 64 * 1024 * 1024))
+        self._cull_ratio = float(options.get('CULL_RATIO', 0.9))
+        self._access_resolution = float(options.get('ACCESS_RESOLUTION', 30))
+        self._busy_timeout = float(options.get('BUSY_TIMEOUT', 5))
+        self._local = threading.local()
+
+    # Connections
+
+    @property
+    def _db(self):
+        # One connection per thread, reopened in a forked child.
+        db = getattr(self._local, 'db', None)
+        if db is None or self._local.pid != os.getpid():
+            db = self._connect()
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        db = sqlite3.connect(self._path, timeout=self._busy_timeout, isolation_level=None)
+        db.execute('PRAGMA journal_mode = WAL')
+        # WAL with NORMAL sync survives a process crash; only an OS crash can
+        # lose the last writes, which is fine for a cache.
+        db.execute('PRAGMA synchronous = NORMAL')
+        with db:
+            db.execute('BEGIN IMMEDIATE')
+            for statement in SCHEMA:
+                db.execute(statement)
+        return db
+
+    def close(self, **kwargs):
+        # Called at the end of every request; the connection is meant to outlive it.
+        pass
+
+    # Values
+
+    def _encode(self, value):
+        if type(value) is int and _MIN_INT <= value <= _MAX_INT:
+            return value, INT_SIZE
+        data = pickle.dumps(value, self.pickle_protocol)
+        return data, len(data)
+
+    def _decode(self, stored):
+        return stored if isinstance(stored, int) else pickle.loads(stored)
+
+    # Cache API
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        stored, size = self._encode(value)
+        now = time.time()
+        cursor = self._db.execute(
+            '''INSERT INTO cache (key, value, expires, accessed, size) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT (key) DO UPDATE SET
+                   value = excluded.value, expires = excluded.expires,
+                   accessed = excluded.accessed, size = excluded.size
+               WHERE cache.expires IS NOT NULL AND cache.expires <= ?''',
+            (key, stored, self.get_backend_timeout(timeout), now, len(key) + size, now),
+        )
+        if cursor.rowcount:
+            self._maybe_cull()
+        return cursor.rowcount > 0
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._get_many([key]).get(key, default)
+
+    def get_many(self, keys, version=None):
+        keys = {self.make_and_validate_key(key, version=version): key for key in keys}
+        return {keys[key]: value for key, value in self._get_many(list(keys)).items()}
+
+    def _get_many(self, keys):
+        now = time.time()
+        found, stale = {}, []
+        for start in range(0, len(keys), BATCH_SIZE):
+            batch = keys[start:start + BATCH_SIZE]
+            rows = self._db.execute(
+                f'SELECT key, value, expires, accessed FROM cache WHERE key IN ({", ".join("?" * len(batch))})',
+                batch,
+            )
+            for key, stored, expires, accessed in rows:
+                if expires is not None and expires <= now:
+                    continue
+                found[key] = self._decode(stored)
+                if accessed < now - self._access_resolution:
+                    stale.append(key)
+        for start in range(0, len(stale), BATCH_SIZE):
+            batch = stale[start:start + BATCH_SIZE]
+            self._db.execute(
+                f'UPDATE cache SET accessed = ? WHERE key IN ({", ".join("?" * len(batch))})', [now, *batch],
+            )
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.set_many({key: value}, timeout, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        expires = self.get_backend_timeout(timeout)
+        now = time.time()
+        rows = []
+        for key, value in data.items():
+            key = self.make_and_validate_key(key, version=version)
+            stored, size = self._encode(value)
+            rows.append((key, stored, expires, now, len(key) + size))
+        with self._db as db:
+            db.execute('BEGIN IMMEDIATE')
+            db.executemany(
+                '''INSERT INTO cache (key, value, expires, accessed, size) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (key) DO UPDATE SET
+                       value = excluded.value, expires = excluded.expires,
+                       accessed = excluded.accessed, size = excluded.size''',
+                rows,
+            )
+        self._maybe_cull()
+        return []
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        cursor = self._db.execute(
+            'UPDATE cache SET expires = ?, accessed = ? WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (self.get_backend_timeout(timeout), now, key, now),
+        )
+        return cursor.rowcount > 0
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        with self._db as db:
+            db.execute('BEGIN IMMEDIATE')
+            row = None
+            if _MIN_INT <= delta <= _MAX_INT:
+                # The old values for which the sum still fits, checked on the
+                # value itself: an overflowing sum is already a rounded REAL.
+                low, high = _MIN_INT - min(delta, 0), _MAX_INT - max(delta, 0)
+                row = db.execute(
+                    '''UPDATE cache SET value = value + ?, accessed = ?
+                       WHERE key = ? AND (expires IS NULL OR expires > ?) AND typeof(value) = 'integer'
+                           AND value BETWEEN ? AND ?
+                       RETURNING value''',
+                    (delta, now, key, now, low, high),
+                ).fetchone()
+            if row is not None:
+                return row[0]
+            # Not an integer entry, a delta or sum outside SQLite's INTEGER
+            # (it would become a REAL), or missing: read, add and write back
+            # while holding the write lock, as the other backends do without it.
+            row = db.execute(
+                'SELECT value FROM cache WHERE key = ? AND (expires IS NULL OR expires > ?)', (key, now),
+            ).fetchone()
+            if row is None:
+                raise ValueError("Key '%s' not found" % key)
+            value = self._decode(row[0]) + delta
+            stored, size = self._encode(value)
+            db.execute(
+                'UPDATE cache SET value = ?, size = ?, accessed = ? WHERE key = ?',
+                (stored, len(key) + size, now, key),
+            )
+            return value
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._db.execute('DELETE FROM cache WHERE key = ?', (key,)).rowcount > 0
+
+    def delete_many(self, keys, version=None):
+        keys = [self.make_and_validate_key(key, version=version) for key in keys]
+        with self._db as db:
+            db.execute('BEGIN IMMEDIATE')
+            for start in range(0, len(keys), BATCH_SIZE):
+                batch = keys[start:start + BATCH_SIZE]
+                db.execute(f'DELETE FROM cache WHERE key IN ({", ".join("?" * len(batch))})', batch)
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self._db.execute(
+            'SELECT 1 FROM cache WHERE key = ? AND (expires IS NULL OR expires > ?)', (key, time.time()),
+        ).fetchone() is not None
+
+    def clear(self):
+        self._db.execute('DELETE FROM cache')
+
+    # Eviction
+
+    def size(self):
+        """Bytes of keys and values currently stored (expired entries included)."""
+        return self._db.execute('SELECT bytes FROM cache_size').fetchone()[0]
+
+    def _maybe_cull(self):
+        if self.size() > self._max_bytes:
+            self._cull()
+
+    def _cull(self):
+        target = self._max_bytes * self._cull_ratio
+        with self._db as db:
+            db.execute('BEGIN IMMEDIATE')
+            db.execute('DELETE FROM cache WHERE expires <= ?', (time.time(),))
+            excess = db.execute('SELECT bytes FROM cache_size').fetchone()[0] - target
+            if excess <= 0:
+                return
+            # The access time by which the least recently used entries add up to the excess.
+            row = db.execute(
+                '''SELECT accessed FROM (
+                       SELECT accessed, SUM(size) OVER (ORDER BY accessed) AS freed FROM cache
+                   ) WHERE freed >= ? LIMIT 1''',
+                (excess,),
+            ).fetchone()
+            if row is None:
+                db.execute('DELETE FROM cache')
+            else:
+                db.execute('DELETE FROM cache WHERE accessed <= ?', row)
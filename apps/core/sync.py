@@ -0,0 +1,280 @@
+"""
+Delta sync for offline clients (``/api/v1/changes/``).
+
+A client keeps the objects of the API resources locally and asks for what
+changed since its last cursor. Changes are read as ``updated_at`` range
+scans (every resource model has an ``(updated_at, id)`` index) plus the
+``Tombstone`` rows written when a public object is deleted or stops being
+public (unpublished, made a draft, ...). Rows that were never public are
+never reported, not even as deletes, so drafts don't leak through the feed.
+
+Changes come in a total order of ``(time, stream, id)`` where the stream is
+a resource key or ``tombstones``; the cursor is the position of the last
+change returned, so large syncs page through without skipping or
+repeating rows that share a timestamp. Rows changed in the last
+``SYNC_SETTLE_SECONDS`` are held back until transactions that are still
+open when the request runs have committed.
+
+Resources embed fields of related rows (a match's teams, a gallery's
+images), so saving or deleting one of those touches ``updated_at`` of the
+objects that embed it.
+"""
+
+import base64
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.coaches.models import Coach
+from apps.events.models import Event
+from apps.gallery.models import GalleryCategory, GalleryImage
+from apps.programs.models import Batch, Program
+from apps.tournaments.models import Match, Team, Tournament
+from . import versions
+from .api import RESOURCES
+from .models import Tombstone
+
+
+CHANGES_PAGE_SIZE = 200
+
+TOMBSTONES = 'tombstones'
+
+# Related model -> (model embedding it, lookup from that model to it).
+EMBEDDED_IN = {
+    GalleryImage: [(GalleryCategory, 'images')],
+    Batch: [(Program, 'batches')],
+    Coach: [(Program, 'batches__coach')],
+    Program: [(Event, 'program')],
+    Tournament: [(Match, 'tournament')],
+    Team: [(Match, 'home_team'), (Match, 'away_team')],
+}
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class ExpiredCursor(ValueError):
+    """The cursor is older than the tombstones kept; the client must sync from scratch."""
+
+
+def encode_cursor(position):
+    moment, stream, pk = position
+    payload = json.dumps([moment.isoformat(), stream, pk])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """``(time, stream, id)`` of a cursor, or ``None`` for a full sync."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw_moment, stream, pk = json.loads(base64.urlsafe_b64decode(padded))
+        moment = parse_datetime(raw_moment)
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    if moment is None or not isinstance(pk, int) or stream not in (*RESOURCES, TOMBSTONES):
+        raise InvalidCursor(cursor)
+    if moment < timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_DAYS):
+        raise ExpiredCursor(cursor)
+    return moment, stream, pk
+
+
+def _after(queryset, field, stream, position):
+    """Rows of ``stream`` that come after ``position`` in the change order."""
+    if position is None:
+        return queryset
+    moment, cursor_stream, pk = position
+    if stream < cursor_stream:
+        return queryset.filter(**{f'{field}__gt': moment})
+    queryset = queryset.filter(**{f'{field}__gte': moment})
+    if stream == cursor_stream:
+        queryset = queryset.exclude(**{field: moment, 'pk__lte': pk})
+    return queryset
+
+
+def changes(position, until, limit=CHANGES_PAGE_SIZE):
+    """
+    Up to ``limit`` changes after ``position`` and before ``until``.
+
+    Returns ``(entries, last_position, has_more)``.
+    """
+    candidates = []
+    for key, resource in RESOURCES.items():
+        model = resource.queryset().model
+        rows = _after(model.objects.filter(updated_at__lt=until), 'updated_at', key, position)
+        candidates.extend(
+            (moment, key, pk)
+            for pk, moment in rows.order_by('updated_at', 'pk').values_list('pk', 'updated_at')[:limit + 1]
+        )
+    rows = _after(Tombstone.objects.filter(deleted_at__lt=until), 'deleted_at', TOMBSTONES, position)
+    candidates.extend(
+        (moment, TOMBSTONES, pk)
+        for pk, moment in rows.order_by('deleted_at', 'pk').values_list('pk', 'deleted_at')[:limit + 1]
+    )
+    candidates.sort()
+    has_more = len(candidates) > limit
+    candidates = candidates[:limit]
+    return _entries(candidates), (candidates[-1] if candidates else position), has_more
+
+
+def _entries(candidates):
+    by_stream = {}
+    for moment, stream, pk in candidates:
+        by_stream.setdefault(stream, []).append(pk)
+
+    tombstones = {tombstone.pk: tombstone for tombstone in Tombstone.objects.filter(pk__in=by_stream.pop(TOMBSTONES, []))}
+    public = {}
+    for key, pks in by_stream.items():
+        resource = RESOURCES[key]
+        names = list(resource.fields)
+        public[key] = {obj.pk: obj for obj in resource.plan(resource.queryset().filter(pk__in=pks), names)}
+
+    entries = []
+    for moment, stream, pk in candidates:
+        if stream == TOMBSTONES:
+            tombstone = tombstones[pk]
+            entries.append({
+                'type': tombstone.resource, 'op': 'delete', 'id': tombstone.object_id,
+                'key': tombstone.key, 'at': moment,
+            })
+        elif pk in public[stream]:
+            obj = public[stream][pk]
+            entries.append({
+                'type': stream, 'op': 'upsert', 'id': pk, 'key': str(getattr(obj, RESOURCES[stream].lookup)),
+                'at': moment, 'obj': obj,
+            })
+        # Changed rows that aren't public are skipped: if they were public
+        # before, hiding them wrote a tombstone.
+    return entries
+
+
+def settled_until():
+    return timezone.now() - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+
+def prune_tombstones():
+    """Delete tombstones older than any cursor still accepted; returns the number deleted."""
+    cutoff = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
+
+
+# Signals
+
+RESOURCE_BY_MODEL = {resource.queryset().model: resource for resource in RESOURCES.values()}
+
+
+def _tombstone(resource, pk, key):
+    Tombstone.objects.create(resource=resource.key, object_id=pk, key=str(key), deleted_at=timezone.now())
+
+
+def _public(model, pks):
+    """The rows among ``pks`` that the API serves."""
+    resource = RESOURCE_BY_MODEL.get(model)
+    if resource is None or not pks:
+        return set()
+    return set(resource.queryset().filter(pk__in=pks).values_list('pk', flat=True))
+
+
+def _tombstone_hidden(model, was_public):
+    """Write tombstones for the rows of ``was_public`` that are no longer public."""
+    resource = RESOURCE_BY_MODEL[model]
+    hidden = model.objects.filter(pk__in=set(was_public) - _public(model, was_public))
+    for pk, key in hidden.values_list('pk', resource.lookup):
+        _tombstone(resource, pk, key)
+
+
+def _public_embedding(targets, pks):
+    """Public rows of each embedding model that embed any of the related rows ``pks``."""
+    public = {}
+    for model, lookup in targets:
+        rows = RESOURCE_BY_MODEL[model].queryset().filter(**{f'{lookup}__in': pks}).values_list('pk', flat=True)
+        public.setdefault(model, set()).update(rows)
+    return public
+
+
+def _touch(targets, pks, was_public):
+    """Touch the rows embedding ``pks`` and tombstone those the change hid."""
+    now = timezone.now()
+    for model, lookup in targets:
+        if model.objects.filter(**{f'{lookup}__in': pks}).update(updated_at=now):
+            versions.bump(model)
+    # Embedding rows this change hid (a tournament made a draft hides its matches).
+    for model, public in was_public.items():
+        if public:
+            _tombstone_hidden(model, public)
+
+
+def visibility(model, pks):
+    """
+    What the API serves of rows ``pks`` of ``model`` and of the rows
+    embedding them, taken before a bulk write and passed to ``bulk_written``.
+    """
+    return _public(model, pks), _public_embedding(EMBEDDED_IN.get(model, ()), pks)
+
+
+def bulk_written(model, pks, before):
+    """
+    Do for rows written with ``bulk_update()`` what the signals below do for
+    ``save()``: tombstone rows that stopped being public and touch the rows
+    embedding them. ``before`` is ``visibility()`` from before the write.
+    """
+    was_public, embedding = before
+    if was_public:
+        _tombstone_hidden(model, was_public)
+    if model in EMBEDDED_IN:
+        _touch(EMBEDDED_IN[model], pks, embedding)
+
+
+def _track_visibility(resource):
+    """Write a tombstone when a public row is deleted or hidden."""
+    model = resource.queryset().model
+
+    def before(sender, instance, raw=False, **kwargs):
+        instance._sync_was_public = not raw and instance.pk is not None and bool(_public(model, [instance.pk]))
+
+    def saved(sender, instance, **kwargs):
+        if instance.__dict__.pop('_sync_was_public', False):
+            _tombstone_hidden(model, [instance.pk])
+
+    def deleted(sender, instance, **kwargs):
+        if instance.__dict__.pop('_sync_was_public', False):
+            _tombstone(resource, instance.pk, getattr(instance, resource.lookup))
+    return before, saved, deleted
+
+
+def _remember_embedding(targets):
+    def before(sender, instance, raw=False, **kwargs):
+        if not raw and instance.pk is not None:
+            instance._sync_embedding_public = _public_embedding(targets, [instance.pk])
+    return before
+
+
+def _touch_embedding(targets):
+    def changed(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        _touch(targets, [instance.pk], instance.__dict__.pop('_sync_embedding_public', {}))
+    return changed
+
+
+for _model, _resource in RESOURCE_BY_MODEL.items():
+    _before, _saved, _deleted = _track_visibility(_resource)
+    _uid = f'sync_visibility_{_resource.key}'
+    pre_save.connect(_before, sender=_model, weak=False, dispatch_uid=f'{_uid}_pre_save')
+    post_save.connect(_saved, sender=_model, weak=False, dispatch_uid=f'{_uid}_post_save')
+    pre_delete.connect(_before, sender=_model, weak=False, dispatch_uid=f'{_uid}_pre_delete')
+    post_delete.connect(_deleted, sender=_model, weak=False, dispatch_uid=f'{_uid}_post_delete')
+
+for _model, _targets in EMBEDDED_IN.items():
+    _label = _model._meta.label_lower
+    pre_save.connect(_remember_embedding(_targets), sender=_model, weak=False, dispatch_uid=f'sync_remember_{_label}')
+    # Deletes touch before the row goes, while the lookup still finds its parents.
+    post_save.connect(_touch_embedding(_targets), sender=_model, weak=False, dispatch_uid=f'sync_touch_save_{_label}')
+    pre_delete.connect(_touch_embedding(_targets), sender=_model, weak=False, dispatch_uid=f'sync_touch_delete_{_label}')
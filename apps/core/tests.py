@@ -1,3 +1,1429 @@
-from django.test import TestCase
+import base64
+import gzip
+import itertools
+import json
+import select
+import shutil
+import tempfile
+import time
+import unittest
+from collections import Counter
+from datetime import date, time as clock_time, timedelta
+from importlib import import_module
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.contrib.admin.models import ADDITION, LogEntry
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Exists, F, Model, OuterRef
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.blog.models import BlogPost
+from apps.coaches.models import Coach
+from apps.contact.models import ContactMessage
+from apps.events.models import Event
+from apps.facilities.models import Facility, FacilityCategory
+from apps.gallery.models import GalleryCategory
+from apps.news.models import News
+from apps.programs.models import Batch, Program
+from apps.tournaments.models import Match, Team, Tournament
+from apps.tournaments.views_admin import MatchListView
+from . import backup, catalog, dashboard, invalidation, notifications, querycache, related, sync, typeahead, versions
+from .importers import IMPORTERS, Importer
+from .models import AdminNotification, CommunityActivity, ContentVersion, RelatedLink, SiteSettings, Tombstone
+from .pagination import InvalidCursor
+from .search import SEARCH_INDEXES
+from .slugs import SlugAllocator, slug_base
+from .sqlite_cache import SQLiteCache
+
+
+class CardProjectionTests(TestCase):
+    """
+    List pages select only their card columns with ``.cards()``. A template
+    reading a column left out of the projection loads it with one extra
+    query per row; these tests fail when that happens.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        today = date.today()
+        for i in range(3):
+            Program.objects.create(
+                name=f'Program {i}', short_description='', description='Long description ' * 50,
+                image='programs/p.jpg', age_group='6-12 years', duration='3 months',
+                fee_amount=1500, status='active', is_featured=True,
+            )
+            Coach.objects.create(
+                first_name='Coach', last_name=f'{i}', photo='coaches/c.jpg', designation='Head Coach',
+                specialization='Goalkeeping', bio='Bio ' * 100, experience_years=5,
+                qualifications='UEFA B', email=f'coach{i}@example.com', phone='123',
+            )
+            News.objects.create(
+                title=f'News {i}', excerpt='Summary', content='<p>Body</p>' * 50,
+                status='published', show_on_homepage=True,
+            )
+            BlogPost.objects.create(
+                title=f'Post {i}', excerpt='Summary', content='Body ' * 200,
+                featured_image='blog/b.jpg', status='published',
+            )
+            Event.objects.create(
+                title=f'Event {i}', event_type='tournament', short_description='Summary',
+                description='Body ' * 200, featured_image='events/e.jpg',
+                start_date=today + timedelta(days=i + 1), venue='Main Ground',
+                status='upcoming', show_on_homepage=True,
+            )
+            CommunityActivity.objects.create(
+                title=f'Activity {i}', description='Body ' * 200, image='community/a.jpg',
+                date=today, is_featured=True,
+            )
+
+    def get_with_deferred_loads(self, url):
+        """GET ``url`` and return the ``Model.field`` names loaded lazily while rendering."""
+        loads = []
+        refresh_from_db = Model.refresh_from_db
+
+        def recording_refresh(instance, using=None, fields=None, **kwargs):
+            loads.extend(f'{type(instance).__name__}.{field}' for field in fields or ['*'])
+            return refresh_from_db(instance, using=using, fields=fields, **kwargs)
+
+        with mock.patch.object(Model, 'refresh_from_db', recording_refresh):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return loads
+
+    def test_home_page(self):
+        self.assertEqual(self.get_with_deferred_loads(reverse('frontend:home')), [])
+
+    def test_list_pages(self):
+        for name in ['programs:list', 'coaches:list', 'news:list', 'events:list', 'frontend:community', 'frontend:sitemap']:
+            with self.subTest(page=name):
+                self.assertEqual(self.get_with_deferred_loads(reverse(name)), [])
+
+    def test_chatbot(self):
+        for topic in ['programs', 'fees', 'coaches', 'events']:
+            with self.subTest(topic=topic):
+                url = f"{reverse('frontend:chatbot_api')}?topic={topic}"
+                self.assertEqual(self.get_with_deferred_loads(url), [])
+
+    def test_card_summary_falls_back_to_description(self):
+        program = Program.objects.cards().first()
+        self.assertTrue(program.card_summary.startswith('Long description'))
+        self.assertIn('description', program.get_deferred_fields())
+
+
+class DashboardStatsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def message(self):
+        return ContactMessage.objects.create(name='A', email='a@example.com', subject='Hi', message='Hello')
+
+    def test_cached_until_a_counted_model_changes(self):
+        self.message()
+        with self.assertNumQueries(1):
+            self.assertEqual(dashboard.get_dashboard_stats()['new_messages'], 1)
+        with self.assertNumQueries(0):
+            dashboard.get_dashboard_stats()
+
+        message = self.message()
+        self.assertEqual(dashboard.get_dashboard_stats()['new_messages'], 2)
+        message.status = 'read'
+        message.save()
+        self.assertEqual(dashboard.get_dashboard_stats()['new_messages'], 1)
+        message.delete()
+        self.assertIsNone(cache.get(dashboard.DASHBOARD_STATS_CACHE_KEY))
+
+    def test_other_models_keep_the_cache(self):
+        dashboard.get_dashboard_stats()
+        Tournament.objects.create(name='Cup', start_date=date.today(), end_date=date.today())
+        with self.assertNumQueries(0):
+            dashboard.get_dashboard_stats()
+
+
+class CatalogTests(TestCase):
+    """Detail pages and the chatbot read the in-memory catalog; it must follow writes."""
+
+    def setUp(self):
+        # The snapshot outlives each test's rolled-back transaction.
+        catalog._expire(None)
+        self.program = Program.objects.create(
+            name='Junior Academy', short_description='Ages six to twelve', description='Body',
+            image='programs/p.jpg', age_group='6-12 years', duration='3 months', fee_amount=1500,
+        )
+        self.url = reverse('programs:detail', args=[self.program.slug])
+
+    def chatbot(self):
+        return self.client.get(reverse('frontend:chatbot_api'), {'topic': 'programs'}).json()
+
+    def test_detail_page_follows_saves(self):
+        self.assertContains(self.client.get(self.url), 'Junior Academy')
+        self.program.name = 'Senior Academy'
+        self.program.save()
+        self.assertContains(self.client.get(self.url), 'Senior Academy')
+
+    def test_hidden_and_deleted_rows_disappear(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual([p['slug'] for p in self.chatbot()['data']], [self.program.slug])
+
+        self.program.status = Program.Status.INACTIVE
+        self.program.save()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.assertNotIn('data', self.chatbot())
+
+        self.program.status = Program.Status.ACTIVE
+        self.program.save()
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.program.delete()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.assertNotIn('data', self.chatbot())
+
+    def test_chatbot_follows_saves(self):
+        self.assertIn('Junior Academy', self.chatbot()['message'])
+        self.program.name = 'Senior Academy'
+        self.program.save()
+        self.assertIn('Senior Academy', self.chatbot()['message'])
+
+    def test_instances_have_every_column(self):
+        category = FacilityCategory.objects.create(name='Pitches')
+        Facility.objects.create(name='Main Pitch', category=category, features='Floodlights')
+        with self.assertNumQueries(len(catalog.CATALOG_TABLES)):
+            catalog.snapshot()
+        with self.assertNumQueries(0):
+            facility = catalog.get(Facility, slug='main-pitch')
+            program = catalog.get(Program, slug=self.program.slug)
+            self.assertEqual(facility.get_deferred_fields(), set())
+            self.assertEqual(program.get_deferred_fields(), set())
+            # Foreign keys to other catalog tables come attached.
+            self.assertEqual(facility.category.name, 'Pitches')
+            self.assertEqual(program.fee_amount, 1500)
+            self.assertEqual(facility.features_list, ['Floodlights'])
+        record = catalog.snapshot().tables['programs.program'].by_pk[self.program.pk]
+        self.assertFalse(hasattr(record, '__dict__'))
+        with self.assertRaises(AttributeError):
+            record.unknown = 1
+
+
+class QueryCacheTests(TestCase):
+    """``.cached()`` entries are keyed on the versions of every table the query reads."""
+
+    def setUp(self):
+        cache.clear()
+        self.program = Program.objects.create(
+            name='Junior', short_description='', description='', image='programs/p.jpg',
+            age_group='6-12 years', duration='3 months', fee_amount=1500,
+        )
+        self.coach = Coach.objects.create(
+            first_name='Ann', last_name='Lee', photo='coaches/c.jpg', designation='Coach',
+            specialization='', bio='', experience_years=5, qualifications='', email='ann@example.com', phone='1',
+        )
+        self.add_batch()
+
+    def add_batch(self):
+        self.batch = Batch.objects.create(
+            program=self.program, coach=self.coach, name='Morning', schedule='Mon',
+            venue='Ground', start_date=date.today(),
+        )
+
+    def evaluate(self, make_queryset):
+        """The rows of ``make_queryset()`` and whether they came from the database."""
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(make_queryset())
+        # Reading the version ledger doesn't count.
+        ran = any('core_contentversion' not in query['sql'] for query in queries)
+        return rows, ran
+
+    def assertCachedAfterFirstRun(self, make_queryset):
+        first, ran = self.evaluate(make_queryset)
+        self.assertTrue(ran)
+        self.assertEqual(self.evaluate(make_queryset), (first, False))
+
+    def assertInvalidatedBy(self, make_queryset, write):
+        self.assertCachedAfterFirstRun(make_queryset)
+        write()
+        rows, ran = self.evaluate(make_queryset)
+        self.assertTrue(ran)
+        return rows
+
+    def test_join_of_a_related_filter(self):
+        def batches():
+            return Batch.objects.cached().filter(program__status='active')
+
+        def hide_program():
+            self.program.status = Program.Status.INACTIVE
+            self.program.save()
+
+        self.assertEqual(self.assertInvalidatedBy(batches, hide_program), [])
+
+    def test_select_related(self):
+        def batches():
+            return Batch.objects.cached().select_related('coach')
+
+        def rename_coach():
+            self.coach.first_name = 'Anna'
+            self.coach.save()
+
+        rows = self.assertInvalidatedBy(batches, rename_coach)
+        self.assertEqual(rows[0].coach.first_name, 'Anna')
+
+    def test_subqueries(self):
+        def with_batches():
+            return Program.objects.cached().filter(pk__in=Batch.objects.values('program'))
+
+        def with_active_batches():
+            active = Batch.objects.filter(program=OuterRef('pk'), status='active')
+            return Program.objects.cached().filter(Exists(active))
+
+        for queryset in (with_batches, with_active_batches):
+            with self.subTest(queryset=queryset.__name__):
+                self.assertEqual(self.assertInvalidatedBy(queryset, self.batch.delete), [])
+                self.add_batch()
+
+    def test_writes_to_unread_tables_keep_entries(self):
+        self.assertCachedAfterFirstRun(lambda: Program.objects.cached().filter(status='active'))
+        News.objects.create(title='News', excerpt='', content='', status='published')
+        self.assertFalse(self.evaluate(lambda: Program.objects.cached().filter(status='active'))[1])
+
+    def test_tables_from_the_query_not_the_sql(self):
+        # Names of other tables in the SQL text (here a column alias) aren't read.
+        queryset = Program.objects.cached().annotate(**{'coaches_coach': F('name')})
+        self.assertEqual(querycache._tables(queryset.query), {'programs_program'})
+
+
+class SQLiteCacheTests(SimpleTestCase):
+    """The SQLite cache backend, on a database of its own in a temporary directory."""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp(prefix='sqlite-cache-test-')
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.path = str(Path(directory) / 'cache.sqlite3')
+        self.cache = self.make_cache()
+
+    def make_cache(self, **options):
+        return SQLiteCache(self.path, {'TIMEOUT': 300, 'OPTIONS': options})
+
+    def test_default_cache_is_private_to_the_test_run(self):
+        # config.test_runner moves it out of the file the dev server uses.
+        self.assertIn('aifa-test-cache-', caches['default']._path)
+
+    def test_add(self):
+        self.assertTrue(self.cache.add('key', 'first'))
+        self.assertFalse(self.cache.add('key', 'second'))
+        self.assertEqual(self.cache.get('key'), 'first')
+
+    def test_add_replaces_expired_entry(self):
+        self.cache.set('key', 'old', timeout=0)
+        self.assertTrue(self.cache.add('key', 'new'))
+        self.assertEqual(self.cache.get('key'), 'new')
+
+    def test_incr_and_decr(self):
+        self.cache.set('counter', 5)
+        self.assertEqual(self.cache.incr('counter'), 6)
+        self.assertEqual(self.cache.incr('counter', 10), 16)
+        self.assertEqual(self.cache.decr('counter', 20), -4)
+        self.assertEqual(self.cache.get('counter'), -4)
+
+    def test_incr_is_shared_between_instances(self):
+        self.cache.set('counter', 0)
+        other = self.make_cache()
+        other.incr('counter')
+        self.cache.incr('counter')
+        self.assertEqual(other.get('counter'), 2)
+
+    def test_incr_missing_or_expired_key(self):
+        with self.assertRaises(ValueError):
+            self.cache.incr('missing')
+        self.cache.set('counter', 1, timeout=0)
+        with self.assertRaises(ValueError):
+            self.cache.incr('counter')
+
+    def test_incr_past_64_bits_stays_exact(self):
+        limit = 2 ** 63 - 1
+        self.cache.set('counter', limit - 1)
+        self.assertEqual(self.cache.incr('counter'), limit)
+        self.assertEqual(self.cache.incr('counter'), limit + 1)
+        self.assertEqual(self.cache.get('counter'), limit + 1)
+        self.assertEqual(self.cache.decr('counter', 2), limit - 1)
+        self.assertEqual(self.cache.incr('counter', 2 ** 63), limit - 1 + 2 ** 63)
+        self.cache.set('negative', -limit)
+        self.assertEqual(self.cache.decr('negative', 2), -limit - 2)
+
+    def test_expiry(self):
+        self.cache.set('expired', 'value', timeout=0)
+        self.cache.set('forever', 'value', timeout=None)
+        self.cache.set('fresh', 'value')
+        self.assertIsNone(self.cache.get('expired'))
+        self.assertFalse(self.cache.has_key('expired'))
+        self.assertFalse(self.cache.touch('expired'))
+        self.assertEqual(self.cache.get_many(['expired', 'forever', 'fresh']), {'forever': 'value', 'fresh': 'value'})
+
+    def test_cull_evicts_least_recently_used(self):
+        cache = self.make_cache(MAX_BYTES=2000, CULL_RATIO=0.5, ACCESS_RESOLUTION=0)
+        # A clock that moves on every call, so access times never tie.
+        clock = itertools.count(time.time())
+        with mock.patch('apps.core.sqlite_cache.time.time', side_effect=lambda: next(clock)):
+            for i in range(10):
+                cache.set(f'key-{i}', b'x' * 150)
+            cache.get('key-0')
+            for i in range(10, 15):
+                cache.set(f'key-{i}', b'x' * 150)
+            self.assertLessEqual(cache.size(), 2000)
+            self.assertIsNotNone(cache.get('key-0'))
+            self.assertIsNone(cache.get('key-1'))
+            self.assertIsNotNone(cache.get('key-14'))
+
+
+class DerivedFieldsTests(TestCase):
+
+    CONTENT = '<p>Training&nbsp;starts <b>Monday</b>.</p><p><img src="/media/a.jpg?x=1&amp;y=2"> Bring boots</p>'
+
+    def setUp(self):
+        self.news = News.objects.create(title='Training', excerpt='', content=self.CONTENT)
+
+    def stored(self, model, pk, *fields):
+        return model.objects.values_list(*fields).get(pk=pk)
+
+    def test_computed_on_save(self):
+        self.assertEqual(
+            self.stored(News, self.news.pk, 'plain_text', 'word_count', 'reading_time', 'first_image_url'),
+            ('Training starts Monday.\nBring boots', 5, 1, '/media/a.jpg?x=1&y=2'),
+        )
+        self.news.content = ' '.join(['word'] * 450)
+        self.news.save()
+        self.assertEqual(self.stored(News, self.news.pk, 'word_count', 'reading_time', 'first_image_url'), (450, 2, ''))
+
+    def test_update_fields_include_stale_columns(self):
+        self.news.content = '<p>Match day</p>'
+        self.news.save(update_fields=['content'])
+        self.assertEqual(self.stored(News, self.news.pk, 'plain_text', 'word_count'), ('Match day', 2))
+
+        News.objects.filter(pk=self.news.pk).update(plain_text='stale')
+        self.news.title = 'Match day'
+        self.news.save(update_fields=['title'])
+        self.assertEqual(self.stored(News, self.news.pk, 'plain_text'), ('stale',))
+
+    def test_lines(self):
+        facility = Facility.objects.create(
+            name='Main Ground', category=FacilityCategory.objects.create(name='Grounds'),
+            features='Floodlights\n\n  Stands  \nChanging rooms\n',
+        )
+        self.assertEqual(facility.features_list, ['Floodlights', 'Stands', 'Changing rooms'])
+        self.assertEqual(self.stored(Facility, facility.pk, 'features_list'), (['Floodlights', 'Stands', 'Changing rooms'],))
+
+    def test_backfill_migrations(self):
+        blog = BlogPost.objects.create(title='Diet', excerpt='', content='<p>Eat well</p>')
+        facility = Facility.objects.create(
+            name='Main Ground', category=FacilityCategory.objects.create(name='Grounds'), features='Floodlights',
+        )
+        News.objects.update(plain_text='', word_count=0, reading_time=0, first_image_url='')
+        BlogPost.objects.update(plain_text='', word_count=0, reading_time=0)
+        Facility.objects.update(features_list=[])
+
+        for module in (
+            'apps.news.migrations.0006_backfill_derived_fields',
+            'apps.blog.migrations.0005_backfill_derived_fields',
+            'apps.facilities.migrations.0004_backfill_derived_fields',
+        ):
+            import_module(module).backfill(django_apps, None)
+
+        self.assertEqual(self.stored(News, self.news.pk, 'word_count', 'first_image_url'), (5, '/media/a.jpg?x=1&y=2'))
+        self.assertEqual(self.stored(BlogPost, blog.pk, 'plain_text', 'reading_time'), ('Eat well', 1))
+        self.assertEqual(self.stored(Facility, facility.pk, 'features_list'), (['Floodlights'],))
+
+    def test_backfill_command(self):
+        News.objects.update(plain_text='', word_count=0)
+        updated_at = self.stored(News, self.news.pk, 'updated_at')
+        call_command('backfill_derived_fields', model='news.News', stdout=StringIO())
+        self.assertEqual(self.stored(News, self.news.pk, 'word_count', 'updated_at'), (5, *updated_at))
+
+
+class UniqueSlugTests(TestCase):
+
+    def news(self, title, slug=''):
+        return News.objects.create(title=title, slug=slug, excerpt='', content='')
+
+    def test_lowest_free_suffix(self):
+        self.assertEqual(self.news('Summer Camp').slug, 'summer-camp')
+        self.news('Summer Camp', slug='summer-camp-2')
+        self.assertEqual(self.news('Summer Camp').slug, 'summer-camp-1')
+        self.assertEqual(self.news('Summer Camp').slug, 'summer-camp-3')
+
+    def test_numbers_in_titles_are_not_counters(self):
+        self.news('Cup 2024')
+        self.assertEqual(self.news('Cup').slug, 'cup')
+        self.assertEqual(self.news('Cup').slug, 'cup-1')
+
+    def test_long_titles_leave_room_for_the_suffix(self):
+        title = 'A very long headline about the under fourteen league final'
+        first, second = self.news(title), self.news(title)
+        self.assertEqual(first.slug, slug_base(title, max_length=50))
+        self.assertEqual(len(first.slug), 50)
+        self.assertLessEqual(len(second.slug), 50)
+        self.assertTrue(second.slug.endswith('-1'))
+        self.assertTrue(first.slug.startswith(second.slug[:-2]))
+
+    def test_allocator_never_repeats_within_a_batch(self):
+        self.news('Open Day')
+        allocator = SlugAllocator(News)
+        allocator.prefetch(['Open Day', 'Trials'])
+        with self.assertNumQueries(0):
+            slugs = [allocator.allocate(base) for base in ('Open Day', 'Open Day', 'Trials', 'Trials')]
+        self.assertEqual(slugs, ['open-day-1', 'open-day-2', 'trials', 'trials-1'])
+
+    def test_retries_when_another_process_takes_the_slug(self):
+        self.news('Race')
+        # The lookup raced with an insert of the same slug: the first save fails.
+        with mock.patch('apps.core.slugs.unique_slug', side_effect=['race', 'race-1']) as allocate:
+            self.assertEqual(self.news('Race').slug, 'race-1')
+        self.assertEqual(allocate.call_count, 2)
+
+    def test_gives_up_after_the_retries(self):
+        self.news('Race')
+        news = News(title='Race', excerpt='', content='')
+        with mock.patch('apps.core.slugs.unique_slug', return_value='race'), \
+                self.assertRaises(IntegrityError):
+            news.save()
+        self.assertEqual(news.slug, '')
+
+
+class BackupTests(TestCase):
+    """``export_site`` then ``import_site`` restores every row of every backed up model."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('coach', password='secret')
+        self.program = Program.objects.create(
+            name='Junior Cup', short_description='', description='',
+            image='programs/p.jpg', age_group='6-12 years', duration='3 months', fee_amount=1500,
+        )
+        coach = Coach.objects.create(
+            first_name='Sam', last_name='Roy', photo='coaches/c.jpg', designation='Coach',
+            specialization='', bio='', experience_years=5, qualifications='', email='sam@example.com', phone='1',
+        )
+        Batch.objects.create(
+            program=self.program, coach=coach, name='Morning', schedule='Mon',
+            venue='Ground', start_date=date.today(),
+        )
+        News.objects.create(title='Season opens', excerpt='', content='Kick-off on Saturday.', status='published')
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = Path(directory) / 'backup'
+
+    def counts(self):
+        return {model._meta.label: model._base_manager.count() for model in backup.backup_models()}
+
+    def assertRoundTrip(self, restore):
+        counts = self.counts()
+        backup.export_site(self.path, include_media=False)
+        restore()
+        self.assertEqual(self.counts(), counts)
+        restored = Program.objects.get(pk=self.program.pk)
+        self.assertEqual((restored.name, restored.slug), (self.program.name, self.program.slug))
+        self.assertEqual(restored.batches.get().coach.first_name, 'Sam')
+        # Sequences continue past the restored ids.
+        self.assertGreater(User.objects.create_user('new').pk, self.user.pk)
+        self.assertGreater(Program.objects.create(
+            name='Senior Cup', short_description='', description='',
+            image='programs/p.jpg', age_group='13+', duration='3 months', fee_amount=1500,
+        ).pk, self.program.pk)
+
+    def test_restore_into_empty_tables(self):
+        def restore():
+            backup._flush(connection, backup.backup_models())
+            self.assertFalse(any(self.counts().values()))
+            backup.import_site(self.path, include_media=False)
+        self.assertRoundTrip(restore)
+
+    def test_restore_with_flush(self):
+        self.assertRoundTrip(lambda: backup.import_site(self.path, flush=True, include_media=False))
+
+    def test_occupied_tables_need_flush(self):
+        backup.export_site(self.path, include_media=False)
+        with self.assertRaisesMessage(backup.BackupError, 'not empty'):
+            backup.import_site(self.path, include_media=False)
+
+    def test_flush_refuses_rows_outside_the_backup(self):
+        backup.export_site(self.path, include_media=False)
+        LogEntry.objects.log_action(self.user.pk, None, None, 'x', ADDITION)
+        with self.assertRaisesMessage(backup.BackupError, 'admin.LogEntry.user'):
+            backup.import_site(self.path, flush=True, include_media=False)
+        self.assertTrue(Program.objects.filter(pk=self.program.pk).exists())
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class ImportSyncTests(TestCase):
+    """Imports write with ``bulk_update()``; the changes feed must still see them."""
+
+    def setUp(self):
+        self.program = Program.objects.create(
+            name='Junior Cup', slug='junior-cup', short_description='', description='',
+            image='programs/p.jpg', age_group='6-12 years', duration='3 months', fee_amount=1500,
+        )
+        self.event = Event.objects.create(
+            title='Open Day', short_description='', description='', event_type='other',
+            start_date=date.today(), venue='Ground', program=self.program,
+        )
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = Path(directory) / 'programs.csv'
+
+    def run_import(self, content):
+        self.path.write_text(content)
+        result = Importer(IMPORTERS['programs'], self.path).run(dry_run=False)
+        self.assertTrue(result.is_valid, result.errors)
+        return result
+
+    def test_unpublished_row_gets_a_tombstone(self):
+        before = Event.objects.get(pk=self.event.pk).updated_at
+        self.run_import('slug,status\njunior-cup,inactive\n')
+
+        changes = self.client.get(reverse('api:changes')).json()['changes']
+        self.assertIn(
+            ('programs', 'delete', self.program.pk, 'junior-cup'),
+            [(entry['type'], entry['op'], entry['id'], entry['key']) for entry in changes],
+        )
+        # Events embed their program, so they are sent again.
+        self.assertGreater(Event.objects.get(pk=self.event.pk).updated_at, before)
+
+    def test_public_update_writes_no_tombstone(self):
+        self.run_import('slug,name\njunior-cup,Junior Cup 2026\n')
+
+        changes = self.client.get(reverse('api:changes')).json()['changes']
+        ops = {(entry['type'], entry['id']): entry['op'] for entry in changes}
+        self.assertEqual(ops[('programs', self.program.pk)], 'upsert')
+
+
+def content_queries(queries):
+    """Queries other than reads of the version ledger."""
+    return [query for query in queries if 'core_contentversion' not in query['sql']]
+
+
+class SitemapTests(TestCase):
+    """``/sitemap.xml`` and its sections, served from ``apps.core.xmlcache``."""
+
+    def setUp(self):
+        cache.clear()
+        self.news = News.objects.create(title='Kick-off', excerpt='', content='', status='published')
+        News.objects.create(title='Unreleased', excerpt='', content='', status='draft')
+        self.url = reverse('frontend:sitemap_section', args=['news'])
+
+    def test_index_lists_every_section(self):
+        response = self.client.get(reverse('frontend:sitemap_index'))
+        self.assertEqual(response.status_code, 200)
+        for section in ('pages', 'programs', 'news', 'tournaments', 'gallery'):
+            self.assertContains(response, reverse('frontend:sitemap_section', args=[section]))
+
+    def test_section_lists_public_pages(self):
+        content = self.client.get(self.url).content.decode()
+        self.assertIn(reverse('news:detail', args=['kick-off']), content)
+        self.assertIn('<lastmod>', content)
+        self.assertNotIn('unreleased', content)
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url)
+        self.assertEqual(content_queries(queries), [])
+        self.assertEqual(second.content, first.content)
+
+    def test_conditional_get(self):
+        etag = self.client.get(self.url).headers['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_gzip_negotiation(self):
+        plain = self.client.get(self.url)
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn('Accept-Encoding', plain.headers['Vary'])
+        compressed = self.client.get(self.url, HTTP_ACCEPT_ENCODING='br, gzip')
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', compressed.headers['Vary'])
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertEqual(compressed.headers['ETag'], plain.headers['ETag'])
+
+    def test_saves_invalidate_the_section(self):
+        etag = self.client.get(self.url).headers['ETag']
+        News.objects.create(title='Cup final', excerpt='', content='', status='published')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse('news:detail', args=['cup-final']))
+
+    @override_settings(SITEMAP_PAGE_SIZE=1)
+    def test_long_sections_are_paged(self):
+        News.objects.create(title='Cup final', excerpt='', content='', status='published')
+        first = self.client.get(self.url).content.decode()
+        second = self.client.get(self.url, {'p': 2}).content.decode()
+        self.assertIn('kick-off', first)
+        self.assertNotIn('cup-final', first)
+        self.assertIn('cup-final', second)
+
+
+class FeedTests(TestCase):
+    """News feeds, served from ``apps.core.xmlcache``."""
+
+    def setUp(self):
+        cache.clear()
+        self.news = News.objects.create(
+            title='Kick-off', excerpt='Season starts', content='', status='published', published_at=timezone.now(),
+        )
+        News.objects.create(title='Unreleased', excerpt='', content='', status='draft')
+        self.url = reverse('news:feed')
+
+    def test_rss_and_atom(self):
+        rss = self.client.get(self.url)
+        self.assertEqual(rss.headers['Content-Type'], 'application/rss+xml; charset=utf-8')
+        self.assertContains(rss, '<title>Kick-off</title>')
+        self.assertNotContains(rss, 'Unreleased')
+        atom = self.client.get(reverse('news:feed_atom'))
+        self.assertEqual(atom.headers['Content-Type'], 'application/atom+xml; charset=utf-8')
+        self.assertContains(atom, '<title>Kick-off</title>')
+
+    def test_second_request_is_served_from_cache(self):
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertEqual(content_queries(queries), [])
+
+    def test_conditional_get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=response.headers['ETag']).status_code, 304)
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response.headers['Last-Modified']).status_code, 304,
+        )
+
+    def test_gzip_negotiation(self):
+        plain = self.client.get(self.url)
+        compressed = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        for response in (plain, compressed):
+            self.assertIn('Accept-Encoding', response.headers['Vary'])
+
+    def test_saves_invalidate_the_feed(self):
+        etag = self.client.get(self.url).headers['ETag']
+        self.news.title = 'Kick-off moved'
+        self.news.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '<title>Kick-off moved</title>')
+
+    def test_site_name_changes_invalidate_the_feed(self):
+        self.client.get(self.url)
+        settings = SiteSettings.get_settings()
+        settings.site_name = 'Renamed Academy'
+        settings.save()
+        self.assertContains(self.client.get(self.url), 'Renamed Academy News')
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0, SYNC_TOMBSTONE_DAYS=90)
+class ChangesFeedTests(TestCase):
+    """Delta sync at ``/api/v1/changes/``."""
+
+    def news(self, title, status='published'):
+        return News.objects.create(title=title, excerpt='', content='', status=status)
+
+    def sync(self, cursor=None):
+        response = self.client.get(reverse('api:changes'), {'cursor': cursor} if cursor else {})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        return [(entry['op'], entry['type'], entry['key']) for entry in body['changes']], body['cursor']
+
+    def test_cursor_returns_only_later_changes(self):
+        first = self.news('First')
+        self.news('Second')
+        changes, cursor = self.sync()
+        self.assertEqual(changes, [('upsert', 'news', 'first'), ('upsert', 'news', 'second')])
+        self.assertEqual(self.sync(cursor), ([], cursor))
+
+        first.title = 'First, again'
+        first.save()
+        changes, _ = self.sync(cursor)
+        self.assertEqual(changes, [('upsert', 'news', 'first')])
+
+    def test_pages_through_rows_sharing_a_timestamp(self):
+        for i in range(5):
+            self.news(f'News {i}')
+        News.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+        seen, position = [], None
+        while True:
+            entries, position, has_more = sync.changes(position, sync.settled_until(), limit=2)
+            seen.extend(entry['id'] for entry in entries)
+            if not has_more:
+                break
+        self.assertEqual(sorted(seen), sorted(News.objects.values_list('pk', flat=True)))
+
+    def test_delete_writes_a_tombstone(self):
+        news = self.news('Gone')
+        _, cursor = self.sync()
+        news.delete()
+        changes, _ = self.sync(cursor)
+        self.assertEqual(changes, [('delete', 'news', 'gone')])
+
+    def test_unpublish_writes_a_tombstone(self):
+        news = self.news('Hidden')
+        _, cursor = self.sync()
+        news.status = 'draft'
+        news.save()
+        changes, _ = self.sync(cursor)
+        self.assertEqual(changes, [('delete', 'news', 'hidden')])
+
+    def test_drafts_never_appear(self):
+        draft = self.news('Draft', status='draft')
+        draft.delete()
+        self.assertEqual(self.sync(), ([], None))
+        self.assertFalse(Tombstone.objects.exists())
+
+    def test_prune_tombstones(self):
+        now = timezone.now()
+        Tombstone.objects.create(resource='news', object_id=1, key='old', deleted_at=now - timedelta(days=91))
+        recent = Tombstone.objects.create(resource='news', object_id=2, key='recent', deleted_at=now - timedelta(days=89))
+        call_command('prune_tombstones', stdout=StringIO())
+        self.assertEqual(list(Tombstone.objects.values_list('pk', flat=True)), [recent.pk])
+
+    def test_expired_and_invalid_cursors(self):
+        expired = sync.encode_cursor((timezone.now() - timedelta(days=91), 'news', 1))
+        response = self.client.get(reverse('api:changes'), {'cursor': expired})
+        self.assertEqual(response.status_code, 410)
+        response = self.client.get(reverse('api:changes'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+
+class ResourceAPITests(TestCase):
+    """Sparse fieldsets and the page envelope of ``/api/v1/<resource>/``."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(25):
+            News.objects.create(title=f'News {i:02}', excerpt='Short', content='Long', status='published')
+        News.objects.create(title='Draft', excerpt='', content='', status='draft')
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, url, **params):
+        return self.client.get(url, params)
+
+    def test_default_list_fields_and_envelope(self):
+        body = self.get(reverse('api:list', args=['news'])).json()
+        self.assertEqual(len(body['data']), 20)
+        self.assertEqual(
+            list(body['data'][0]), ['slug', 'title', 'category', 'excerpt', 'featured_image', 'published_at'],
+        )
+        self.assertEqual(body['meta']['count'], 25)
+        self.assertEqual(body['meta']['page_size'], 20)
+        self.assertIsNone(body['meta']['previous'])
+
+        second = self.client.get(body['meta']['next']).json()
+        self.assertEqual(len(second['data']), 5)
+        self.assertIsNone(second['meta']['next'])
+        self.assertIsNotNone(second['meta']['previous'])
+        slugs = {row['slug'] for row in body['data'] + second['data']}
+        self.assertEqual(len(slugs), 25)
+        self.assertNotIn('draft', slugs)
+
+    def test_page_size(self):
+        body = self.get(reverse('api:list', args=['news']), page_size=7).json()
+        self.assertEqual((len(body['data']), body['meta']['page_size']), (7, 7))
+        for raw in ('0', '101', 'ten'):
+            response = self.get(reverse('api:list', args=['news']), page_size=raw)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('page_size', response.json()['error'])
+
+    def test_sparse_fields(self):
+        body = self.get(reverse('api:list', args=['news']), fields=' title, slug,,title ').json()
+        self.assertEqual(list(body['data'][0]), ['title', 'slug'])
+        detail = self.get(reverse('api:detail', args=['news', 'news-00']), fields='content,is_pinned').json()
+        self.assertEqual(detail, {'data': {'content': 'Long', 'is_pinned': False}})
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.get(reverse('api:list', args=['news']), fields='title,secret,views')
+        self.assertEqual(response.status_code, 400)
+        message = response.json()['error']
+        self.assertIn('Unknown field(s) for news: secret, views.', message)
+        self.assertIn('Available: slug, title', message)
+        response = self.get(reverse('api:detail', args=['news', 'news-00']), fields='secret')
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_resource_and_hidden_rows(self):
+        self.assertEqual(self.get(reverse('api:list', args=['secrets'])).status_code, 404)
+        self.assertEqual(self.get(reverse('api:detail', args=['news', 'draft'])).status_code, 404)
+
+
+class KeysetPaginationTests(TestCase):
+    """Seek pagination of the admin match list, keyed on (-match_date, -kickoff, -id)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        tournament = Tournament.objects.create(name='Cup', start_date=date(2026, 1, 1))
+        home = Team.objects.create(name='Home')
+        away = Team.objects.create(name='Away')
+        day, next_day = date(2026, 3, 1), date(2026, 3, 2)
+        # Ties on the date, on the kick-off time and a match without one.
+        for match_date, match_time in [
+            (day, clock_time(18)), (day, None), (next_day, clock_time(9)), (day, clock_time(18)),
+            (next_day, None), (day, clock_time(10)), (next_day, clock_time(20)),
+        ]:
+            Match.objects.create(
+                tournament=tournament, home_team=home, away_team=away,
+                match_date=match_date, match_time=match_time,
+            )
+        cls.expected = [
+            match.pk for match in sorted(
+                Match.objects.all(),
+                key=lambda match: (match.match_date, match.match_time or clock_time.min, match.pk),
+                reverse=True,
+            )
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def view(self, cursor=None):
+        view = MatchListView()
+        view.setup(RequestFactory().get('/', {'cursor': cursor} if cursor else {}))
+        return view
+
+    def page(self, cursor=None, size=3):
+        view = self.view(cursor)
+        _, page, rows, _ = view.paginate_queryset(view.get_queryset(), size)
+        return page, [match.pk for match in rows]
+
+    @staticmethod
+    def cursor(url):
+        return url.split('cursor=')[1]
+
+    def test_cursor_round_trip(self):
+        view = self.view()
+        queryset = view.get_queryset()
+        match = queryset.get(pk=self.expected[0])
+        cursor = view.encode_cursor('next', match, view.keyset_ordering)
+        self.assertEqual(
+            view.decode_cursor(cursor, view.keyset_ordering, queryset),
+            ('next', [match.match_date, match.kickoff, match.pk]),
+        )
+
+    def test_pages_follow_the_ordering(self):
+        seen, cursor = [], None
+        while True:
+            page, rows = self.page(cursor)
+            seen.extend(rows)
+            if not page.has_next:
+                break
+            cursor = self.cursor(page.next_url)
+        self.assertEqual(seen, self.expected)
+
+    def test_previous_page(self):
+        first, first_rows = self.page()
+        second, second_rows = self.page(self.cursor(first.next_url))
+        self.assertEqual(second_rows, self.expected[3:6])
+        self.assertTrue(second.has_previous)
+
+        previous, previous_rows = self.page(self.cursor(second.previous_url))
+        self.assertEqual(previous_rows, first_rows)
+        self.assertFalse(previous.has_previous)
+        self.assertTrue(previous.has_next)
+
+    def test_tampered_cursors(self):
+        view = self.view()
+        queryset = view.get_queryset()
+
+        def encode(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+        for cursor in [
+            'not base64 !', encode('next'), encode(['sideways', ['2026-03-01', '00:00:00', 1]]),
+            encode(['next', ['2026-03-01', 1]]), encode(['next', ['yesterday', '00:00:00', 1]]),
+        ]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursor):
+                    view.decode_cursor(cursor, view.keyset_ordering, queryset)
+                # The list falls back to its first page.
+                self.assertEqual(self.page(cursor)[1], self.expected[:3])
+
+    def test_gallery_categories_are_paginated(self):
+        GalleryCategory.objects.bulk_create(
+            GalleryCategory(name=f'Album {i:02}', slug=f'album-{i:02}') for i in range(25)
+        )
+        self.client.force_login(User.objects.create_user('staff', is_staff=True))
+        url = reverse('admin_dashboard:gallery:category-list')
+        response = self.client.get(url)
+        self.assertEqual(len(response.context['categories']), 20)
+        response = self.client.get(url + response.context['page_obj'].next_url)
+        self.assertEqual([category.name for category in response.context['categories']], [f'Album {i}' for i in range(20, 25)])
+
+
+class ContentVersionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.news = News.objects.create(title='Kick-off', excerpt='', content='', status='published')
+
+    def test_bump_changes_the_token(self):
+        before = versions.token(News)
+        self.assertEqual(versions.token(News), before)
+        versions.bump(News)
+        after = versions.token(News)
+        self.assertNotEqual(after, before)
+        # The epoch prefix stays; only the counter moved.
+        self.assertEqual(after.split('.')[0], before.split('.')[0])
+
+    def test_emptied_ledger_never_reuses_tokens(self):
+        ContentVersion.objects.all().delete()
+        versions.bump(News)
+        old = versions.token(News)
+        # A new or restored database starts counting from zero again.
+        ContentVersion.objects.all().delete()
+        versions.bump(News)
+        self.assertEqual(ContentVersion.objects.get(model='news.news').version, 1)
+        self.assertNotEqual(versions.token(News), old)
+
+    def test_read_once_per_request(self):
+        versions.token()  # the epoch is created on the first read of a new ledger
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('api:detail', args=['news', self.news.slug]))
+        ledger_reads = [query for query in queries if 'FROM "core_contentversion"' in query['sql']]
+        self.assertEqual(len(ledger_reads), 1)
+
+    def test_conditional_get(self):
+        url = reverse('api:detail', args=['news', self.news.slug])
+        response = self.client.get(url)
+        etag = response.headers['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.news.title = 'Kick-off moved'
+        self.news.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.json()['data']['title'], 'Kick-off moved')
+
+    def test_new_database_does_not_serve_old_cache_entries(self):
+        url = reverse('api:detail', args=['news', self.news.slug])
+        etag = self.client.get(url).headers['ETag']
+        # The rows change behind the ledger's back and the ledger starts over,
+        # as after restoring another database; the shared cache is kept.
+        News.objects.filter(pk=self.news.pk).update(title='Restored')
+        ContentVersion.objects.all().delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['title'], 'Restored')
+
+
+class InvalidationTests(TestCase):
+    """Delivery of content changes to in-memory caches, in this and other workers."""
+
+    def setUp(self):
+        # Subscribers of the real caches stay out of the way; _seen is per test.
+        for name in ('_subscribers', '_seen'):
+            patcher = mock.patch.dict(getattr(invalidation, name), clear=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.delivered = []
+        self.label = versions.label(Program)
+
+    def subscribe(self, local=True):
+        invalidation.subscribe([Program], lambda labels: self.delivered.append(labels), local=local)
+
+    def change_elsewhere(self):
+        """A write by another worker: the ledger moves, nothing is published here."""
+        ContentVersion.objects.filter(model=self.label).update(version=F('version') + 1)
+
+    def test_writer_delivers_at_once_and_on_commit(self):
+        self.subscribe()
+        with self.captureOnCommitCallbacks(execute=True):
+            versions.bump(Program)
+            self.assertEqual(self.delivered, [{self.label}])
+        self.assertEqual(self.delivered, [{self.label}, {self.label}])
+
+    def test_non_local_subscribers_skip_own_writes(self):
+        self.subscribe(local=False)
+        with self.captureOnCommitCallbacks(execute=True):
+            versions.bump(Program)
+        self.assertEqual(self.delivered, [])
+        # The poll doesn't deliver it again either.
+        self.assertEqual(invalidation.poll(), [])
+
+    def test_poll_delivers_changes_from_other_workers(self):
+        versions.bump(Program)
+        versions.current()
+        invalidation.poll()
+        self.subscribe(local=False)
+
+        self.assertEqual(invalidation.poll(), [])
+        self.change_elsewhere()
+        self.assertEqual(invalidation.poll(), [self.label])
+        self.assertEqual(self.delivered, [{self.label}])
+        self.assertEqual(invalidation.poll(), [])
+
+    def test_new_epoch_delivers_everything(self):
+        versions.current()
+        invalidation.poll()
+        self.subscribe(local=False)
+
+        # A restored or flushed database: new epoch, counters from zero.
+        ContentVersion.objects.all().delete()
+        versions._local.versions = None
+        versions.current()
+        invalidation.poll()
+        self.assertEqual(self.delivered, [{self.label}])
+
+    def test_local_cache_drops_values_loaded_during_a_change(self):
+        local_cache = invalidation.LocalCache(Program)
+        loads = []
+
+        def load():
+            loads.append(1)
+            if len(loads) == 1:
+                # Delivered by the bus while the value was being built.
+                invalidation._dispatch([self.label], local=False)
+            return len(loads)
+
+        self.assertEqual(local_cache.get_or_set('key', load), 1)
+        self.assertEqual(local_cache.get_or_set('key', load), 2)
+        self.assertEqual(local_cache.get_or_set('key', load), 2)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'LISTEN/NOTIFY needs PostgreSQL')
+class NotifyTests(TransactionTestCase):
+
+    def setUp(self):
+        self.listener = connection.get_new_connection(connection.get_connection_params())
+        self.addCleanup(self.listener.close)
+        self.listener.autocommit = True
+        with self.listener.cursor() as cursor:
+            cursor.execute(f'LISTEN {invalidation.CHANNEL}')
+
+    def notifications(self):
+        payloads = []
+        if select.select([self.listener], [], [], 1) != ([], [], []):
+            self.listener.poll()
+            payloads = [notify.payload for notify in self.listener.notifies]
+            self.listener.notifies.clear()
+        return payloads
+
+    def test_notified_on_commit_only(self):
+        with transaction.atomic():
+            versions.bump(Program)
+            self.assertEqual(self.notifications(), [])
+        self.assertEqual(self.notifications(), [versions.label(Program)])
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            versions.bump(Program)
+            raise RuntimeError
+        self.assertEqual(self.notifications(), [])
+
+
+class NotificationFeedTests(TestCase):
+    """The admin notification feed and its ``<latest id>.<writes>`` version."""
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(User.objects.create_user('staff', is_staff=True))
+        self.url = reverse('admin_dashboard:notification-feed')
+
+    def submit(self, subject='Hello'):
+        with self.captureOnCommitCallbacks(execute=True):
+            return ContactMessage.objects.create(name='Ann', email='ann@example.com', subject=subject, message='Hi')
+
+    def poll(self, since=None):
+        return self.client.get(self.url, {'since': since} if since is not None else {})
+
+    def test_version_format(self):
+        self.assertEqual(notifications.current_version(), '0.0')
+        message = self.submit()
+        latest = AdminNotification.objects.get().pk
+        version = notifications.current_version()
+        self.assertEqual(version.partition('.')[0], str(latest))
+        self.assertEqual(notifications.latest_id(version), latest)
+        self.assertEqual(notifications.latest_id('garbage'), 0)
+        self.assertEqual(notifications.latest_id('-5.1'), 0)
+
+        # Status changes add no notification but move the version, so badges update.
+        with self.captureOnCommitCallbacks(execute=True):
+            message.status = ContactMessage.Status.READ
+            message.save()
+        moved = notifications.current_version()
+        self.assertNotEqual(moved, version)
+        self.assertEqual(notifications.latest_id(moved), latest)
+
+    def test_feed(self):
+        self.submit('First')
+        data = self.poll().json()
+        self.assertEqual([item['title'] for item in data['items']], ['Ann: First'])
+        self.assertEqual(data['counts']['new_messages'], 1)
+
+        with self.assertNumQueries(2):  # session and user; the version is a cache read
+            self.assertEqual(self.poll(data['version']).status_code, 204)
+
+        self.submit('Second')
+        newer = self.poll(data['version']).json()
+        self.assertEqual([item['title'] for item in newer['items']], ['Ann: Second'])
+        self.assertEqual(newer['counts']['new_messages'], 2)
+
+    def test_version_ahead_of_the_server_gets_the_full_feed(self):
+        self.submit('First')
+        data = self.poll('999.999').json()
+        self.assertEqual([item['title'] for item in data['items']], ['Ann: First'])
+
+    @override_settings(NOTIFICATION_RETENTION_DAYS=30)
+    def test_prune_keeps_recent_and_the_newest(self):
+        for i in range(notifications.NOTIFICATION_FEED_LIMIT + 5):
+            self.submit(f'Message {i}')
+        ids = list(AdminNotification.objects.order_by('id').values_list('id', flat=True))
+        old = timezone.now() - timedelta(days=31)
+        AdminNotification.objects.filter(id__in=ids[:10]).update(created_at=old)
+
+        self.assertEqual(notifications.prune(), 5)
+        self.assertEqual(list(AdminNotification.objects.order_by('id').values_list('id', flat=True)), ids[5:])
+        AdminNotification.objects.update(created_at=old)
+        self.assertEqual(notifications.prune(), 0)
+
+
+class RelatedContentTests(TestCase):
+
+    def setUp(self):
+        self.trials = self.news('Goalkeeper trials', 'Under-14 goalkeeper trials on Saturday.')
+        self.camp = self.news('Goalkeeper camp', 'A summer camp for young goalkeeper talent.')
+        self.cricket = self.news('Cricket nets open', 'The cricket nets open for the summer season.')
+        self.gala = self.news('Swimming gala', 'Results from the inter-school swimming gala.')
+
+    def news(self, title, content):
+        return News.objects.create(title=title, excerpt='', content=content, status='published')
+
+    def related(self, news):
+        return [item.pk for item in related.related_to('news', news, limit=6)]
+
+    def test_rare_shared_terms_rank_first(self):
+        related.compute('news')
+        self.assertEqual(self.related(self.trials)[0], self.camp.pk)
+        self.assertEqual(self.related(self.camp)[0], self.trials.pk)
+        self.assertNotIn(self.gala.pk, self.related(self.trials))
+
+    def test_terms_in_every_document_carry_no_weight(self):
+        documents = {1: Counter(['club', 'keeper']), 2: Counter(['club', 'keeper']), 3: Counter(['club', 'swim'])}
+        documents[4] = Counter(['club'])
+        vectors = related._vectors(documents)
+        self.assertNotIn(4, vectors)
+        self.assertGreater(vectors[3]['swim'], vectors[3]['club'])
+
+    def test_only_edited_items_are_recomputed(self):
+        self.assertEqual(related.compute('news'), 4)
+        self.assertEqual(related.compute('news'), 0)
+
+        self.gala.content = 'Goalkeeper gloves for the swimming gala winners.'
+        self.gala.save()
+        updated = related.compute('news')
+        self.assertGreaterEqual(updated, 1)
+        self.assertLess(updated, 4)
+        self.assertIn(self.gala.pk, self.related(self.trials) + self.related(self.camp))
+
+    def test_unpublished_targets_are_replaced(self):
+        related.compute('news')
+        self.camp.status = 'draft'
+        self.camp.save()
+        # Hidden at once, recomputed on the next run.
+        self.assertNotIn(self.camp.pk, self.related(self.trials))
+        related.compute('news')
+        self.assertFalse(RelatedLink.objects.filter(kind='news', target_id=self.camp.pk).exists())
+        self.assertFalse(RelatedLink.objects.filter(kind='news', source_id=self.camp.pk).exists())
+
+    def test_full_run_recomputes_everything(self):
+        related.compute('news')
+        self.assertEqual(related.compute('news', full=True), 4)
+
+
+class TypeaheadTests(TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(typeahead, '_index', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.football = self.program('Junior Football')
+        self.program('Junior Cricket')
+        self.program('Senior Football')
+        Coach.objects.create(
+            first_name='José', last_name='Álvarez', photo='coaches/c.jpg', designation='Coach',
+            specialization='', bio='', experience_years=5, qualifications='', email='jose@example.com', phone='1',
+        )
+
+    def program(self, name, **extra):
+        return Program.objects.create(
+            name=name, short_description='', description='', image='programs/p.jpg',
+            age_group='6-12 years', duration='3 months', fee_amount=1500, **extra,
+        )
+
+    def labels(self, query):
+        return sorted(entry['label'] for entry in typeahead.suggest(query))
+
+    def test_prefixes_of_every_word(self):
+        self.assertEqual(self.labels('jun'), ['Junior Cricket', 'Junior Football'])
+        self.assertEqual(self.labels('foot jun'), ['Junior Football'])
+        self.assertEqual(self.labels('junior-football'), ['Junior Football'])
+        self.assertEqual(self.labels('juniors'), [])
+        self.assertEqual(self.labels('  '), [])
+
+    def test_served_from_memory(self):
+        typeahead.get_index()
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('frontend:search_suggest'), {'q': 'senior'})
+        self.assertEqual(
+            response.json()['suggestions'],
+            [{'label': 'Senior Football', 'type': 'Programs', 'url': reverse('programs:detail', args=['senior-football'])}],
+        )
+
+    def test_accents_and_case_are_folded(self):
+        self.assertEqual(self.labels('jose'), ['José Álvarez'])
+        self.assertEqual(self.labels('ÁLV'), ['José Álvarez'])
+
+    def test_local_saves_patch_the_index(self):
+        typeahead.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.program('Junior Hockey')
+            self.football.status = 'inactive'
+            self.football.save()
+        self.assertEqual(self.labels('jun'), ['Junior Cricket', 'Junior Hockey'])
+
+    def test_changes_from_other_workers_rebuild(self):
+        typeahead.get_index()
+        Program.objects.filter(pk=self.football.pk).update(name='Junior Futsal')
+        self.assertEqual(self.labels('futsal'), [])
+        invalidation._dispatch([versions.label(Program)], local=False)
+        self.assertEqual(self.labels('futsal'), ['Junior Futsal'])
+
+    def test_old_index_is_rebuilt(self):
+        typeahead.get_index()
+        Program.objects.filter(pk=self.football.pk).update(name='Junior Futsal')
+        self.assertEqual(self.labels('futsal'), [])
+        with override_settings(TYPEAHEAD_MAX_AGE=0):
+            self.assertEqual(self.labels('futsal'), ['Junior Futsal'])
+
+
+class SearchIndexTests(TestCase):
+    """Full-text search on the database's index, ranked by ``search_rank``."""
+
+    index = SEARCH_INDEXES[BlogPost]
+
+    @classmethod
+    def setUpTestData(cls):
+        def post(title, content):
+            return BlogPost.objects.create(
+                title=title, excerpt='', content=content, featured_image='blog/b.jpg', status='published',
+            )
+
+        cls.in_title = post('Goalkeeping drills', 'Practice every week.')
+        cls.in_content = post('Weekly practice', 'Notes on goalkeeping and defending.')
+        cls.negated = post('Not for goalkeepers', 'Outfield players only.')
+
+    def search(self, term):
+        return list(self.index.search(BlogPost.objects.all(), term).order_by('-search_rank', '-pk'))
+
+    def test_title_matches_rank_first(self):
+        self.assertEqual(self.search('goalkeeping'), [self.in_title, self.in_content])
+        ranks = [post.search_rank for post in self.search('goalkeeping')]
+        self.assertGreater(ranks[0], ranks[1])
+
+    def test_prefixes_match(self):
+        self.assertEqual(set(self.search('goalkeep')), {self.in_title, self.in_content, self.negated})
+
+    def test_operators_are_searched_as_words(self):
+        # Every word must match; FTS5 syntax in the term is not interpreted.
+        self.assertEqual(self.search('NOT goalkeepers'), [self.negated])
+        self.assertEqual(self.search('goalkeeping OR outfield'), [])
+        for term in ['"goalkeeping', 'goal* (keeping', 'drills NEAR/2 practice', 'col:goalkeeping', '-drills +practice']:
+            with self.subTest(term=term):
+                self.search(term)
+        self.assertEqual(self.search('drills AND practice'), [])
+        self.assertEqual(self.search('goalkeeping -drills'), [self.in_title])
+
+    def test_empty_terms_match_nothing(self):
+        self.assertEqual(self.search(''), [])
+        self.assertEqual(self.search('  ?! '), [])
+
+    def test_other_backends_fall_back_to_icontains(self):
+        with mock.patch.object(self.index, 'vendor', return_value='mysql'):
+            results = self.search('keeping dri')
+        self.assertEqual(results, [self.in_title])
+        self.assertEqual(results[0].search_rank, 0.0)
+
+    def test_snippets(self):
+        snippets = self.index.snippets('goalkeeping', [self.in_content.pk])
+        self.assertIn('<mark>goalkeeping</mark>', snippets[self.in_content.pk])
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'tsvector and trigram search need PostgreSQL')
+    def test_postgresql_ilike_catches_partial_words(self):
+        self.assertEqual(self.search('oalkeepin'), [self.in_title, self.in_content])
+        self.assertEqual(self.search('50%_off'), [])
+
+
+class SearchViewTests(TestCase):
+    """The public site search over every ``SEARCH_SOURCES`` entry."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.program = Program.objects.create(
+            name='Goalkeeper Academy', short_description='', description='', image='programs/p.jpg',
+            age_group='6-12 years', duration='3 months', fee_amount=1500,
+        )
+        Program.objects.create(
+            name='Goalkeeper Camp', short_description='', description='', image='programs/p.jpg',
+            age_group='6-12 years', duration='3 months', fee_amount=1500, status='inactive',
+        )
+        BlogPost.objects.create(
+            title='Goalkeeper gloves', excerpt='', content='Which gloves to buy.',
+            featured_image='blog/b.jpg', status='published',
+        )
+        BlogPost.objects.create(
+            title='Goalkeeper draft', excerpt='', content='', featured_image='blog/b.jpg', status='draft',
+        )
+        News.objects.bulk_create(
+            News(title=f'Match report {i}', slug=f'match-report-{i}', excerpt='', content='A goalkeeper save.', status='published')
+            for i in range(25)
+        )
+        # bulk_create sends no signals, so index the rows as the importer does.
+        SEARCH_INDEXES[News].update_many(News.objects.all())
+        cls.url = reverse('frontend:search')
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.context
+
+    def test_no_query(self):
+        context = self.search()
+        self.assertNotIn('results', context)
+        self.assertEqual(self.search(q='   ')['query'], '')
+
+    def test_all_types(self):
+        context = self.search(q='goalkeeper')
+        counts = {source.key: count for source, count in context['type_counts']}
+        # Drafts and inactive rows are not public.
+        self.assertEqual((counts['programs'], counts['blog'], counts['news'], counts['coaches']), (1, 1, 25, 0))
+        self.assertEqual(context['total_count'], 27)
+        self.assertEqual(len(context['results']), 20)
+        self.assertTrue({'programs', 'blog'} <= {result['type'] for result in context['results']})
+        ranks = [result['rank'] for result in context['results']]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+        program = next(result for result in context['results'] if result['type'] == 'programs')
+        self.assertEqual(program['url'], reverse('programs:detail', args=[self.program.slug]))
+
+    def test_one_type_is_paginated(self):
+        context = self.search(q='goalkeeper', type='news')
+        self.assertEqual(context['active_type'], 'news')
+        self.assertEqual(context['page_obj'].paginator.count, 25)
+        self.assertEqual(len(context['results']), 20)
+        self.assertIn('<mark>', context['results'][0]['snippet'])
+        second = self.search(q='goalkeeper', type='news', page=2)
+        self.assertEqual(len(second['results']), 5)
+        titles = {result['title'] for result in context['results'] + second['results']}
+        self.assertEqual(len(titles), 25)
+
+    def test_unknown_type_searches_everything(self):
+        context = self.search(q='gloves', type='nonsense')
+        self.assertEqual(context['active_type'], '')
+        self.assertEqual([result['title'] for result in context['results']], ['Goalkeeper gloves'])
@@ -0,0 +1,218 @@
+"""
+In-memory typeahead suggestions for the public search box.
+
+Each worker keeps a sorted array of ``(word, entry)`` keys built from the
+titles and slugs of visible programs, coaches, tournaments and events. A
+lookup is a ``bisect`` into that array, so suggestions are served without
+touching the database.
+
+The index is built on first use (``gunicorn.conf.py`` warms it at worker start)
+and patched in place when one of those models is saved or deleted in this
+worker. Changes made by other workers arrive through
+``apps.core.invalidation`` and trigger a full rebuild; as a backstop, an
+index older than ``TYPEAHEAD_MAX_AGE`` seconds is rebuilt too.
+
+Indexes are immutable; updates build a new one and swap the module-level
+reference, so concurrent readers always see a consistent index.
+"""
+
+import logging
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models.signals import post_delete, post_save
+
+from . import invalidation
+from .search import TOKEN_RE
+from .site_search import SEARCH_SOURCES
+
+
+logger = logging.getLogger(__name__)
+
+TYPEAHEAD_SOURCES = ('programs', 'coaches', 'tournaments', 'events')
+SUGGESTION_LIMIT = 8
+# Upper bound on keys examined per lookup, so one-letter queries stay cheap.
+MAX_SCAN = 400
+
+
+class Entry:
+    """One suggestion."""
+
+    __slots__ = ('key', 'label', 'type', 'type_label', 'url', 'words')
+
+    def __init__(self, key, label, type, type_label, url, words):
+        self.key = key
+        self.label = label
+        self.type = type
+        self.type_label = type_label
+        self.url = url
+        self.words = words
+
+    def as_dict(self):
+        return {'label': self.label, 'type': self.type_label, 'url': self.url}
+
+
+def normalize(text):
+    """Lower-case ``text`` and strip accents, so 'José' matches 'jose'."""
+    decomposed = unicodedata.normalize('NFKD', str(text).lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+class TypeaheadIndex:
+    """Immutable prefix index over a set of entries."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.built_at = time.monotonic()
+        keys = set()
+        for entry in entries.values():
+            for word in entry.words:
+                keys.add((word, entry.label.lower(), entry.key))
+        self.keys = sorted(keys)
+
+    def suggest(self, query, limit=SUGGESTION_LIMIT):
+        """Entries with a word starting with every word of ``query``."""
+        tokens = TOKEN_RE.findall(normalize(query))
+        if not tokens:
+            return []
+        # Seek on the word with the fewest keys; check the others per entry.
+        ranges = [(self._range(token), token) for token in tokens]
+        (position, end), anchor = min(ranges, key=lambda item: item[0][1] - item[0][0])
+        others = list(tokens)
+        others.remove(anchor)
+
+        results, seen = [], set()
+        end = min(end, position + MAX_SCAN)
+        while position < end and len(results) < limit:
+            key = self.keys[position][2]
+            position += 1
+            if key in seen:
+                continue
+            seen.add(key)
+            entry = self.entries[key]
+            if all(any(w.startswith(token) for w in entry.words) for token in others):
+                results.append(entry)
+        return results
+
+    def _range(self, prefix):
+        """Positions of the keys whose word starts with ``prefix``."""
+        return bisect_left(self.keys, (prefix,)), bisect_left(self.keys, (prefix + '\U0010ffff',))
+
+    def replace(self, key, entry):
+        """Return a new index with ``key`` replaced by ``entry`` (or removed if ``None``)."""
+        entries = dict(self.entries)
+        entries.pop(key, None)
+        if entry is not None:
+            entries[key] = entry
+        return TypeaheadIndex(entries)
+
+
+def _make_entry(source, obj):
+    label = str(obj)
+    words = set(TOKEN_RE.findall(normalize(label)))
+    words.add(obj.slug)
+    return Entry(
+        key=(source.key, obj.pk),
+        label=label,
+        type=source.key,
+        type_label=source.label,
+        url=source.url(obj),
+        words=tuple(sorted(words)),
+    )
+
+
+def build():
+    """Load every visible entry from the database."""
+    entries = {}
+    for name in TYPEAHEAD_SOURCES:
+        source = SEARCH_SOURCES[name]
+        for obj in source.queryset().only(*source.fields).iterator():
+            entry = _make_entry(source, obj)
+            entries[entry.key] = entry
+    return TypeaheadIndex(entries)
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def get_index():
+    """The current index, (re)built if missing or older than ``TYPEAHEAD_MAX_AGE``."""
+    global _index
+    index = _index
+    if index is not None and time.monotonic() - index.built_at < settings.TYPEAHEAD_MAX_AGE:
+        return index
+    with _lock:
+        if _index is index:
+            _index = build()
+        return _index
+
+
+def warm():
+    """Build the index ahead of the first request; failures are retried lazily."""
+    try:
+        get_index()
+    except DatabaseError:
+        logger.warning('Typeahead index not built at startup', exc_info=True)
+
+
+def suggest(query, limit=SUGGESTION_LIMIT):
+    return [entry.as_dict() for entry in get_index().suggest(query, limit)]
+
+
+# Incremental updates
+
+def _is_visible(source, obj):
+    # Visibility filters are plain equality lookups, so they can be checked
+    # on the instance without a query.
+    return (
+        all(getattr(obj, field) == value for field, value in source.filters.items())
+        and not (source.exclude and all(getattr(obj, field) == value for field, value in source.exclude.items()))
+    )
+
+
+def _update(source, pk, instance=None):
+    """Re-index ``instance`` under ``pk``, or drop ``pk`` when ``instance`` is ``None``."""
+    global _index
+    with _lock:
+        if _index is None:
+            return
+        entry = _make_entry(source, instance) if instance and _is_visible(source, instance) else None
+        _index = _index.replace((source.key, pk), entry)
+
+
+def _connect(source):
+    # Applied on commit so a rolled-back save never reaches the index. The pk
+    # is captured now because delete() clears it on the instance.
+    def saved(sender, instance, raw=False, **kwargs):
+        if not raw:
+            pk = instance.pk
+            transaction.on_commit(lambda: _update(source, pk, instance))
+
+    def deleted(sender, instance, **kwargs):
+        pk = instance.pk
+        transaction.on_commit(lambda: _update(source, pk))
+
+    model = source.index.model
+    post_save.connect(saved, sender=model, weak=False, dispatch_uid=f'typeahead_save_{model._meta.label}')
+    post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=f'typeahead_delete_{model._meta.label}')
+
+
+def _rebuild(labels):
+    """Rebuild after content changed through another worker."""
+    global _index
+    with _lock:
+        if _index is not None:
+            _index = build()
+
+
+for _name in TYPEAHEAD_SOURCES:
+    _connect(SEARCH_SOURCES[_name])
+
+invalidation.subscribe(
+    [SEARCH_SOURCES[name].index.model for name in TYPEAHEAD_SOURCES], _rebuild, local=False,
+)
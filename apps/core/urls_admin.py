@@ -37,6 +37,10 @@ community_patterns = [
 urlpatterns = [
     path('', views_admin.DashboardView.as_view(), name='index'),
     path('settings/', views_admin.SettingsView.as_view(), name='settings'),
+    path('notifications/feed/', views_admin.NotificationFeedView.as_view(), name='notification-feed'),
+    path('autocomplete/<str:source>/', views_admin.AutocompleteView.as_view(), name='autocomplete'),
+    path('import/', views_admin.BulkImportView.as_view(), name='import'),
+    path('import/<str:kind>/template.csv', views_admin.BulkImportTemplateView.as_view(), name='import-template'),
 
     # Page Content management
     path('page-content/', include((page_content_patterns, 'page_content'), namespace='page_content')),
@@ -65,4 +69,6 @@ urlpatterns = [
     path('tournaments/', include(('apps.tournaments.urls_admin', 'tournaments'), namespace='tournaments')),
     path('teams/', include(('apps.tournaments.urls_admin_teams', 'teams'), namespace='teams')),
     path('matches/', include(('apps.tournaments.urls_admin_matches', 'matches'), namespace='matches')),
+    path('analytics/', include(('apps.analytics.urls_admin', 'analytics'), namespace='analytics')),
+    path('archive/', include(('apps.archive.urls_admin', 'archive'), namespace='archive')),
 ]
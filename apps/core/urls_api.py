@@ -0,0 +1,15 @@
+"""
+Public JSON API URLs, mounted under ``/api/v1/``.
+"""
+
+from django.urls import path
+from . import views_api
+
+app_name = 'api'
+
+urlpatterns = [
+    path('', views_api.IndexView.as_view(), name='index'),
+    path('changes/', views_api.ChangesView.as_view(), name='changes'),
+    path('<slug:resource>/', views_api.ResourceListView.as_view(), name='list'),
+    path('<slug:resource>/<str:key>/', views_api.ResourceDetailView.as_view(), name='detail'),
+]
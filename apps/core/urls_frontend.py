@@ -3,7 +3,7 @@ Frontend URLs - Public website pages.
 """
 
 from django.urls import path
-from . import views
+from . import sitemaps, views
 
 app_name = 'frontend'
 
@@ -17,6 +17,10 @@ urlpatterns = [
     path('privacy-policy/', views.PrivacyPolicyView.as_view(), name='privacy'),
     path('terms-conditions/', views.TermsConditionsView.as_view(), name='terms'),
     path('sitemap/', views.SitemapView.as_view(), name='sitemap'),
+    path('sitemap.xml', sitemaps.index, name='sitemap_index'),
+    path('sitemap-<slug:section>.xml', sitemaps.section, name='sitemap_section'),
+    path('search/', views.SearchView.as_view(), name='search'),
+    path('search/suggest/', views.SearchSuggestView.as_view(), name='search_suggest'),
 
     # API endpoints
     path('api/chatbot/', views.ChatbotAPIView.as_view(), name='chatbot_api'),
@@ -0,0 +1,150 @@
+"""
+Content version ledger.
+
+One ``ContentVersion`` row per content model counts writes to that model.
+``post_save``/``post_delete`` bump it for the models in
+``VERSIONED_MODELS`` (and any passed to ``track()``); code that writes rows
+without signals (``update()``, ``bulk_create()``, ``bulk_update()``) calls
+``bump()`` itself.
+
+``current()`` reads every counter in one query. Inside a request it is read
+at most once (``ContentVersionMiddleware``), so cache keys and ETags for any
+mix of models cost one query per request, however many fragments use them.
+The counter is bumped in the writing transaction, so it changes together
+with the content, and all workers see it; ``apps.core.invalidation``
+delivers the change to their in-memory caches.
+
+Counters restart from zero when the ledger is emptied (``flush``, a new or
+restored database), while the shared cache keeps the entries keyed by the
+old counters. The ledger therefore also holds an epoch, a random number
+chosen when it is first read, and every token starts with it.
+"""
+
+import secrets
+import threading
+
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from . import invalidation
+from .models import ContentVersion
+
+
+VERSIONED_MODELS = (
+    'core.sitesettings', 'core.pagesettings', 'core.aboutpagecontent', 'core.homepagecontent',
+    'core.communitypagecontent', 'core.boardmember', 'core.communityactivity',
+    'programs.program', 'programs.batch', 'coaches.coach',
+    'events.event', 'events.eventformfield', 'news.news',
+    'gallery.gallerycategory', 'gallery.galleryimage', 'gallery.galleryvideo',
+    'blog.blogcategory', 'blog.blogpost', 'testimonials.testimonial', 'hero.heroslide',
+    'achievements.achievement', 'accreditations.accreditation',
+    'facilities.facilitycategory', 'facilities.facility',
+    'tournaments.tournament', 'tournaments.team', 'tournaments.match',
+)
+
+# Ledger row holding the epoch rather than a counter.
+EPOCH = '_epoch'
+
+_local = threading.local()
+
+# Labels of the models whose versions every process keeps current.
+tracked = set()
+
+
+def label(model):
+    return model if isinstance(model, str) else model._meta.label_lower
+
+
+def bump(*models):
+    """Record that rows of ``models`` (classes or labels) were written."""
+    now = timezone.now()
+    changed = {}
+    # A fixed order, so concurrent transactions lock the rows the same way.
+    for name in sorted({label(model) for model in models}):
+        if not ContentVersion.objects.filter(model=name).update(version=F('version') + 1, changed_at=now):
+            try:
+                with transaction.atomic():
+                    ContentVersion.objects.create(model=name, version=1, changed_at=now)
+                changed[name] = 1
+                continue
+            except IntegrityError:
+                # Another process created the row first.
+                ContentVersion.objects.filter(model=name).update(version=F('version') + 1, changed_at=now)
+        # Inside a transaction the row stays locked, so this is the version written.
+        changed[name] = ContentVersion.objects.filter(model=name).values_list('version', flat=True).get()
+    _local.versions = None
+    invalidation.publish(changed)
+
+
+def current():
+    """Every model's version, as ``{label: version}``."""
+    versions = getattr(_local, 'versions', None)
+    if versions is None:
+        versions = dict(ContentVersion.objects.values_list('model', 'version'))
+        if EPOCH not in versions:
+            versions[EPOCH] = _create_epoch()
+        if getattr(_local, 'in_request', False):
+            _local.versions = versions
+    return versions
+
+
+def _create_epoch():
+    try:
+        with transaction.atomic():
+            ContentVersion.objects.create(model=EPOCH, version=secrets.randbits(48), changed_at=timezone.now())
+    except IntegrityError:
+        # Another process created it first.
+        pass
+    return ContentVersion.objects.filter(model=EPOCH).values_list('version', flat=True).get()
+
+
+def token(*models):
+    """The epoch and the versions of ``models`` as a short string, for cache keys and ETags."""
+    versions = current()
+    return '.'.join(str(versions.get(label(model), 0)) for model in (EPOCH, *models))
+
+
+def _changed(sender, **kwargs):
+    bump(sender)
+
+
+def track(*models):
+    """Bump the version of each of ``models`` on every save and delete."""
+    for model in models:
+        name = label(model)
+        model = apps.get_model(name)
+        tracked.add(name)
+        post_save.connect(_changed, sender=model, dispatch_uid=f'content_version_save_{name}')
+        post_delete.connect(_changed, sender=model, dispatch_uid=f'content_version_delete_{name}')
+
+
+class ContentVersionMiddleware:
+    """Read the ledger at most once per request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _local.in_request = True
+        _local.versions = None
+        try:
+            return self.get_response(request)
+        finally:
+            _local.in_request = False
+            _local.versions = None
+
+
+class TemplateVersions:
+    """
+    Versions for templates, read only if a template uses one:
+    ``{% cache 3600 footer content_versions.programs_program %}``.
+    """
+
+    def __getitem__(self, name):
+        return token(name.replace('_', '.', 1))
+
+
+track(*VERSIONED_MODELS)
@@ -2,6 +2,8 @@
 Core app frontend views - Public pages.
 """
 
+from django.core.paginator import Paginator
+from django.utils.cache import patch_cache_control
 from django.views.generic import TemplateView, FormView
 from django.views import View
 from django.urls import reverse_lazy
@@ -26,6 +28,8 @@ from apps.accreditations.models import Accreditation
 from apps.facilities.models import Facility
 from apps.gallery.models import GalleryCategory
 from apps.tournaments.models import Tournament, Match
+from . import catalog, typeahead
+from .site_search import RESULTS_PER_PAGE, SEARCH_SOURCES, match_counts, search_all, search_source
 
 
 class HomeView(TemplateView):
@@ -34,33 +38,33 @@ class HomeView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['hero_slides'] = HeroSlide.objects.filter(is_active=True).order_by('display_order')
-        context['programs'] = Program.objects.filter(status='active', is_featured=True)[:6]
-        context['coaches'] = Coach.objects.filter(status='active', show_on_website=True)[:4]
-        context['testimonials'] = Testimonial.objects.filter(is_active=True, is_featured=True)[:6]
-        context['gallery_images'] = GalleryImage.objects.filter(is_active=True)[:8]
-        context['news'] = News.objects.filter(status='published', show_on_homepage=True)[:3]
-        context['upcoming_events'] = Event.objects.filter(status='upcoming', show_on_homepage=True)[:3]
-        context['recent_posts'] = BlogPost.objects.filter(status='published')[:3]
+        context['hero_slides'] = HeroSlide.objects.cached().filter(is_active=True).order_by('display_order')
+        context['programs'] = Program.objects.cached().filter(status='active', is_featured=True).cards()[:6]
+        context['coaches'] = Coach.objects.cached().filter(status='active', show_on_website=True).cards()[:4]
+        context['testimonials'] = Testimonial.objects.cached().filter(is_active=True, is_featured=True)[:6]
+        context['gallery_images'] = GalleryImage.objects.cached().filter(is_active=True)[:8]
+        context['news'] = News.objects.cached().filter(status='published', show_on_homepage=True).cards()[:3]
+        context['upcoming_events'] = Event.objects.cached().filter(status='upcoming', show_on_homepage=True).cards()[:3]
+        context['recent_posts'] = BlogPost.objects.cached().filter(status='published').cards()[:3]
         # Add page content
         context['homepage_content'] = HomepageContent.get_content()
         context['about_content'] = AboutPageContent.get_content()
         # Add achievements and accreditations
-        context['achievements'] = Achievement.objects.filter(is_active=True, show_on_homepage=True).order_by('display_order')[:6]
-        context['accreditations'] = Accreditation.objects.filter(is_active=True, show_on_homepage=True).order_by('display_order')[:8]
+        context['achievements'] = catalog.filter(Achievement, is_active=True, show_on_homepage=True)[:6]
+        context['accreditations'] = catalog.filter(Accreditation, is_active=True, show_on_homepage=True)[:8]
         # Add facilities
-        context['facilities'] = Facility.objects.filter(is_active=True, show_on_homepage=True).select_related('category').order_by('display_order')[:6]
+        context['facilities'] = catalog.filter(Facility, is_active=True, show_on_homepage=True)[:6]
         # Add tournaments and matches
-        context['tournaments'] = Tournament.objects.filter(
+        context['tournaments'] = Tournament.objects.cached().filter(
             show_on_homepage=True,
             status__in=['upcoming', 'ongoing']
         ).order_by('-is_major', 'display_order')[:3]
-        context['major_tournaments'] = Tournament.objects.filter(
+        context['major_tournaments'] = Tournament.objects.cached().filter(
             is_major=True,
             status__in=['upcoming', 'ongoing']
         ).order_by('display_order')[:2]
         # Only show latest 2 completed matches (Full-Time scores)
-        context['featured_matches'] = Match.objects.filter(
+        context['featured_matches'] = Match.objects.cached().filter(
             show_on_homepage=True,
             status='completed'
         ).select_related('tournament', 'home_team', 'away_team').order_by('-match_date', '-match_time')[:2]
@@ -73,8 +77,8 @@ class AboutView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['board_members'] = BoardMember.objects.filter(show_on_website=True)
-        context['testimonials'] = Testimonial.objects.filter(is_active=True)[:6]
+        context['board_members'] = catalog.filter(BoardMember, show_on_website=True)
+        context['testimonials'] = Testimonial.objects.cached().filter(is_active=True)[:6]
         # Add page content
         context['about_content'] = AboutPageContent.get_content()
         return context
@@ -86,8 +90,8 @@ class CommunityView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['activities'] = CommunityActivity.objects.filter(show_on_website=True)
-        context['featured_activities'] = CommunityActivity.objects.filter(show_on_website=True, is_featured=True)[:3]
+        context['activities'] = CommunityActivity.objects.cached().filter(show_on_website=True).cards()
+        context['featured_activities'] = CommunityActivity.objects.cached().filter(show_on_website=True, is_featured=True).cards()[:3]
         context['page_content'] = CommunityPageContent.get_content()
         return context
 
@@ -184,9 +188,9 @@ class ChatbotAPIView(View):
 
     def _get_programs_response(self, site_settings):
         """Get programs information."""
-        programs = Program.objects.filter(status='active').order_by('display_order')[:6]
+        programs = catalog.filter(Program, status='active')[:6]
 
-        if not programs.exists():
+        if not programs:
             return {
                 'success': True,
                 'message': "We offer various football training programs for all age groups. Please contact us for the latest program details!",
@@ -210,9 +214,9 @@ class ChatbotAPIView(View):
 
     def _get_fees_response(self, site_settings):
         """Get fee structure."""
-        programs = Program.objects.filter(status='active').order_by('display_order')[:6]
+        programs = catalog.filter(Program, status='active')[:6]
 
-        if not programs.exists():
+        if not programs:
             return {
                 'success': True,
                 'message': "Please contact us for our current fee structure and any available discounts!",
@@ -313,9 +317,9 @@ To book your trial:
 
     def _get_coaches_response(self, site_settings):
         """Get coaches information."""
-        coaches = Coach.objects.filter(status='active', show_on_website=True).order_by('display_order')[:6]
+        coaches = catalog.filter(Coach, status='active', show_on_website=True)[:6]
 
-        if not coaches.exists():
+        if not coaches:
             message = """Our coaching team includes:
 
 🏆 UEFA Licensed coaches
@@ -338,14 +342,14 @@ All coaches undergo regular training and background verification."""
             'success': True,
             'message': message,
             'topic': 'coaches',
-            'data': [{'name': c.full_name, 'designation': c.designation} for c in coaches] if coaches.exists() else []
+            'data': [{'name': c.full_name, 'designation': c.designation} for c in coaches]
         }
 
     def _get_facilities_response(self, site_settings):
         """Get facilities information."""
-        facilities = Facility.objects.filter(is_active=True).order_by('display_order')[:6]
+        facilities = catalog.filter(Facility, is_active=True)[:6]
 
-        if not facilities.exists():
+        if not facilities:
             message = """Our world-class facilities include:
 
 🏟️ FIFA-standard football turf
@@ -373,7 +377,7 @@ All coaches undergo regular training and background verification."""
 
     def _get_events_response(self, site_settings):
         """Get upcoming events."""
-        events = Event.objects.filter(status='upcoming').order_by('start_date')[:5]
+        events = Event.objects.filter(status='upcoming').cards().order_by('start_date')[:5]
 
         if not events.exists():
             message = "No upcoming events at the moment. Stay tuned for exciting tournaments and competitions!"
@@ -396,9 +400,11 @@ All coaches undergo regular training and background verification."""
 
     def _get_achievements_response(self, site_settings):
         """Get achievements information."""
-        achievements = Achievement.objects.filter(is_active=True).order_by('-year', 'display_order')[:6]
+        achievements = sorted(
+            catalog.filter(Achievement, is_active=True), key=lambda a: (-a.year, a.display_order)
+        )[:6]
 
-        if not achievements.exists():
+        if not achievements:
             message = """Our academy has a proud history of achievements:
 
 🏆 Multiple district championships
@@ -487,8 +493,50 @@ class SitemapView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['programs'] = Program.objects.filter(status='active')
-        context['coaches'] = Coach.objects.filter(status='active', show_on_website=True)
-        context['facilities'] = Facility.objects.filter(is_active=True)
-        context['gallery_categories'] = GalleryCategory.objects.filter(is_active=True)
+        context['programs'] = Program.objects.filter(status='active').only('name', 'slug')
+        context['coaches'] = Coach.objects.filter(status='active', show_on_website=True).only('first_name', 'last_name', 'slug')
+        context['facilities'] = Facility.objects.filter(is_active=True).only('name', 'slug')
+        context['gallery_categories'] = GalleryCategory.objects.filter(is_active=True).only('name', 'slug')
         return context
+
+
+class SearchView(TemplateView):
+    """Site-wide search across programs, coaches, news, events and more."""
+    template_name = 'frontend/search.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get('q', '').strip()[:200]
+        source = SEARCH_SOURCES.get(self.request.GET.get('type', ''))
+        context.update({
+            'query': query,
+            'active_type': source.key if source else '',
+            'sources': SEARCH_SOURCES.values(),
+        })
+        if not query:
+            return context
+
+        counts = match_counts(query)
+        context['type_counts'] = [(s, counts[s.key]) for s in SEARCH_SOURCES.values()]
+        context['total_count'] = sum(counts.values())
+        if source:
+            paginator = Paginator(source.search(query), RESULTS_PER_PAGE)
+            paginator.count = counts[source.key]  # already counted for the filter
+            page_obj = paginator.get_page(self.request.GET.get('page'))
+            context['page_obj'] = page_obj
+            context['is_paginated'] = page_obj.has_other_pages()
+            context['results'] = search_source(source, query, page_obj.object_list)
+        else:
+            context['results'] = search_all(query, counts)
+        return context
+
+
+class SearchSuggestView(View):
+    """Typeahead suggestions for the search box, served from memory."""
+
+    def get(self, request):
+        query = request.GET.get('q', '').strip()[:100]
+        response = JsonResponse({'query': query, 'suggestions': typeahead.suggest(query)})
+        patch_cache_control(response, public=True, max_age=60)
+        return response
+
@@ -2,22 +2,24 @@
 Core app admin dashboard views.
 """
 
+import tempfile
+import uuid
+from pathlib import Path
+
 from django.views.generic import TemplateView, UpdateView, ListView, CreateView, DeleteView
+from django.views import View
 from django.urls import reverse_lazy
-from django.shortcuts import redirect
+from django.shortcuts import redirect, render
 from django.contrib import messages
+from django.http import Http404, HttpResponse, JsonResponse
 
 from apps.accounts.decorators import AdminRequiredMixin, SuperAdminRequiredMixin
-from apps.programs.models import Program, Batch
-from apps.coaches.models import Coach
-from apps.gallery.models import GalleryImage
-from apps.hero.models import HeroSlide
-from apps.testimonials.models import Testimonial
 from apps.contact.models import ContactMessage, Inquiry
-from apps.events.models import Event, EventRegistration
-from apps.news.models import News
+from apps.events.models import EventRegistration
+from . import autocomplete, importers, notifications
+from .dashboard import get_dashboard_stats
 from .models import SiteSettings, PageSettings, AboutPageContent, HomepageContent, BoardMember, CommunityActivity, CommunityPageContent
-from .forms import SiteSettingsForm, PageSettingsForm, AboutPageContentForm, HomepageContentForm, BoardMemberForm, CommunityActivityForm, CommunityPageContentForm
+from .forms import SiteSettingsForm, PageSettingsForm, AboutPageContentForm, HomepageContentForm, BoardMemberForm, CommunityActivityForm, CommunityPageContentForm, BulkImportForm
 
 
 class DashboardView(AdminRequiredMixin, TemplateView):
@@ -27,20 +29,10 @@ class DashboardView(AdminRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Statistics for dashboard
-        context['total_programs'] = Program.objects.filter(status='active').count()
-        context['total_batches'] = Batch.objects.filter(status='active').count()
-        context['total_coaches'] = Coach.objects.filter(status='active').count()
-        context['upcoming_events'] = Event.objects.filter(status='upcoming').count()
-
-        # Messages and Inquiries
-        context['new_messages'] = ContactMessage.objects.filter(status='new').count()
-        context['new_inquiries'] = Inquiry.objects.filter(status='new').count()
-
-        # Registrations and Content
-        context['total_registrations'] = EventRegistration.objects.count()
+        # Statistics for dashboard (one cached aggregate query)
+        stats = get_dashboard_stats()
+        context.update(stats)
         context['total_posts'] = 0  # Blog posts if you have them
-        context['total_news'] = News.objects.filter(status='published').count()
 
         # Recent items
         context['recent_messages'] = ContactMessage.objects.order_by('-created_at')[:5]
@@ -48,15 +40,156 @@ class DashboardView(AdminRequiredMixin, TemplateView):
         context['recent_registrations'] = EventRegistration.objects.select_related('event').order_by('-created_at')[:5]
 
         # Legacy context (for backward compatibility)
-        context['hero_count'] = HeroSlide.objects.filter(is_active=True).count()
-        context['program_count'] = context['total_programs']
-        context['coach_count'] = context['total_coaches']
-        context['gallery_count'] = GalleryImage.objects.filter(is_active=True).count()
-        context['testimonial_count'] = Testimonial.objects.filter(is_active=True).count()
+        context['program_count'] = stats['total_programs']
+        context['coach_count'] = stats['total_coaches']
 
         return context
 
 
+class NotificationFeedView(AdminRequiredMixin, View):
+    """
+    Poll endpoint for new submissions.
+
+    Clients pass the last version they saw as ``?since=``. An unchanged feed
+    answers 204 from a single cache read; otherwise the items newer than the
+    client's are returned together with the (cached) badge counts. A missing
+    ``since`` is the initial load; a ``since`` ahead of the server's (after a
+    database restore, say) is answered like one, with the full feed.
+    """
+
+    def get(self, request):
+        since = request.GET.get('since', '')
+        version = notifications.current_version()
+        if since == version:
+            return HttpResponse(status=204)
+
+        since_id = notifications.latest_id(since)
+        if since_id > notifications.latest_id(version):
+            since_id = 0
+        stats = get_dashboard_stats()
+        items = notifications.get_feed(since_id)
+        return JsonResponse({
+            'version': version,
+            'items': [
+                {
+                    'id': item.pk,
+                    'kind': item.kind,
+                    'title': item.title,
+                    'url': item.url,
+                    'created_at': item.created_at.isoformat(),
+                }
+                for item in items
+            ],
+            'counts': {
+                'new_messages': stats['new_messages'],
+                'new_inquiries': stats['new_inquiries'],
+                'total_registrations': stats['total_registrations'],
+            },
+        })
+
+
+class AutocompleteView(AdminRequiredMixin, View):
+    """Prefix search for ``AutocompleteSelect`` widgets."""
+
+    def get(self, request, source):
+        if source not in autocomplete.AUTOCOMPLETE_SOURCES:
+            raise Http404
+        results = autocomplete.search(source, request.GET.get('q', ''))
+        return JsonResponse({
+            'results': [{'id': pk, 'text': text} for pk, text in results],
+        })
+
+
+IMPORT_UPLOAD_DIR = Path(tempfile.gettempdir()) / 'aifa-imports'
+IMPORT_SESSION_KEY = 'bulk_import'
+
+
+class BulkImportView(AdminRequiredMixin, View):
+    """
+    CSV/XLSX bulk import with a dry-run preview.
+
+    The uploaded file is validated and previewed first; it is kept in a
+    temporary file referenced from the session until the import is
+    confirmed.
+    """
+    template_name = 'admin_dashboard/import/index.html'
+
+    def get(self, request):
+        form = BulkImportForm(initial={'kind': request.GET.get('kind')})
+        return render(request, self.template_name, {'form': form, 'importers': importers.IMPORTERS})
+
+    def post(self, request):
+        if request.POST.get('action') == 'confirm':
+            return self.confirm(request)
+
+        form = BulkImportForm(request.POST, request.FILES)
+        if not form.is_valid():
+            return render(request, self.template_name, {'form': form, 'importers': importers.IMPORTERS})
+
+        upload = form.cleaned_data['file']
+        IMPORT_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        path = IMPORT_UPLOAD_DIR / f'{uuid.uuid4().hex}{Path(upload.name).suffix.lower()}'
+        with open(path, 'wb') as fh:
+            for chunk in upload.chunks():
+                fh.write(chunk)
+
+        self._discard_pending(request)
+        request.session[IMPORT_SESSION_KEY] = {
+            'kind': form.cleaned_data['kind'],
+            'path': str(path),
+            'name': upload.name,
+        }
+        return self.run(request, form, dry_run=True)
+
+    def confirm(self, request):
+        pending = request.session.get(IMPORT_SESSION_KEY)
+        if not pending or not Path(pending['path']).exists():
+            messages.error(request, 'The uploaded file has expired. Please upload it again.')
+            return redirect('admin_dashboard:import')
+        form = BulkImportForm(initial={'kind': pending['kind']})
+        return self.run(request, form, dry_run=False)
+
+    def run(self, request, form, dry_run):
+        pending = request.session[IMPORT_SESSION_KEY]
+        spec = importers.IMPORTERS[pending['kind']]
+        context = {'form': form, 'importers': importers.IMPORTERS, 'spec': spec, 'file_name': pending['name']}
+        try:
+            result = importers.Importer(spec, pending['path']).run(dry_run=dry_run)
+        except importers.ImportFileError as exc:
+            self._discard_pending(request)
+            form.add_error(None, str(exc))
+            return render(request, self.template_name, context)
+
+        if dry_run or not result.is_valid:
+            context.update({'result': result, 'dry_run': dry_run})
+            return render(request, self.template_name, context)
+
+        self._discard_pending(request)
+        messages.success(
+            request,
+            f'{spec.label} imported: {result.created} created, {result.updated} updated.',
+        )
+        return redirect(spec.list_url)
+
+    @staticmethod
+    def _discard_pending(request):
+        pending = request.session.pop(IMPORT_SESSION_KEY, None)
+        if pending:
+            Path(pending['path']).unlink(missing_ok=True)
+
+
+class BulkImportTemplateView(AdminRequiredMixin, View):
+    """Download an empty CSV with the importable columns."""
+
+    def get(self, request, kind):
+        spec = importers.IMPORTERS.get(kind)
+        if spec is None:
+            raise Http404
+        response = HttpResponse(importers.template_csv(spec), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="{kind}-import-template.csv"'
+        return response
+
+
 class SettingsView(SuperAdminRequiredMixin, UpdateView):
     """Site settings view - Super Admin only."""
     template_name = 'admin_dashboard/settings.html'
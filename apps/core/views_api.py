@@ -0,0 +1,156 @@
+"""
+Public JSON API views (``/api/v1/``).
+
+Lists use keyset pagination (``?cursor=``) with ``?page_size=`` up to
+``MAX_PAGE_SIZE``; lists and details accept ``?fields=a,b,c``. Responses
+are served from ``apps.core.xmlcache`` with an ETag, and may be cached by
+clients and proxies for ``API_MAX_AGE`` seconds. ``changes/`` serves delta
+sync (see ``apps.core.sync``) and is never cached.
+"""
+
+from django.conf import settings
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.views import View
+
+from . import sync, xmlcache
+from .api import API_VERSION, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, RESOURCES, InvalidRequest
+from .pagination import KeysetPaginationMixin
+
+
+def error(status, message):
+    return JsonResponse({'error': message}, status=status)
+
+
+class APIView(View):
+    """Base for API endpoints: GET only, cached per resource, open to other origins."""
+
+    http_method_names = ['get', 'head', 'options']
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        response['Access-Control-Allow-Origin'] = '*'
+        return response
+
+    def get_resource(self, key):
+        try:
+            return RESOURCES[key]
+        except KeyError:
+            raise Http404(f'Unknown resource "{key}".')
+
+    def cached(self, resource, render):
+        version = xmlcache.generations([resource.cache_name])[resource.cache_name]
+        key = xmlcache.cache_key(
+            self.request, resource.cache_name, version, self.request.path, sorted(self.request.GET.lists()),
+        )
+        response = xmlcache.cached_response(self.request, key, render, settings.API_CACHE_TIMEOUT)
+        patch_cache_control(response, public=True, max_age=settings.API_MAX_AGE)
+        return response
+
+
+class IndexView(APIView):
+    """The resources this version of the API serves."""
+
+    def get(self, request):
+        return JsonResponse({
+            'version': API_VERSION,
+            'resources': {
+                key: request.build_absolute_uri(f'{key}/') for key in RESOURCES
+            },
+            'changes': request.build_absolute_uri('changes/'),
+        })
+
+
+class ChangesView(APIView):
+    """Objects created, updated or deleted since ``?cursor=`` (everything without one)."""
+
+    def get(self, request):
+        try:
+            position = sync.decode_cursor(request.GET.get('cursor'))
+        except sync.ExpiredCursor:
+            return error(410, 'This cursor has expired; sync again without a cursor.')
+        except sync.InvalidCursor:
+            return error(400, 'Invalid cursor.')
+
+        entries, last, has_more = sync.changes(position, sync.settled_until())
+        for entry in entries:
+            obj = entry.pop('obj', None)
+            if obj is not None:
+                resource = RESOURCES[entry['type']]
+                entry['data'] = resource.serialize(obj, list(resource.fields), request)
+        response = JsonResponse({
+            'changes': entries,
+            'cursor': sync.encode_cursor(last) if last else None,
+            'has_more': has_more,
+        })
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+class ResourceListView(KeysetPaginationMixin, APIView):
+    """A page of a resource, in the resource's keyset order."""
+
+    def get(self, request, resource):
+        try:
+            resource = self.get_resource(resource)
+            names = resource.parse_fields(request.GET.get('fields'), resource.list_fields)
+            page_size = self.get_page_size()
+        except Http404 as exc:
+            return error(404, str(exc))
+        except InvalidRequest as exc:
+            return error(400, str(exc))
+
+        self.resource = resource
+        self.model = resource.queryset().model
+
+        def render():
+            queryset = resource.plan(resource.filter(resource.queryset(), request.GET), names)
+            _, page, rows, _ = self.paginate_queryset(queryset, page_size)
+            return JsonResponse({
+                'data': [resource.serialize(obj, names, request) for obj in rows],
+                'meta': {
+                    'count': page.approximate_total,
+                    'page_size': page_size,
+                    'next': request.build_absolute_uri(page.next_url) if page.next_url else None,
+                    'previous': request.build_absolute_uri(page.previous_url) if page.previous_url else None,
+                },
+            })
+
+        return self.cached(resource, render)
+
+    def get_keyset_ordering(self):
+        return self.resource.ordering
+
+    def get_page_size(self):
+        raw = self.request.GET.get('page_size')
+        if not raw:
+            return DEFAULT_PAGE_SIZE
+        if not raw.isdigit() or not 1 <= int(raw) <= MAX_PAGE_SIZE:
+            raise InvalidRequest(f'page_size must be a number from 1 to {MAX_PAGE_SIZE}.')
+        return int(raw)
+
+
+class ResourceDetailView(APIView):
+    """One item of a resource, by slug (or id for matches)."""
+
+    def get(self, request, resource, key):
+        try:
+            resource = self.get_resource(resource)
+            names = resource.parse_fields(request.GET.get('fields'), resource.fields)
+            if resource.lookup == 'id' and not key.isdigit():
+                raise Http404('Not found.')
+        except Http404 as exc:
+            return error(404, str(exc))
+        except InvalidRequest as exc:
+            return error(400, str(exc))
+
+        def render():
+            queryset = resource.plan(resource.queryset(), names)
+            obj = get_object_or_404(queryset, **{resource.lookup: key})
+            return JsonResponse({'data': resource.serialize(obj, names, request)})
+
+        try:
+            return self.cached(resource, render)
+        except Http404:
+            return error(404, 'Not found.')
@@ -0,0 +1,89 @@
+"""
+Cached, precompressed XML responses for crawlers and feed readers.
+
+Sitemaps and syndication feeds are polled far more often than the content
+behind them changes. Their rendered XML is cached together with a gzipped
+copy under a *generation* per name, made of the content versions
+(``apps.core.versions``) of the models ``connect``ed to it. Saving or
+deleting one of those models changes the generation in every worker, so
+the next request renders fresh XML and every other request is served from
+the cache.
+
+Responses carry an ``ETag`` (and ``Last-Modified`` when the view sets one),
+so clients revalidating an unchanged document get a 304.
+"""
+
+import gzip
+import hashlib
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import parse_http_date_safe
+
+from . import versions
+
+
+# name -> labels of the models behind it
+_sources = {}
+
+
+def generations(names):
+    """Current generation of each of ``names``, as a dict."""
+    return {name: versions.token(*_sources.get(name, ())) for name in names}
+
+
+def connect(name, models):
+    """Base the generation of ``name`` on the versions of ``models``."""
+    versions.track(*models)
+    _sources[name] = [versions.label(model) for model in models]
+
+
+def cache_key(request, *parts):
+    """Cache key for ``parts`` as served to this request's scheme and host."""
+    raw = ':'.join(str(part) for part in (request.scheme, request.get_host(), *parts))
+    return f'xmlcache:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def cached_response(request, key, render, timeout):
+    """
+    Serve the document stored under ``key``, calling ``render`` on a miss.
+
+    ``render`` returns an ``HttpResponse`` (template responses are rendered
+    here). Only its body and ``Content-Type``/``Last-Modified``/
+    ``X-Robots-Tag`` headers are kept.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        response = render()
+        if hasattr(response, 'render'):
+            response.render()
+        content = response.content
+        entry = {
+            'content': content,
+            'gzip': gzip.compress(content, mtime=0),
+            'etag': f'"{hashlib.md5(content).hexdigest()}"',
+            'headers': {
+                header: response.headers[header]
+                for header in ('Content-Type', 'Last-Modified', 'X-Robots-Tag')
+                if header in response.headers
+            },
+        }
+        cache.set(key, entry, timeout)
+
+    last_modified = entry['headers'].get('Last-Modified')
+    conditional = get_conditional_response(
+        request,
+        etag=entry['etag'],
+        last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+    )
+    if conditional is not None:
+        return conditional
+
+    use_gzip = 'gzip' in request.headers.get('Accept-Encoding', '')
+    response = HttpResponse(entry['gzip'] if use_gzip else entry['content'], headers=entry['headers'])
+    response.headers['ETag'] = entry['etag']
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.events'
+
+    def ready(self):
+        from . import feeds
+        feeds.UpcomingEventsFeed.connect()
@@ -0,0 +1,52 @@
+"""
+Events app RSS/Atom feeds.
+"""
+
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.feedgenerator import Atom1Feed
+
+from apps.core.feeds import FEED_LENGTH, CachedFeed, site_name
+from .models import Event
+
+
+class UpcomingEventsFeed(CachedFeed):
+    """Upcoming events, soonest first."""
+    cache_name = 'events-feed'
+    models = [Event]
+    description = 'Upcoming events, camps and trials.'
+
+    def cache_parts(self, request, *args, **kwargs):
+        # Past events drop out at midnight without any model change.
+        return (timezone.localdate(),)
+
+    def title(self):
+        return f'{site_name()} Upcoming Events'
+
+    def link(self):
+        return reverse('events:list')
+
+    def items(self):
+        return Event.objects.filter(
+            status='upcoming', start_date__gte=timezone.localdate()
+        ).order_by('start_date', 'start_time')[:FEED_LENGTH]
+
+    def item_link(self, item):
+        return reverse('events:detail', kwargs={'slug': item.slug})
+
+    def item_title(self, item):
+        return f'{item.title} ({item.start_date:%d %b %Y})'
+
+    def item_description(self, item):
+        return f'{item.short_description} Venue: {item.venue}.'
+
+    def item_pubdate(self, item):
+        return item.created_at
+
+    def item_categories(self, item):
+        return [item.get_event_type_display()]
+
+
+class AtomUpcomingEventsFeed(UpcomingEventsFeed):
+    feed_type = Atom1Feed
+    subtitle = UpcomingEventsFeed.description
@@ -3,6 +3,8 @@ Events app forms.
 """
 
 from django import forms
+
+from apps.core.autocomplete import AutocompleteSelect
 from .models import Event, EventFormField
 
 
@@ -38,7 +40,7 @@ class EventForm(forms.ModelForm):
             'max_participants': forms.NumberInput(attrs={'class': 'form-input'}),
             'registration_fee': forms.NumberInput(attrs={'class': 'form-input'}),
             'is_free': forms.CheckboxInput(attrs={'class': 'form-checkbox'}),
-            'program': forms.Select(attrs={'class': 'form-select'}),
+            'program': AutocompleteSelect('programs'),
             'status': forms.Select(attrs={'class': 'form-select'}),
             'is_featured': forms.CheckboxInput(attrs={'class': 'form-checkbox'}),
             'show_on_homepage': forms.CheckboxInput(attrs={'class': 'form-checkbox'}),
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['created_at'], name='events_reg_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_add_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['event', 'created_at'], name='events_reg_event_created_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+"""
+Full-text search over events for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_keyset_indexes'),
+    ]
+
+    operations = [
+        create_search_index('events_event', {
+            'title': 'A',
+            'short_description': 'B',
+            'venue': 'C',
+            'description': 'C',
+        }, 'events_event'),
+    ]
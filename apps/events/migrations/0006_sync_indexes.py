@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_view_counts'),
+        ('programs', '0005_sync_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['updated_at', 'id'], name='events_updated_idx'),
+        ),
+    ]
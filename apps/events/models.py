@@ -5,10 +5,20 @@ Events app models - Events, trials, and dynamic form builder.
 from django.db import models
 from django.utils.text import slugify
 from django.utils import timezone
-from apps.core.models import TimeStampedModel
+from apps.core.models import TimeStampedModel, UniqueSlugModel
+from apps.core.querycache import CachingQuerySet
 
 
-class Event(TimeStampedModel):
+class EventQuerySet(CachingQuerySet):
+    def cards(self):
+        """Only the columns event cards and listings render."""
+        return self.only(
+            'title', 'slug', 'event_type', 'short_description', 'featured_image',
+            'start_date', 'end_date', 'start_time', 'venue', 'registration_fee', 'is_free', 'status',
+        )
+
+
+class Event(UniqueSlugModel, TimeStampedModel):
     """Events and trials organized by AIFA."""
 
     class EventType(models.TextChoices):
@@ -71,19 +81,25 @@ class Event(TimeStampedModel):
     meta_title = models.CharField(max_length=70, blank=True)
     meta_description = models.TextField(max_length=160, blank=True)
 
+    views = models.PositiveIntegerField(default=0, editable=False)
+
+    slug_from = ('title',)
+
+    search_fields = {'title': 'A', 'short_description': 'B', 'venue': 'C', 'description': 'C'}
+
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='events_updated_idx'),
+        ]
         verbose_name = "Event"
         verbose_name_plural = "Events"
 
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
-
     @property
     def is_registration_open(self):
         if not self.registration_required:
@@ -187,6 +203,10 @@ class EventRegistration(TimeStampedModel):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='events_reg_created_idx'),
+            models.Index(fields=['event', 'created_at'], name='events_reg_event_created_idx'),
+        ]
         verbose_name = "Event Registration"
         verbose_name_plural = "Event Registrations"
 
@@ -3,11 +3,13 @@ Events app frontend URLs.
 """
 
 from django.urls import path
-from . import views
+from . import feeds, views
 
 app_name = 'events'
 
 urlpatterns = [
+    path('feed/', feeds.UpcomingEventsFeed(), name='feed'),
+    path('feed/atom/', feeds.AtomUpcomingEventsFeed(), name='feed_atom'),
     path('', views.EventListView.as_view(), name='list'),
     path('<slug:slug>/', views.EventDetailView.as_view(), name='detail'),
     path('<slug:slug>/register/', views.EventRegisterView.as_view(), name='register'),
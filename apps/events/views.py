@@ -7,6 +7,8 @@ from django.urls import reverse
 from django.contrib import messages
 from django.shortcuts import get_object_or_404
 
+from apps.analytics.pageviews import PageViewMixin
+from apps.core.related import related_to
 from .models import Event, EventFormField, EventRegistration
 
 
@@ -18,7 +20,7 @@ class EventListView(ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        queryset = Event.objects.filter(status__in=['upcoming', 'ongoing'])
+        queryset = Event.objects.filter(status__in=['upcoming', 'ongoing']).cards()
         event_type = self.request.GET.get('type')
         if event_type:
             queryset = queryset.filter(event_type=event_type)
@@ -31,7 +33,7 @@ class EventListView(ListView):
         return context
 
 
-class EventDetailView(DetailView):
+class EventDetailView(PageViewMixin, DetailView):
     """Public event detail page."""
     model = Event
     template_name = 'frontend/events/detail.html'
@@ -47,6 +49,7 @@ class EventDetailView(DetailView):
             event=self.object
         ).order_by('display_order')
         context['can_register'] = self.object.is_registration_open
+        context['related_events'] = related_to('events', self.object)
         return context
 
 
@@ -11,6 +11,8 @@ from django.views import View
 import csv
 
 from apps.accounts.decorators import AdminRequiredMixin
+from apps.core import versions
+from apps.core.pagination import KeysetPaginationMixin, approximate_count
 from .models import Event, EventFormField, EventRegistration
 from .forms import EventForm, EventFormFieldForm
 
@@ -119,13 +121,14 @@ class ReorderFormFieldsView(AdminRequiredMixin, View):
                     pk=item['id'],
                     event_id=pk
                 ).update(display_order=item['order'])
+            versions.bump(EventFormField)
             return JsonResponse({'status': 'success'})
         except Exception as e:
             return JsonResponse({'status': 'error', 'message': str(e)}, status=400)
 
 
 # Registration Views
-class RegistrationListView(AdminRequiredMixin, ListView):
+class RegistrationListView(AdminRequiredMixin, KeysetPaginationMixin, ListView):
     """List all registrations for an event."""
     model = EventRegistration
     template_name = 'admin_dashboard/events/registrations/list.html'
@@ -139,6 +142,8 @@ class RegistrationListView(AdminRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['event'] = self.event
+        # The pager already counted this queryset; the cached total is reused.
+        context['registration_count'] = approximate_count(self.object_list)
         context['form_fields'] = EventFormField.objects.filter(event=self.event).order_by('display_order')
         return context
 
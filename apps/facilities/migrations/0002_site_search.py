@@ -0,0 +1,26 @@
+"""
+Full-text search over facilities for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facilities', '0001_initial'),
+    ]
+
+    operations = [
+        create_search_index('facilities_facility', {
+            'name': 'A',
+            'short_description': 'B',
+            'description': 'C',
+            'features': 'D',
+        }, 'facilities_facility'),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facilities', '0002_site_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='facility',
+            name='features_list',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
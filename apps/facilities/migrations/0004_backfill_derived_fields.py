@@ -0,0 +1,32 @@
+# Generated by Django 5.0.1 on 2026-10-19 19:24
+
+from django.db import migrations
+
+from apps.core import derived
+
+
+BATCH_SIZE = 500
+
+
+def backfill(apps, schema_editor):
+    # Historical models don't have compute_derived_fields(); mirror it here.
+    Facility = apps.get_model('facilities', 'Facility')
+    batch = []
+    for obj in Facility.objects.only('features').order_by('pk').iterator(chunk_size=BATCH_SIZE):
+        obj.features_list = derived.lines(obj.features)
+        batch.append(obj)
+        if len(batch) == BATCH_SIZE:
+            Facility.objects.bulk_update(batch, ['features_list'])
+            batch = []
+    Facility.objects.bulk_update(batch, ['features_list'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facilities', '0003_derived_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,9 @@
 from django.db import models
-from django.utils.text import slugify
-from apps.core.models import TimeStampedModel
+from apps.core import derived
+from apps.core.models import DerivedFieldsModel, TimeStampedModel, UniqueSlugModel
 
 
-class FacilityCategory(TimeStampedModel):
+class FacilityCategory(UniqueSlugModel, TimeStampedModel):
     """Categories for organizing facilities."""
 
     name = models.CharField(max_length=100)
@@ -16,6 +16,8 @@ class FacilityCategory(TimeStampedModel):
     display_order = models.PositiveIntegerField(default=0)
     is_active = models.BooleanField(default=True)
 
+    slug_from = ('name',)
+
     class Meta:
         ordering = ['display_order', 'name']
         verbose_name = "Facility Category"
@@ -24,18 +26,8 @@ class FacilityCategory(TimeStampedModel):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.name)
-            self.slug = base_slug
-            counter = 1
-            while FacilityCategory.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{base_slug}-{counter}"
-                counter += 1
-        super().save(*args, **kwargs)
-
 
-class Facility(TimeStampedModel):
+class Facility(UniqueSlugModel, DerivedFieldsModel, TimeStampedModel):
     """Infrastructure and facilities of the academy."""
 
     name = models.CharField(max_length=200)
@@ -76,6 +68,15 @@ class Facility(TimeStampedModel):
     show_on_homepage = models.BooleanField(default=False)
     display_order = models.PositiveIntegerField(default=0)
 
+    # Derived from features on save
+    features_list = models.JSONField(default=list, blank=True, editable=False)
+
+    slug_from = ('name',)
+
+    search_fields = {'name': 'A', 'short_description': 'B', 'description': 'C', 'features': 'D'}
+
+    derived_fields = {'features_list': ['features']}
+
     class Meta:
         ordering = ['display_order', '-created_at']
         verbose_name = "Facility"
@@ -84,18 +85,9 @@ class Facility(TimeStampedModel):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.name)
-            self.slug = base_slug
-            counter = 1
-            while Facility.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{base_slug}-{counter}"
-                counter += 1
-        super().save(*args, **kwargs)
+    def compute_derived_fields(self):
+        self.features_list = derived.lines(self.features)
 
     def get_features_list(self):
         """Return features as a list."""
-        if not self.features:
-            return []
-        return [f.strip() for f in self.features.split('\n') if f.strip()]
+        return self.features_list
@@ -2,7 +2,10 @@
 Facilities Frontend Views.
 """
 
+from django.http import Http404
 from django.views.generic import ListView, DetailView
+
+from apps.core import catalog
 from .models import Facility, FacilityCategory
 
 
@@ -27,13 +30,18 @@ class FacilityDetailView(DetailView):
     template_name = 'frontend/facilities/detail.html'
     context_object_name = 'facility'
 
-    def get_queryset(self):
-        return Facility.objects.filter(is_active=True).select_related('category')
+    def get_object(self, queryset=None):
+        facility = catalog.get(Facility, slug=self.kwargs['slug'], is_active=True)
+        if facility is None:
+            raise Http404('No facility found matching the query')
+        return facility
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['related_facilities'] = Facility.objects.filter(
-            is_active=True,
-            category=self.object.category
-        ).exclude(pk=self.object.pk)[:3]
+        context['related_facilities'] = [
+            facility for facility in catalog.filter(
+                Facility, is_active=True, category_id=self.object.category_id
+            )
+            if facility.pk != self.object.pk
+        ][:3]
         return context
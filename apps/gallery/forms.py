@@ -3,6 +3,8 @@ Gallery app forms.
 """
 
 from django import forms
+
+from apps.core.autocomplete import AutocompleteSelect
 from .models import GalleryCategory, GalleryImage, GalleryVideo
 
 
@@ -33,7 +35,7 @@ class GalleryImageForm(forms.ModelForm):
         model = GalleryImage
         fields = ['category', 'title', 'image', 'alt_text', 'is_active', 'display_order']
         widgets = {
-            'category': forms.Select(attrs={'class': 'form-select'}),
+            'category': AutocompleteSelect('gallery-categories'),
             'title': forms.TextInput(attrs={'class': 'form-input'}),
             'alt_text': forms.TextInput(attrs={'class': 'form-input', 'placeholder': 'Describe the image for accessibility'}),
             'is_active': forms.CheckboxInput(attrs={'class': 'form-checkbox'}),
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0003_galleryvideo'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['created_at', 'id'], name='gallery_image_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['category', 'created_at', 'id'], name='gallery_image_cat_created_idx'),
+        ),
+    ]
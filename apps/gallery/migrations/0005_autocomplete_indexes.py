@@ -0,0 +1,38 @@
+"""
+Case-insensitive prefix indexes for the admin autocomplete endpoint.
+
+``istartswith`` compiles to ``UPPER(col) LIKE UPPER(%s)`` on PostgreSQL and to
+a case-insensitive ``LIKE`` on SQLite, so each backend needs its own index.
+"""
+
+from django.db import migrations
+
+from apps.core.db import run_vendor_sql
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0004_keyset_indexes'),
+    ]
+
+    operations = [
+        run_vendor_sql(
+            forward={
+                'postgresql': [
+                    'CREATE INDEX gallery_category_name_prefix_idx ON gallery_gallerycategory (UPPER("name"::text) text_pattern_ops)',
+                ],
+                'sqlite': [
+                    'CREATE INDEX gallery_category_name_prefix_idx ON gallery_gallerycategory ("name" COLLATE NOCASE)',
+                ],
+            },
+            reverse={
+                'postgresql': [
+                    'DROP INDEX gallery_category_name_prefix_idx',
+                ],
+                'sqlite': [
+                    'DROP INDEX gallery_category_name_prefix_idx',
+                ],
+            },
+        ),
+    ]
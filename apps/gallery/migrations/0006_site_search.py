@@ -0,0 +1,24 @@
+"""
+Full-text search over gallery categories for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0005_autocomplete_indexes'),
+    ]
+
+    operations = [
+        create_search_index('gallery_gallerycategory', {
+            'name': 'A',
+            'description': 'C',
+        }, 'gallery_category'),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0007_view_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gallerycategory',
+            index=models.Index(fields=['updated_at', 'id'], name='gallery_category_updated_idx'),
+        ),
+    ]
@@ -4,11 +4,10 @@ Gallery app models.
 
 import re
 from django.db import models
-from django.utils.text import slugify
-from apps.core.models import TimeStampedModel
+from apps.core.models import TimeStampedModel, UniqueSlugModel
 
 
-class GalleryCategory(TimeStampedModel):
+class GalleryCategory(UniqueSlugModel, TimeStampedModel):
     """Gallery album/category."""
 
     name = models.CharField(max_length=100)
@@ -22,19 +21,23 @@ class GalleryCategory(TimeStampedModel):
     meta_title = models.CharField(max_length=70, blank=True, help_text="SEO title (max 70 chars)")
     meta_description = models.CharField(max_length=160, blank=True, help_text="SEO description (max 160 chars)")
 
+    views = models.PositiveIntegerField(default=0, editable=False)
+
+    slug_from = ('name',)
+
+    search_fields = {'name': 'A', 'description': 'C'}
+
     class Meta:
         ordering = ['display_order', 'name']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='gallery_category_updated_idx'),
+        ]
         verbose_name = "Gallery Category"
         verbose_name_plural = "Gallery Categories"
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
-
     @property
     def image_count(self):
         return self.images.filter(is_active=True).count()
@@ -56,6 +59,10 @@ class GalleryImage(TimeStampedModel):
 
     class Meta:
         ordering = ['display_order', '-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='gallery_image_created_idx'),
+            models.Index(fields=['category', 'created_at', 'id'], name='gallery_image_cat_created_idx'),
+        ]
         verbose_name = "Gallery Image"
         verbose_name_plural = "Gallery Images"
 
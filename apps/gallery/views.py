@@ -2,7 +2,11 @@
 Gallery app frontend views.
 """
 
+from django.http import Http404
 from django.views.generic import ListView, DetailView
+
+from apps.analytics.pageviews import PageViewMixin
+from apps.core import catalog
 from .models import GalleryCategory, GalleryImage, GalleryVideo
 
 
@@ -13,7 +17,7 @@ class GalleryListView(ListView):
     context_object_name = 'categories'
 
     def get_queryset(self):
-        return GalleryCategory.objects.filter(is_active=True).order_by('display_order', 'name')
+        return catalog.filter(GalleryCategory, is_active=True)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -31,23 +35,24 @@ class GalleryListView(ListView):
         return context
 
 
-class GalleryCategoryView(DetailView):
+class GalleryCategoryView(PageViewMixin, DetailView):
     """Gallery category with images."""
     model = GalleryCategory
     template_name = 'frontend/gallery/category.html'
     context_object_name = 'category'
     slug_url_kwarg = 'slug'
 
-    def get_queryset(self):
-        return GalleryCategory.objects.filter(is_active=True)
+    def get_object(self, queryset=None):
+        category = catalog.get(GalleryCategory, slug=self.kwargs['slug'], is_active=True)
+        if category is None:
+            raise Http404('No gallery found matching the query')
+        return category
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['images'] = GalleryImage.objects.filter(
+        context['images'] = GalleryImage.objects.cached().filter(
             category=self.object,
             is_active=True
         ).order_by('display_order', '-created_at')
-        context['categories'] = GalleryCategory.objects.filter(
-            is_active=True
-        ).order_by('display_order', 'name')
+        context['categories'] = catalog.filter(GalleryCategory, is_active=True)
         return context
@@ -7,17 +7,19 @@ from django.urls import reverse_lazy
 from django.contrib import messages
 
 from apps.accounts.decorators import AdminRequiredMixin
+from apps.core.pagination import KeysetPaginationMixin
 from .models import GalleryCategory, GalleryImage, GalleryVideo
 from .forms import GalleryCategoryForm, GalleryImageForm, GalleryVideoForm
 
 
 # Category Views
-class CategoryListView(AdminRequiredMixin, ListView):
+class CategoryListView(AdminRequiredMixin, KeysetPaginationMixin, ListView):
     """Admin gallery category listing."""
     model = GalleryCategory
     template_name = 'admin_dashboard/gallery/list.html'
     context_object_name = 'categories'
     paginate_by = 20
+    keyset_ordering = ('display_order', 'name', 'id')
 
     def get_queryset(self):
         return GalleryCategory.objects.all().order_by('display_order', 'name')
@@ -59,7 +61,7 @@ class CategoryDeleteView(AdminRequiredMixin, DeleteView):
 
 
 # Image Views
-class ImageListView(AdminRequiredMixin, ListView):
+class ImageListView(AdminRequiredMixin, KeysetPaginationMixin, ListView):
     """Admin gallery image listing."""
     model = GalleryImage
     template_name = 'admin_dashboard/gallery/list.html'
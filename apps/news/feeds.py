@@ -0,0 +1,49 @@
+"""
+News app RSS/Atom feeds.
+"""
+
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+
+from apps.core.feeds import FEED_LENGTH, CachedFeed, site_name
+from .models import News
+
+
+class NewsFeed(CachedFeed):
+    """Latest published news."""
+    cache_name = 'news-feed'
+    models = [News]
+    description = 'Latest news and announcements.'
+
+    def title(self):
+        return f'{site_name()} News'
+
+    def link(self):
+        return reverse('news:list')
+
+    def items(self):
+        return News.objects.filter(status='published').select_related('author').order_by('-published_at')[:FEED_LENGTH]
+
+    def item_link(self, item):
+        return reverse('news:detail', kwargs={'slug': item.slug})
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.excerpt
+
+    def item_pubdate(self, item):
+        return item.published_at
+
+    def item_author_name(self, item):
+        if item.author:
+            return item.author.get_full_name() or item.author.username
+
+    def item_categories(self, item):
+        return [item.get_category_display()]
+
+
+class AtomNewsFeed(NewsFeed):
+    feed_type = Atom1Feed
+    subtitle = NewsFeed.description
@@ -0,0 +1,25 @@
+"""
+Full-text search over news articles for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        create_search_index('news_news', {
+            'title': 'A',
+            'excerpt': 'B',
+            'content': 'C',
+        }, 'news_news'),
+    ]
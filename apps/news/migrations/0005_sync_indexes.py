@@ -0,0 +1,19 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_view_counts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['updated_at', 'id'], name='news_updated_idx'),
+        ),
+    ]
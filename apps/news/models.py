@@ -4,12 +4,22 @@ News app models.
 
 from django.db import models
 from django.contrib.auth.models import User
-from django.utils.text import slugify
 from django.utils import timezone
-from apps.core.models import TimeStampedModel
+from apps.core import derived
+from apps.core.models import DerivedFieldsModel, TimeStampedModel, UniqueSlugModel
+from apps.core.querycache import CachingQuerySet
 
 
-class News(TimeStampedModel):
+class NewsQuerySet(CachingQuerySet):
+    def cards(self):
+        """Only the columns news cards and listings render."""
+        return self.only(
+            'title', 'slug', 'category', 'excerpt', 'featured_image', 'first_image_url',
+            'published_at', 'is_pinned', 'is_featured',
+        )
+
+
+class News(UniqueSlugModel, DerivedFieldsModel, TimeStampedModel):
     """News and announcements."""
 
     class Category(models.TextChoices):
@@ -48,8 +58,32 @@ class News(TimeStampedModel):
     meta_title = models.CharField(max_length=70, blank=True)
     meta_description = models.TextField(max_length=160, blank=True)
 
+    views = models.PositiveIntegerField(default=0, editable=False)
+
+    # Derived from content on save
+    plain_text = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False, help_text="Minutes")
+    first_image_url = models.CharField(max_length=500, blank=True, editable=False)
+
+    slug_from = ('title',)
+
+    search_fields = {'title': 'A', 'excerpt': 'B', 'content': 'C'}
+
+    derived_fields = {
+        'plain_text': ['content'],
+        'word_count': ['content'],
+        'reading_time': ['content'],
+        'first_image_url': ['content'],
+    }
+
+    objects = NewsQuerySet.as_manager()
+
     class Meta:
         ordering = ['-is_pinned', '-published_at']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='news_updated_idx'),
+        ]
         verbose_name = "News"
         verbose_name_plural = "News"
 
@@ -57,8 +91,12 @@ class News(TimeStampedModel):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
         if self.status == self.Status.PUBLISHED and not self.published_at:
             self.published_at = timezone.now()
         super().save(*args, **kwargs)
+
+    def compute_derived_fields(self):
+        self.plain_text = derived.plain_text(self.content)
+        self.word_count = derived.word_count(self.plain_text)
+        self.reading_time = derived.reading_time(self.word_count)
+        self.first_image_url = derived.first_image_url(self.content)
@@ -3,11 +3,13 @@ News app frontend URLs.
 """
 
 from django.urls import path
-from . import views
+from . import feeds, views
 
 app_name = 'news'
 
 urlpatterns = [
+    path('feed/', feeds.NewsFeed(), name='feed'),
+    path('feed/atom/', feeds.AtomNewsFeed(), name='feed_atom'),
     path('', views.NewsListView.as_view(), name='list'),
     path('<slug:slug>/', views.NewsDetailView.as_view(), name='detail'),
 ]
@@ -3,6 +3,9 @@ News app frontend views.
 """
 
 from django.views.generic import ListView, DetailView
+
+from apps.analytics.pageviews import PageViewMixin
+from apps.core.related import related_to
 from .models import News
 
 
@@ -14,10 +17,10 @@ class NewsListView(ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        return News.objects.filter(status='published').order_by('-published_at')
+        return News.objects.filter(status='published').cards().order_by('-published_at')
 
 
-class NewsDetailView(DetailView):
+class NewsDetailView(PageViewMixin, DetailView):
     """Public news detail page."""
     model = News
     template_name = 'frontend/news/detail.html'
@@ -29,7 +32,5 @@ class NewsDetailView(DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['related_news'] = News.objects.filter(
-            status='published'
-        ).exclude(pk=self.object.pk)[:3]
+        context['related_news'] = related_to('news', self.object)
         return context
@@ -3,6 +3,8 @@ Programs app forms.
 """
 
 from django import forms
+
+from apps.core.autocomplete import AutocompleteSelect
 from .models import Program, Batch
 
 
@@ -48,11 +50,11 @@ class BatchForm(forms.ModelForm):
             'start_date', 'status'
         ]
         widgets = {
-            'program': forms.Select(attrs={'class': 'form-select'}),
+            'program': AutocompleteSelect('programs'),
             'name': forms.TextInput(attrs={'class': 'form-input'}),
             'schedule': forms.TextInput(attrs={'class': 'form-input', 'placeholder': 'e.g., Mon, Wed, Fri 4-6 PM'}),
             'venue': forms.TextInput(attrs={'class': 'form-input'}),
-            'coach': forms.Select(attrs={'class': 'form-select'}),
+            'coach': AutocompleteSelect('coaches'),
             'max_capacity': forms.NumberInput(attrs={'class': 'form-input'}),
             'current_strength': forms.NumberInput(attrs={'class': 'form-input'}),
             'start_date': forms.DateInput(attrs={'class': 'form-input', 'type': 'date'}),
@@ -0,0 +1,38 @@
+"""
+Case-insensitive prefix indexes for the admin autocomplete endpoint.
+
+``istartswith`` compiles to ``UPPER(col) LIKE UPPER(%s)`` on PostgreSQL and to
+a case-insensitive ``LIKE`` on SQLite, so each backend needs its own index.
+"""
+
+from django.db import migrations
+
+from apps.core.db import run_vendor_sql
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0001_initial'),
+    ]
+
+    operations = [
+        run_vendor_sql(
+            forward={
+                'postgresql': [
+                    'CREATE INDEX programs_name_prefix_idx ON programs_program (UPPER("name"::text) text_pattern_ops)',
+                ],
+                'sqlite': [
+                    'CREATE INDEX programs_name_prefix_idx ON programs_program ("name" COLLATE NOCASE)',
+                ],
+            },
+            reverse={
+                'postgresql': [
+                    'DROP INDEX programs_name_prefix_idx',
+                ],
+                'sqlite': [
+                    'DROP INDEX programs_name_prefix_idx',
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+"""
+Full-text search over programs for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0002_autocomplete_indexes'),
+    ]
+
+    operations = [
+        create_search_index('programs_program', {
+            'name': 'A',
+            'short_description': 'B',
+            'description': 'C',
+        }, 'programs_program'),
+    ]
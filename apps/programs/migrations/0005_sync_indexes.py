@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0004_view_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='program',
+            index=models.Index(fields=['updated_at', 'id'], name='programs_updated_idx'),
+        ),
+    ]
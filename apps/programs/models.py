@@ -3,11 +3,21 @@ Programs app models.
 """
 
 from django.db import models
-from django.utils.text import slugify
-from apps.core.models import TimeStampedModel
+from apps.core import derived
+from apps.core.models import TimeStampedModel, UniqueSlugModel
+from apps.core.querycache import CachingQuerySet
 
 
-class Program(TimeStampedModel):
+class ProgramQuerySet(CachingQuerySet):
+    def cards(self):
+        """Only the columns program cards and listings render."""
+        return self.only(
+            'name', 'slug', 'short_description', 'image', 'age_group', 'duration', 'sessions_per_week',
+            'fee_amount', 'fee_period', 'is_featured',
+        ).annotate(card_summary=derived.summary('short_description', 'description'))
+
+
+class Program(UniqueSlugModel, TimeStampedModel):
     """Sports program/course."""
 
     class Status(models.TextChoices):
@@ -41,19 +51,25 @@ class Program(TimeStampedModel):
     meta_title = models.CharField(max_length=70, blank=True)
     meta_description = models.TextField(max_length=160, blank=True)
 
+    views = models.PositiveIntegerField(default=0, editable=False)
+
+    slug_from = ('name',)
+
+    search_fields = {'name': 'A', 'short_description': 'B', 'description': 'C'}
+
+    objects = ProgramQuerySet.as_manager()
+
     class Meta:
         ordering = ['display_order', 'name']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='programs_updated_idx'),
+        ]
         verbose_name = "Program"
         verbose_name_plural = "Programs"
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
-
 
 class Batch(TimeStampedModel):
     """Training batch for a program."""
@@ -2,7 +2,12 @@
 Programs app frontend views.
 """
 
+from django.http import Http404
 from django.views.generic import ListView, DetailView
+
+from apps.analytics.pageviews import PageViewMixin
+from apps.core import catalog
+from apps.core.related import related_to
 from .models import Program, Batch
 
 
@@ -14,26 +19,27 @@ class ProgramListView(ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        return Program.objects.filter(status='active').order_by('display_order', 'name')
+        return Program.objects.filter(status='active').cards().order_by('display_order', 'name')
 
 
-class ProgramDetailView(DetailView):
+class ProgramDetailView(PageViewMixin, DetailView):
     """Public program detail page."""
     model = Program
     template_name = 'frontend/programs/detail.html'
     context_object_name = 'program'
     slug_url_kwarg = 'slug'
 
-    def get_queryset(self):
-        return Program.objects.filter(status='active')
+    def get_object(self, queryset=None):
+        program = catalog.get(Program, slug=self.kwargs['slug'], status='active')
+        if program is None:
+            raise Http404('No program found matching the query')
+        return program
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['batches'] = Batch.objects.filter(
+        context['batches'] = Batch.objects.cached().filter(
             program=self.object,
             status='active'
         ).order_by('name')
-        context['related_programs'] = Program.objects.filter(
-            status='active'
-        ).exclude(pk=self.object.pk)[:3]
+        context['related_programs'] = related_to('programs', self.object)
         return context
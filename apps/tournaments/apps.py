@@ -5,3 +5,7 @@ class TournamentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.tournaments'
     verbose_name = 'Tournaments'
+
+    def ready(self):
+        from . import feeds
+        feeds.TournamentResultsFeed.connect()
@@ -0,0 +1,62 @@
+"""
+Tournaments app RSS/Atom feeds.
+"""
+
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+
+from apps.core.feeds import FEED_LENGTH, CachedFeed
+from .models import Match, Team, Tournament
+
+
+class TournamentResultsFeed(CachedFeed):
+    """Completed match results of one tournament, latest first."""
+    cache_name = 'results-feed'
+    models = [Tournament, Match, Team]
+
+    def get_object(self, request, slug):
+        return get_object_or_404(Tournament.objects.exclude(status='draft'), slug=slug)
+
+    def title(self, obj):
+        return f'{obj.name} Results'
+
+    def description(self, obj):
+        return f'Full-time results from {obj.name}.'
+
+    def link(self, obj):
+        return reverse('tournaments:detail', kwargs={'slug': obj.slug})
+
+    def items(self, obj):
+        return (
+            obj.matches.filter(status='completed')
+            .select_related('tournament', 'home_team', 'away_team')
+            .order_by('-match_date', '-match_time')[:FEED_LENGTH]
+        )
+
+    def item_title(self, item):
+        return f'{item.home_team.name} {item.home_score} - {item.away_score} {item.away_team.name}'
+
+    def item_description(self, item):
+        parts = [item.get_match_type_display()]
+        if item.group_name:
+            parts.append(item.group_name)
+        parts.append(f'{item.match_date:%d %b %Y}')
+        if item.venue:
+            parts.append(item.venue)
+        if item.home_score_penalties is not None and item.away_score_penalties is not None:
+            parts.append(f'Penalties {item.home_score_penalties} - {item.away_score_penalties}')
+        return ' · '.join(parts)
+
+    def item_link(self, item):
+        return reverse('tournaments:detail', kwargs={'slug': item.tournament.slug}) + f'#match-{item.pk}'
+
+    def item_pubdate(self, item):
+        return item.updated_at
+
+
+class AtomTournamentResultsFeed(TournamentResultsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
@@ -3,6 +3,8 @@ Tournaments app forms.
 """
 
 from django import forms
+
+from apps.core.autocomplete import AutocompleteSelect
 from .models import Tournament, Team, Match
 
 
@@ -74,9 +76,9 @@ class MatchForm(forms.ModelForm):
             'is_featured', 'show_on_homepage'
         ]
         widgets = {
-            'tournament': forms.Select(attrs={'class': 'form-select'}),
-            'home_team': forms.Select(attrs={'class': 'form-select'}),
-            'away_team': forms.Select(attrs={'class': 'form-select'}),
+            'tournament': AutocompleteSelect('tournaments'),
+            'home_team': AutocompleteSelect('teams'),
+            'away_team': AutocompleteSelect('teams'),
             'match_type': forms.Select(attrs={'class': 'form-select'}),
             'match_number': forms.NumberInput(attrs={'class': 'form-input'}),
             'group_name': forms.TextInput(attrs={'class': 'form-input', 'placeholder': 'e.g., Group A'}),
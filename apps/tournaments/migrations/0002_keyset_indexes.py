@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['match_date', 'id'], name='tournaments_match_date_idx'),
+        ),
+    ]
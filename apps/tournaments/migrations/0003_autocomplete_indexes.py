@@ -0,0 +1,46 @@
+"""
+Case-insensitive prefix indexes for the admin autocomplete endpoint.
+
+``istartswith`` compiles to ``UPPER(col) LIKE UPPER(%s)`` on PostgreSQL and to
+a case-insensitive ``LIKE`` on SQLite, so each backend needs its own index.
+"""
+
+from django.db import migrations
+
+from apps.core.db import run_vendor_sql
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0002_keyset_indexes'),
+    ]
+
+    operations = [
+        run_vendor_sql(
+            forward={
+                'postgresql': [
+                    'CREATE INDEX tournaments_name_prefix_idx ON tournaments_tournament (UPPER("name"::text) text_pattern_ops)',
+                    'CREATE INDEX tournaments_team_name_prefix_idx ON tournaments_team (UPPER("name"::text) text_pattern_ops)',
+                    'CREATE INDEX tournaments_team_short_prefix_idx ON tournaments_team (UPPER("short_name"::text) text_pattern_ops)',
+                ],
+                'sqlite': [
+                    'CREATE INDEX tournaments_name_prefix_idx ON tournaments_tournament ("name" COLLATE NOCASE)',
+                    'CREATE INDEX tournaments_team_name_prefix_idx ON tournaments_team ("name" COLLATE NOCASE)',
+                    'CREATE INDEX tournaments_team_short_prefix_idx ON tournaments_team ("short_name" COLLATE NOCASE)',
+                ],
+            },
+            reverse={
+                'postgresql': [
+                    'DROP INDEX tournaments_name_prefix_idx',
+                    'DROP INDEX tournaments_team_name_prefix_idx',
+                    'DROP INDEX tournaments_team_short_prefix_idx',
+                ],
+                'sqlite': [
+                    'DROP INDEX tournaments_name_prefix_idx',
+                    'DROP INDEX tournaments_team_name_prefix_idx',
+                    'DROP INDEX tournaments_team_short_prefix_idx',
+                ],
+            },
+        ),
+    ]
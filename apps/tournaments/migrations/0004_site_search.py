@@ -0,0 +1,27 @@
+"""
+Full-text search over tournaments for the public site search.
+
+PostgreSQL keeps generated tsvector/text columns with GIN and trigram
+indexes; SQLite gets an FTS5 table that ``apps.core.search`` keeps in sync.
+"""
+
+from django.db import migrations
+
+from apps.core.db import create_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournaments', '0003_autocomplete_indexes'),
+    ]
+
+    operations = [
+        create_search_index('tournaments_tournament', {
+            'name': 'A',
+            'short_description': 'B',
+            'venue': 'C',
+            'organizer': 'C',
+            'description': 'C',
+        }, 'tournaments_tour'),
+    ]
@@ -3,11 +3,10 @@ Tournaments app models - Tournament, Team, and Match with scorecards.
 """
 
 from django.db import models
-from django.utils.text import slugify
-from apps.core.models import TimeStampedModel
+from apps.core.models import TimeStampedModel, UniqueSlugModel
 
 
-class Tournament(TimeStampedModel):
+class Tournament(UniqueSlugModel, TimeStampedModel):
     """Tournament model for organizing football tournaments."""
 
     class Status(models.TextChoices):
@@ -53,19 +52,27 @@ class Tournament(TimeStampedModel):
     meta_title = models.CharField(max_length=70, blank=True)
     meta_description = models.TextField(max_length=160, blank=True)
 
+    slug_from = ('name',)
+
+    search_fields = {
+        'name': 'A',
+        'short_description': 'B',
+        'venue': 'C',
+        'organizer': 'C',
+        'description': 'C',
+    }
+
     class Meta:
         ordering = ['-is_major', '-start_date']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='tournaments_updated_idx'),
+        ]
         verbose_name = "Tournament"
         verbose_name_plural = "Tournaments"
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
-
     @property
     def match_count(self):
         return self.matches.count()
@@ -75,7 +82,7 @@ class Tournament(TimeStampedModel):
         return self.matches.filter(status='completed').count()
 
 
-class Team(TimeStampedModel):
+class Team(UniqueSlugModel, TimeStampedModel):
     """Team model for tournament participants."""
 
     name = models.CharField(max_length=200)
@@ -91,6 +98,8 @@ class Team(TimeStampedModel):
     # Display
     is_active = models.BooleanField(default=True)
 
+    slug_from = ('name',)
+
     class Meta:
         ordering = ['name']
         verbose_name = "Team"
@@ -100,8 +109,6 @@ class Team(TimeStampedModel):
         return self.name
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.name)
         if not self.short_name:
             self.short_name = self.name[:3].upper()
         super().save(*args, **kwargs)
@@ -180,6 +187,10 @@ class Match(TimeStampedModel):
 
     class Meta:
         ordering = ['-match_date', '-match_time']
+        indexes = [
+            models.Index(fields=['match_date', 'id'], name='tournaments_match_date_idx'),
+            models.Index(fields=['updated_at', 'id'], name='tournaments_match_updated_idx'),
+        ]
         verbose_name = "Match"
         verbose_name_plural = "Matches"
 
@@ -3,11 +3,13 @@ Tournaments app frontend URLs.
 """
 
 from django.urls import path
-from . import views
+from . import feeds, views
 
 app_name = 'tournaments'
 
 urlpatterns = [
     path('', views.TournamentListView.as_view(), name='list'),
     path('<slug:slug>/', views.TournamentDetailView.as_view(), name='detail'),
+    path('<slug:slug>/results/feed/', feeds.TournamentResultsFeed(), name='results_feed'),
+    path('<slug:slug>/results/feed/atom/', feeds.AtomTournamentResultsFeed(), name='results_feed_atom'),
 ]
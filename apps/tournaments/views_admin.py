@@ -2,11 +2,16 @@
 Tournaments app admin dashboard views.
 """
 
+from datetime import time
+
+from django.db.models import Value
+from django.db.models.functions import Coalesce
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.urls import reverse_lazy
 from django.contrib import messages
 
 from apps.accounts.decorators import AdminRequiredMixin
+from apps.core.pagination import KeysetPaginationMixin
 from .models import Tournament, Team, Match
 from .forms import TournamentForm, TeamForm, MatchForm
 
@@ -106,15 +111,22 @@ class TeamDeleteView(AdminRequiredMixin, DeleteView):
 
 
 # Match Views
-class MatchListView(AdminRequiredMixin, ListView):
+class MatchListView(AdminRequiredMixin, KeysetPaginationMixin, ListView):
     """Admin match listing."""
     model = Match
     template_name = 'admin_dashboard/tournaments/matches/list.html'
     context_object_name = 'matches'
     paginate_by = 20
+    # Kick-off time breaks ties within a day; matches without one sort as
+    # midnight, so cursors never compare against NULL.
+    keyset_ordering = ('-match_date', '-kickoff', '-id')
 
     def get_queryset(self):
-        return Match.objects.all().select_related('tournament', 'home_team', 'away_team').order_by('-match_date')
+        return (
+            Match.objects.all()
+            .select_related('tournament', 'home_team', 'away_team')
+            .annotate(kickoff=Coalesce('match_time', Value(time.min)))
+        )
 
 
 class MatchCreateView(AdminRequiredMixin, CreateView):
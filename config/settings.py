@@ -3,6 +3,7 @@ Django settings for AIFA Sports Academy project.
 """
 
 import os
+import tempfile
 from pathlib import Path
 from dotenv import load_dotenv
 import dj_database_url
@@ -59,6 +60,8 @@ INSTALLED_APPS = [
     'apps.accreditations',
     'apps.facilities',
     'apps.tournaments',
+    'apps.analytics',
+    'apps.archive',
 ]
 
 MIDDLEWARE = [
@@ -70,6 +73,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.core.versions.ContentVersionMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -91,6 +95,7 @@ TEMPLATES = [
                 'apps.core.context_processors.site_settings',
                 'apps.core.context_processors.page_content',
                 'apps.core.context_processors.navigation',
+                'apps.core.context_processors.content_versions',
             ],
         },
     },
@@ -122,6 +127,24 @@ else:
     }
 
 
+# Cache
+# One SQLite file shared by all workers on this host (apps.core.sqlite_cache);
+# least recently used entries are evicted past CACHE_MAX_BYTES.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'apps.core.sqlite_cache.SQLiteCache',
+        'LOCATION': os.getenv('CACHE_PATH', os.path.join(tempfile.gettempdir(), 'aifa-cache.sqlite3')),
+        'OPTIONS': {
+            'MAX_BYTES': int(os.getenv('CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+        },
+    }
+}
+
+# Tests get a cache file of their own for each run (config.test_runner).
+TEST_RUNNER = 'config.test_runner.TestRunner'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -174,6 +197,69 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Cold storage for old submissions (see apps.archive). Archiving deletes the
+# rows it moves, so this must be durable storage (a mounted volume on
+# Railway); there is no default, and archiving refuses to run while it is
+# unset or inside BASE_DIR, which is replaced on every deploy. Keep it
+# outside MEDIA_ROOT too: archived rows contain personal data and must not
+# be served.
+ARCHIVE_ROOT = os.getenv('ARCHIVE_ROOT', '')
+ARCHIVE_AFTER_DAYS = {
+    'events.EventRegistration': int(os.getenv('ARCHIVE_REGISTRATIONS_AFTER_DAYS', 365)),
+    'contact.ContactMessage': int(os.getenv('ARCHIVE_MESSAGES_AFTER_DAYS', 180)),
+    'contact.Inquiry': int(os.getenv('ARCHIVE_INQUIRIES_AFTER_DAYS', 365)),
+}
+
+# Each worker rebuilds its in-memory search suggestions after this many
+# seconds, as a backstop to the invalidation bus below.
+TYPEAHEAD_MAX_AGE = int(os.getenv('TYPEAHEAD_MAX_AGE', 300))
+
+# XML sitemaps: URLs per sitemap page, and how long rendered sitemaps are
+# cached (they are also dropped whenever their content changes).
+SITEMAP_PAGE_SIZE = int(os.getenv('SITEMAP_PAGE_SIZE', 10000))
+SITEMAP_CACHE_TIMEOUT = int(os.getenv('SITEMAP_CACHE_TIMEOUT', 60 * 60 * 24))
+
+# RSS/Atom feeds are cached until their content changes, and at most this
+# long (bulk updates that bypass model signals show up after it).
+FEED_CACHE_TIMEOUT = int(os.getenv('FEED_CACHE_TIMEOUT', 60 * 60))
+
+# Page views are buffered per worker and written every PAGE_VIEW_FLUSH_SECONDS;
+# a visitor is counted once per page per PAGE_VIEW_DEDUPE_SECONDS.
+PAGE_VIEW_FLUSH_SECONDS = int(os.getenv('PAGE_VIEW_FLUSH_SECONDS', 30))
+PAGE_VIEW_DEDUPE_SECONDS = int(os.getenv('PAGE_VIEW_DEDUPE_SECONDS', 60 * 30))
+
+# Number of proxies in front of the app that append the client address to
+# X-Forwarded-For (e.g. 1 behind a single load balancer). With 0 the header
+# is ignored and visitors are told apart by REMOTE_ADDR, since clients can
+# send any X-Forwarded-For they like. The Railway start commands (start.sh,
+# railway.json, nixpacks.toml) default it to 1 for Railway's edge proxy.
+PAGE_VIEW_TRUSTED_PROXIES = int(os.getenv('PAGE_VIEW_TRUSTED_PROXIES', 0))
+
+# JSON API responses are cached server-side until their content changes (and
+# at most API_CACHE_TIMEOUT); clients and proxies may reuse them for API_MAX_AGE.
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', 60 * 60))
+API_MAX_AGE = int(os.getenv('API_MAX_AGE', 60))
+
+# Delta sync: changes newer than SYNC_SETTLE_SECONDS wait for the next request
+# (so rows of still-open transactions are not skipped); deletions are kept, and
+# sync cursors accepted, for SYNC_TOMBSTONE_DAYS.
+SYNC_SETTLE_SECONDS = int(os.getenv('SYNC_SETTLE_SECONDS', 2))
+SYNC_TOMBSTONE_DAYS = int(os.getenv('SYNC_TOMBSTONE_DAYS', 90))
+
+# Admin notifications older than this are deleted by prune_notifications.
+NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', 30))
+
+# Invalidation bus: how often each worker checks the content version ledger
+# for changes made by other workers. On PostgreSQL changes arrive at once
+# through LISTEN/NOTIFY and this poll is only a safety net.
+INVALIDATION_POLL_INTERVAL = float(os.getenv('INVALIDATION_POLL_INTERVAL', 5))
+
+# Query result cache (QuerySet.cached()): entries are keyed on content
+# versions, so the timeout only bounds how long unused ones stay; results
+# pickling to more than QUERY_CACHE_MAX_ENTRY_BYTES are not cached.
+QUERY_CACHE_TIMEOUT = int(os.getenv('QUERY_CACHE_TIMEOUT', 3600))
+QUERY_CACHE_MAX_ENTRY_BYTES = int(os.getenv('QUERY_CACHE_MAX_ENTRY_BYTES', 1024 * 1024))
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
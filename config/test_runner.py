@@ -0,0 +1,34 @@
+"""
+Test runner that gives each test run a cache of its own.
+
+The default cache is a SQLite file in the system temp directory, shared by
+every process on the host. Tests would otherwise read and write the same
+file as the development server and earlier runs (dashboard stats, counts,
+notification versions, page-view dedupe keys). The runner points it at a
+fresh file in a temporary directory, removed when the run ends; the backend
+itself is unchanged, so tests exercise the one used in production.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._cache_dir = tempfile.mkdtemp(prefix='aifa-test-cache-')
+        caches = {alias: dict(config) for alias, config in settings.CACHES.items()}
+        caches['default']['LOCATION'] = str(Path(self._cache_dir) / 'cache.sqlite3')
+        self._cache_override = override_settings(CACHES=caches)
+        self._cache_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._cache_override.disable()
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
@@ -35,6 +35,9 @@ urlpatterns = [
     path('accreditations/', include('apps.accreditations.urls', namespace='accreditations')),
     path('facilities/', include('apps.facilities.urls', namespace='facilities')),
     path('tournaments/', include('apps.tournaments.urls', namespace='tournaments')),
+
+    # Public JSON API (read-only)
+    path('api/v1/', include('apps.core.urls_api', namespace='api')),
 ]
 
 # Serve media files (both development and production)
@@ -1324,6 +1324,81 @@ const initGallery = () => {
 // Initialize gallery on DOM ready
 document.addEventListener('DOMContentLoaded', initGallery);
 
+// ==========================================================================
+// SEARCH SUGGESTIONS
+// ==========================================================================
+
+const initSearchSuggestions = () => {
+    const input = $('[data-suggest-url]');
+    if (!input) return;
+
+    const list = input.parentElement.querySelector('.search-suggestions');
+    let active = -1;
+    let lastQuery = '';
+
+    const close = () => {
+        list.hidden = true;
+        list.innerHTML = '';
+        active = -1;
+    };
+
+    const render = (suggestions) => {
+        list.innerHTML = '';
+        suggestions.forEach((item) => {
+            const li = document.createElement('li');
+            const link = document.createElement('a');
+            link.href = item.url;
+            link.textContent = item.label;
+            const type = document.createElement('span');
+            type.textContent = item.type;
+            link.appendChild(type);
+            li.appendChild(link);
+            list.appendChild(li);
+        });
+        active = -1;
+        list.hidden = suggestions.length === 0;
+    };
+
+    const fetchSuggestions = debounce(() => {
+        const query = input.value.trim();
+        if (query === lastQuery) return;
+        lastQuery = query;
+        if (!query) {
+            close();
+            return;
+        }
+        fetch(`${input.dataset.suggestUrl}?q=${encodeURIComponent(query)}`)
+            .then((response) => response.json())
+            .then((data) => {
+                if (data.query === input.value.trim()) render(data.suggestions);
+            })
+            .catch(close);
+    }, 80);
+
+    input.addEventListener('input', fetchSuggestions);
+
+    input.addEventListener('keydown', (e) => {
+        const links = list.querySelectorAll('a');
+        if (list.hidden || !links.length) return;
+        if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+            e.preventDefault();
+            active = (active + (e.key === 'ArrowDown' ? 1 : -1) + links.length) % links.length;
+            links.forEach((link, i) => link.classList.toggle('active', i === active));
+        } else if (e.key === 'Enter' && active >= 0) {
+            e.preventDefault();
+            window.location.href = links[active].href;
+        } else if (e.key === 'Escape') {
+            close();
+        }
+    });
+
+    document.addEventListener('click', (e) => {
+        if (!input.parentElement.contains(e.target)) close();
+    });
+};
+
+document.addEventListener('DOMContentLoaded', initSearchSuggestions);
+
 // ==========================================================================
 // EXPORT FOR MODULE USE
 // ==========================================================================
@@ -0,0 +1,23 @@
+"""
+Gunicorn settings, read from the working directory by ``gunicorn config.wsgi``.
+"""
+
+
+def post_worker_init(worker):
+    """
+    Start a worker's background work once its application is loaded.
+
+    Runs in each worker after the fork, so the threads belong to the process
+    serving requests even with ``--preload``, and importing ``config.wsgi``
+    (tests, tooling) starts nothing. The invalidation bus listens for content
+    changed by other workers, page views are written on a timer, and the
+    in-memory catalog and search suggestions are built before the first
+    request.
+    """
+    from apps.analytics import pageviews
+    from apps.core import catalog, invalidation, typeahead
+
+    invalidation.start()
+    pageviews.start()
+    catalog.warm()
+    typeahead.warm()
@@ -0,0 +1,14 @@
+#!/bin/bash
+# Release steps run before the web server starts, by start.sh (Procfile) and
+# the Railway/Nixpacks start commands.
+set -e
+
+echo "Running migrations..."
+python manage.py migrate --noinput
+
+echo "Computing related content..."
+# Incremental; a failure only leaves related links stale, so don't block startup.
+python manage.py compute_related || echo "compute_related failed; related links left as they were"
+
+echo "Collecting static files..."
+python manage.py collectstatic --noinput
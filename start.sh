@@ -1,14 +1,12 @@
 #!/bin/bash
 set -e
 
-echo "Running migrations..."
-python manage.py migrate --noinput
-
-echo "Collecting static files..."
-python manage.py collectstatic --noinput
+bash release.sh
 
 echo "Creating admin superuser..."
 python manage.py create_admin
 
 echo "Starting Gunicorn..."
+# Railway's edge proxy appends the client address to X-Forwarded-For.
+export PAGE_VIEW_TRUSTED_PROXIES=${PAGE_VIEW_TRUSTED_PROXIES:-1}
 exec gunicorn config.wsgi --bind 0.0.0.0:${PORT:-8000} --log-file -